@@ -0,0 +1,47 @@
+"""
+Migration script to add the (event_date, start_time, id) index on meetings.
+The home page lazy loader pages through upcoming meetings in this order.
+
+Usage:
+    python add_meeting_keyset_index.py
+"""
+
+from app import app, db
+from sqlalchemy import text
+
+INDEX_NAME = "ix_meetings_date_time_id"
+
+
+def add_meeting_keyset_index():
+    """Create the keyset pagination index if it doesn't exist."""
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+
+        if 'meetings' not in inspector.get_table_names():
+            print("❌ Meetings table not found!")
+            return False
+
+        existing = [ix['name'] for ix in inspector.get_indexes('meetings')]
+        if INDEX_NAME in existing:
+            print(f"✅ {INDEX_NAME} already exists!")
+            return True
+
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(text(
+                    f"CREATE INDEX {INDEX_NAME} ON meetings(event_date, start_time, id)"
+                ))
+                conn.commit()
+            print(f"✅ Successfully created {INDEX_NAME}!")
+            return True
+        except Exception as e:
+            print(f"❌ Error creating {INDEX_NAME}: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    print("🔧 Adding meetings keyset index...")
+    print("=" * 50)
+    success = add_meeting_keyset_index()
+    print("=" * 50)
+    print("✅ Migration complete!" if success else "❌ Migration failed!")
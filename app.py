@@ -1,5 +1,6 @@
 from datetime import datetime, date, timedelta
 from functools import wraps
+from collections import defaultdict
 import json
 import os
 import hashlib
@@ -11,11 +12,15 @@ import time
 
 from flask import (
     Flask, render_template, redirect, url_for,
-    request, flash, session, make_response, jsonify, abort, g, Response
+    request, flash, session, make_response, jsonify, abort, g, Response,
+    has_request_context, stream_with_context
 )
 from flask import send_from_directory
+import click
+from flask.sessions import SecureCookieSessionInterface
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import func, or_
+from sqlalchemy import event, func, or_, and_, case, literal_column
+from sqlalchemy.exc import IntegrityError
 from flask_wtf import FlaskForm
 from flask_mail import Mail, Message
 from wtforms import (
@@ -27,14 +32,17 @@ from wtforms.validators import (
 )
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
-from icalendar import Calendar, Event, Alarm
+from icalendar import Calendar
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
 import calendar
-from io import BytesIO
+import csv
+import zipfile
+from io import BytesIO, StringIO
 import subprocess
 import tempfile
+import atexit
 from urllib.parse import quote
 
 # ReportLab depends on Pillow for some functionality; keep PDF/certificate features optional
@@ -77,6 +85,13 @@ except ImportError:
 load_dotenv()
 
 from config import Config
+from audit_writer import AuditWriter
+from certificate_renderer import CertificateExportPool, CertificateRenderer
+from dashboard_stats import compute_admin_dashboard
+from image_pipeline import FORMATS as IMAGE_VARIANT_FORMATS, ImagePipeline, pick_variant_size, preferred_format, render_variants
+from rate_limiter import MemoryBackend, RateLimiter, RedisBackend
+from sql_compat import at_time, days_between, hour_of, weekday_of, whole_days_between
+from ics_engine import CALENDAR_FOOTER, FragmentCache, calendar_header, render_calendar, render_event
 
 app = Flask(__name__)
 app.config.from_object(Config)
@@ -85,27 +100,28 @@ mail = Mail(app)
 
 # Configure caching
 if CACHE_AVAILABLE:
+    # tiered_cache.TieredCache: per-process LRU in front of Redis (or on its own),
+    # with single-flight rebuilds for cached_value()
+    cache_config = {
+        'CACHE_TYPE': 'tiered_cache.TieredCache',
+        'CACHE_DEFAULT_TIMEOUT': 300,  # 5 minutes default
+        'CACHE_LOCAL_MAX_ENTRIES': app.config.get('CACHE_LOCAL_MAX_ENTRIES', 2000),
+        'CACHE_LOCAL_TTL': app.config.get('CACHE_LOCAL_TTL', 5),
+        'CACHE_LOCK_TIMEOUT': app.config.get('CACHE_LOCK_TIMEOUT', 30),
+        'CACHE_LOCK_WAIT': app.config.get('CACHE_LOCK_WAIT', 5),
+        'CACHE_EARLY_REFRESH_BETA': app.config.get('CACHE_EARLY_REFRESH_BETA', 1.0),
+    }
     if REDIS_AVAILABLE and os.getenv('REDIS_URL'):
-        # Use Redis for caching in production when REDIS_URL is set
+        # Use Redis behind the local tier in production when REDIS_URL is set
         try:
-            cache = Cache(app, config={
-                'CACHE_TYPE': 'RedisCache',
-                'CACHE_REDIS_URL': os.getenv('REDIS_URL'),
-                'CACHE_DEFAULT_TIMEOUT': 300  # 5 minutes default
-            })
-            print("✓ Using Redis cache")
+            cache = Cache(app, config=dict(cache_config, CACHE_REDIS_URL=os.getenv('REDIS_URL')))
+            print("✓ Using Redis cache with in-process LRU")
         except Exception as e:
-            print(f"⚠ Redis connection failed, falling back to SimpleCache: {e}")
-            cache = Cache(app, config={
-                'CACHE_TYPE': 'SimpleCache',
-                'CACHE_DEFAULT_TIMEOUT': 300
-            })
+            print(f"⚠ Redis connection failed, falling back to in-process cache: {e}")
+            cache = Cache(app, config=cache_config)
     else:
-        # Fallback to simple cache (no Redis available or configured)
-        cache = Cache(app, config={
-            'CACHE_TYPE': 'SimpleCache',
-            'CACHE_DEFAULT_TIMEOUT': 300
-        })
+        # In-process cache only (no Redis available or configured)
+        cache = Cache(app, config=cache_config)
 else:
     # No caching available - create a dummy cache object
     class DummyCache:
@@ -121,6 +137,18 @@ else:
                 return f
             return decorator
         
+        def get(self, key):
+            return None
+
+        def set(self, key, value, timeout=None):
+            return False
+
+        def delete(self, key):
+            return False
+
+        def delete_memoized(self, f, *args, **kwargs):
+            pass
+
         def clear(self):
             pass
     
@@ -154,12 +182,33 @@ def after_request(response):
     
     return response
 
+class AppSessionInterface(SecureCookieSessionInterface):
+    """Default cookie sessions, except views can opt out of refreshing the cookie.
+
+    Publicly cacheable responses (profile/sponsor images) set g.skip_session_cookie
+    so a logged-in visitor's session cookie is never stored alongside them.
+    """
+
+    def should_set_cookie(self, app, session):
+        if g.get("skip_session_cookie"):
+            return False
+        return super().should_set_cookie(app, session)
+
+
+app.session_interface = AppSessionInterface()
+
+
 # Expose a simple asset version for cache-busting static resources
 @app.context_processor
 def inject_asset_version():
     ver = os.environ.get("ASSET_VERSION", "20251206")
     return {"asset_version": ver}
 
+
+@app.context_processor
+def inject_image_urls():
+    return {"profile_image_url": profile_image_url, "sponsor_image_url": sponsor_image_url}
+
 # Only start scheduler in development/local environment
 # On Heroku, this runs in a separate worker process
 if os.getenv('FLASK_ENV') != 'production':
@@ -180,6 +229,16 @@ def get_eastern_today():
     """Get current date in Eastern Time (not UTC)."""
     return get_eastern_now().date()
 
+def eastern_to_utc(day, clock):
+    """Naive UTC datetime for an Eastern wall-clock date and time (how meetings are entered)."""
+    return datetime.combine(day, clock, tzinfo=EASTERN_TZ).astimezone(timezone.utc).replace(tzinfo=None)
+
+def eastern_days_to_utc(first_day, last_day=None):
+    """Half-open naive UTC range [start, end) covering Eastern dates first_day..last_day."""
+    last_day = last_day or first_day
+    return (eastern_to_utc(first_day, datetime.min.time()),
+            eastern_to_utc(last_day + timedelta(days=1), datetime.min.time()))
+
 
 # ==========================
 # AUTH / PASSWORD HELPERS
@@ -316,6 +375,22 @@ MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
 def allowed_file(filename):
     """Check if file extension is allowed for profile images."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def sniff_image_mimetype(image_data: bytes) -> str:
+    """Best-effort content-type detection (so PNG/GIF/WEBP render correctly)."""
+    if len(image_data) >= 12:
+        if image_data.startswith(b"\xff\xd8\xff"):
+            return "image/jpeg"
+        if image_data.startswith(b"\x89PNG\r\n\x1a\n"):
+            return "image/png"
+        if image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
+            return "image/gif"
+        if image_data[0:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+            return "image/webp"
+    return "application/octet-stream"
+
+
 SOURCE_MEETINGS_WEB_URL = os.environ.get("SOURCE_MEETINGS_WEB_URL")
 
 # Optional: built-in static schedule (when no website calendar exists)
@@ -335,6 +410,11 @@ STATIC_SCHEDULE = {
 # Flask 3 removed before_first_request; database initialization is handled
 # via Heroku release phase (see Procfile) and CLI command `flask --app app.py init-db`.
 
+def format_bp_id(user_id):
+    """Back Porch ID for a user id, e.g. BP-1001."""
+    return f"BP-{1000 + user_id}"
+
+
 # ==========================
 # MODELS
 # ==========================
@@ -359,7 +439,14 @@ class User(db.Model):
     last_login = db.Column(db.DateTime, nullable=True, index=True)  # Index for activity tracking
     failed_login_attempts = db.Column(db.Integer, default=0)
     locked_until = db.Column(db.DateTime, nullable=True, index=True)  # Index for locked account queries
-    profile_image = db.Column(db.Text, nullable=True)  # Store base64 encoded image data
+    # Legacy inline base64 photo; new uploads live in image_blobs (see profile_image_hash)
+    profile_image = db.deferred(db.Column(db.Text, nullable=True))
+    profile_image_hash = db.Column(db.String(64), nullable=True, index=True)  # sha256 key into image_blobs
+    # Computed in SQL so templates can test for a photo without loading the blob
+    has_profile_image = db.column_property(
+        case((or_(profile_image_hash.isnot(None),
+                  and_(profile_image.expression.isnot(None), profile_image.expression != '')), True), else_=False)
+    )
     chair_points = db.Column(db.Integer, default=0, index=True)  # ChairPoints earned by chairing meetings
     password_reset_required = db.Column(db.Boolean, default=False)  # Force password change on next login
 
@@ -369,7 +456,7 @@ class User(db.Model):
     @property
     def bp_id(self):
         """Generate Back Porch ID like BP-1001, BP-1002, etc."""
-        return f"BP-{1000 + self.id}"
+        return format_bp_id(self.id)
 
     def set_password(self, password: str):
         self.password_hash = generate_password_hash(password)
@@ -379,11 +466,7 @@ class User(db.Model):
 
     def has_role(self, role_name):
         """Check if user has a specific role."""
-        return any(
-            role.role == role_name and role.is_active and 
-            (role.expires_at is None or role.expires_at > datetime.now(timezone.utc))
-            for role in self.roles
-        )
+        return role_name in get_user_role_names(self.id)
 
     def is_locked(self):
         """Check if user account is locked due to failed login attempts."""
@@ -419,6 +502,15 @@ class Meeting(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     gender_restriction = db.Column(db.String(10), nullable=True, index=True)  # Index for filtering
     meeting_type = db.Column(db.String(50), nullable=False, default='Regular', index=True)  # Index for filtering
+    # event_date + start/end time (Eastern) as naive UTC instants, set on flush (see MEETING INSTANTS)
+    starts_at_utc = db.Column(db.DateTime, nullable=True, index=True)
+    ends_at_utc = db.Column(db.DateTime, nullable=True)
+    # Bumped by every UPDATE of the row (ORM or Core); keys the cached ICS fragments
+    revision = db.Column(db.Integer, nullable=False, default=1, server_default='1',
+                         onupdate=literal_column("revision + 1"))
+
+    # Keyset pagination order for the home page feed
+    __table_args__ = (db.Index('ix_meetings_date_time_id', 'event_date', 'start_time', 'id'),)
 
     chair_signup = db.relationship(
         "ChairSignup",
@@ -480,6 +572,22 @@ class ChairSignup(db.Model):
     user = db.relationship("User", back_populates="chair_signups")
 
 
+class NotificationLedger(db.Model):
+    """
+    One row per notification sent to a chair about a meeting ('confirmation',
+    'reminder_24h', 'reminder_1h'), so reminder jobs can rerun without resending.
+    """
+    __tablename__ = "notification_ledger"
+
+    id = db.Column(db.Integer, primary_key=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    sent_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (db.UniqueConstraint('meeting_id', 'user_id', 'kind', name='uq_notification_ledger'),)
+
+
 class ChairpersonAvailability(db.Model):
     """
     Record when a user volunteers to chair on a specific date where no meeting exists yet.
@@ -505,6 +613,49 @@ class ChairpersonAvailability(db.Model):
     __table_args__ = (db.UniqueConstraint('user_id', 'volunteer_date', name='uq_user_date_availability'),)
 
 
+class MeetingDailyStat(db.Model):
+    """
+    Per-day meeting coverage rollup, one row per (date, audience, meeting type).
+
+    Maintained from the ORM write paths (see MEETING DAILY STATS ROLLUP) and
+    rebuilt nightly, so reports read O(days) rows instead of scanning meetings.
+    """
+    __tablename__ = "meeting_daily_stats"
+
+    stat_date = db.Column(db.Date, primary_key=True)
+    gender = db.Column(db.String(10), primary_key=True, default='')         # 'male', 'female' or '' (coed)
+    meeting_type = db.Column(db.String(50), primary_key=True, default='')
+    total_meetings = db.Column(db.Integer, nullable=False, default=0)
+    filled_meetings = db.Column(db.Integer, nullable=False, default=0)      # have a chair
+    open_meetings = db.Column(db.Integer, nullable=False, default=0)        # is_open and still need a chair
+    signups = db.Column(db.Integer, nullable=False, default=0)              # chair signups for these meetings
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class UserServiceStat(db.Model):
+    """
+    Materialized chair-service totals per user, split at ``as_of`` (Eastern date).
+
+    Rewritten in the same transaction as the ChairSignup/Meeting changes that
+    affect it (see USER SERVICE STATS) and rolled forward when the day changes.
+    Users who never signed up to chair have no row.
+    """
+    __tablename__ = "user_service_stats"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    past_chaired = db.Column(db.Integer, nullable=False, default=0)       # meetings before as_of
+    future_chaired = db.Column(db.Integer, nullable=False, default=0)     # meetings on/after as_of
+    first_chaired_on = db.Column(db.Date, nullable=True)                  # earliest past meeting
+    last_chaired_on = db.Column(db.Date, nullable=True)                   # latest past meeting
+    last_30d = db.Column(db.Integer, nullable=False, default=0)           # past meetings in the 30 days before as_of
+    as_of = db.Column(db.Date, nullable=False, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @property
+    def total_chaired(self):
+        return self.past_chaired + self.future_chaired
+
+
 class AuditLog(db.Model):
     """
     Audit trail for important security events and administrative actions.
@@ -630,6 +781,9 @@ class QuizAttempt(db.Model):
 
     user = db.relationship("User", backref="quiz_attempts")
 
+    # Certificate registry: passed attempts grouped per user, newest first
+    __table_args__ = (db.Index('ix_quiz_attempts_passed_user', 'passed', 'user_id', 'completed_at'),)
+
 
 class Sponsor(db.Model):
     """
@@ -648,7 +802,13 @@ class Sponsor(db.Model):
 
     # Public-facing sponsor bio (what a sponsee reads to decide fit)
     bio = db.Column(db.Text, nullable=True)
-    profile_image = db.Column(db.Text, nullable=True)  # base64 encoded image data (jpeg/png/etc.)
+    # Legacy inline base64 photo; new uploads live in image_blobs (see profile_image_hash)
+    profile_image = db.deferred(db.Column(db.Text, nullable=True))
+    profile_image_hash = db.Column(db.String(64), nullable=True, index=True)  # sha256 key into image_blobs
+    has_profile_image = db.column_property(
+        case((or_(profile_image_hash.isnot(None),
+                  and_(profile_image.expression.isnot(None), profile_image.expression != '')), True), else_=False)
+    )
     notes = db.Column(db.Text, nullable=True)  # internal/admin notes
     is_active = db.Column(db.Boolean, default=True, index=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), index=True)
@@ -737,6 +897,349 @@ class SponsorRequest(db.Model):
     sponsor = db.relationship("Sponsor", backref="requests")
 
 
+class ImageBlob(db.Model):
+    """Uploaded image bytes, stored once per distinct content (keyed by sha256).
+
+    Users and sponsors only carry the hash, so loading those rows never pulls
+    image data.
+    """
+    __tablename__ = "image_blobs"
+
+    sha256 = db.Column(db.String(64), primary_key=True)
+    mimetype = db.Column(db.String(50), nullable=False, default="application/octet-stream")
+    size = db.Column(db.Integer, nullable=False)
+    data = db.Column(db.LargeBinary(length=16 * 1024 * 1024), nullable=False)  # MEDIUMBLOB on MySQL
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class ImageVariant(db.Model):
+    """Resized, metadata-free rendition of an ImageBlob (see image_pipeline)."""
+    __tablename__ = "image_variants"
+    __table_args__ = (db.UniqueConstraint("source_sha256", "size", "format", name="uq_image_variant"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    # No FK: variants are written by a background thread, possibly before the upload commits
+    source_sha256 = db.Column(db.String(64), nullable=False, index=True)
+    size = db.Column(db.Integer, nullable=False)  # longest edge in pixels
+    format = db.Column(db.String(10), nullable=False)  # webp / jpeg
+    mimetype = db.Column(db.String(50), nullable=False)
+    data = db.Column(db.LargeBinary(length=16 * 1024 * 1024), nullable=False)
+
+
+class RenderedCertificate(db.Model):
+    """Certificate PDF as last rendered for a user (see certificate_renderer)."""
+    __tablename__ = "rendered_certificates"
+
+    cache_key = db.Column(db.String(64), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    data = db.Column(db.LargeBinary(length=16 * 1024 * 1024), nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class EmailOutbox(db.Model):
+    """An email waiting for (or done with) the outbox sender (see EMAIL OUTBOX)."""
+    __tablename__ = "email_outbox"
+    __table_args__ = (db.Index('ix_email_outbox_due', 'status', 'next_attempt_at'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(255), nullable=False, index=True)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    attachment_name = db.Column(db.String(255), nullable=True)
+    attachment = db.Column(db.Text, nullable=True)  # iCal invite text
+    status = db.Column(db.String(16), nullable=False, default="pending")  # pending / sending / sent / dead
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    claimed_by = db.Column(db.String(32), nullable=True)
+    lease_until = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+
+class BroadcastRun(db.Model):
+    """Metrics for one run of a bulk email job (e.g. the weekly open-slot broadcast).
+
+    ``sent`` counts messages accepted for delivery: queued in the outbox, or
+    handed to SMTP when the outbox is disabled.
+    """
+    __tablename__ = "broadcast_runs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(40), nullable=False, index=True)
+    started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    duration_ms = db.Column(db.Integer, nullable=False, default=0)
+    meetings = db.Column(db.Integer, nullable=False, default=0)
+    recipients = db.Column(db.Integer, nullable=False, default=0)  # users considered
+    skipped = db.Column(db.Integer, nullable=False, default=0)     # nothing eligible for them
+    sent = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+
+
+class CacheGeneration(db.Model):
+    """Current generation of one cache namespace (see CACHE GENERATIONS).
+
+    Kept in the database rather than the cache so every web worker and the
+    background worker agree on it, whether or not a shared cache is configured.
+    """
+    __tablename__ = "cache_generations"
+
+    namespace = db.Column(db.String(64), primary_key=True)
+    generation = db.Column(db.BigInteger, nullable=False)
+
+
+# ==========================
+# PROFILE IMAGES
+# ==========================
+# Users and sponsors reference their photo by sha256 (profile_image_hash) and the
+# bytes live in image_blobs. Rows from before that still carry base64 in the
+# deferred legacy profile_image column until `flask --app app.py migrate-images`.
+
+def store_image_blob(image_data: bytes) -> str:
+    """Store image bytes unless identical content already exists; returns the sha256."""
+    digest = hashlib.sha256(image_data).hexdigest()
+    exists = db.session.query(ImageBlob.sha256).filter(ImageBlob.sha256 == digest).first()
+    if not exists:
+        db.session.add(ImageBlob(
+            sha256=digest,
+            mimetype=sniff_image_mimetype(image_data),
+            size=len(image_data),
+            data=image_data,
+        ))
+    return digest
+
+
+def _delete_image_blob_if_unused(digest: str):
+    db.session.flush()
+    in_use = (
+        db.session.query(User.id).filter(User.profile_image_hash == digest).first()
+        or db.session.query(Sponsor.id).filter(Sponsor.profile_image_hash == digest).first()
+    )
+    if not in_use:
+        ImageVariant.query.filter(ImageVariant.source_sha256 == digest).delete(synchronize_session=False)
+        ImageBlob.query.filter(ImageBlob.sha256 == digest).delete(synchronize_session=False)
+
+
+def set_profile_image(owner, image_data: bytes):
+    """Point a User or Sponsor at new photo bytes, dropping any legacy inline copy."""
+    old_hash = owner.profile_image_hash
+    owner.profile_image_hash = store_image_blob(image_data)
+    owner.profile_image = None
+    schedule_image_variants(owner.profile_image_hash, image_data)
+    if old_hash and old_hash != owner.profile_image_hash:
+        _delete_image_blob_if_unused(old_hash)
+
+
+def clear_profile_image(owner):
+    """Remove a User's or Sponsor's photo."""
+    old_hash = owner.profile_image_hash
+    owner.profile_image_hash = None
+    owner.profile_image = None
+    if old_hash:
+        _delete_image_blob_if_unused(old_hash)
+
+
+def _image_variant_rows(digest, variants):
+    return [
+        ImageVariant(source_sha256=digest, size=size, format=fmt,
+                     mimetype=IMAGE_VARIANT_FORMATS[fmt][1], data=data)
+        for (size, fmt), data in variants.items()
+    ]
+
+
+def _save_image_variants(digest, variants):
+    """Persist rendered variants (runs on an image pipeline worker thread)."""
+    with app.app_context():
+        try:
+            db.session.add_all(_image_variant_rows(digest, variants))
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()  # same image processed concurrently; keep the first set
+        except Exception:
+            db.session.rollback()
+            raise
+
+
+def _image_variant_sizes():
+    raw = str(app.config.get("IMAGE_VARIANT_SIZES") or "48,128,512")
+    return tuple(sorted({int(x) for x in raw.split(",") if x.strip()}))
+
+
+image_pipeline = ImagePipeline(
+    _save_image_variants,
+    sizes=_image_variant_sizes(),
+    workers=app.config.get("IMAGE_PROCESSING_WORKERS", 2),
+)
+
+
+def image_processing_is_async():
+    return bool(app.config.get("IMAGE_PROCESSING_ASYNC", True)) and not app.config.get("TESTING")
+
+
+def schedule_image_variants(digest, image_data, sync=False):
+    """Render thumbnails for a stored blob unless it already has them.
+
+    Normally queued on the image pipeline; inline (in the current session) when
+    ``sync`` or in synchronous mode.
+    """
+    if db.session.query(ImageVariant.id).filter(ImageVariant.source_sha256 == digest).first():
+        return
+    if image_processing_is_async() and not sync:
+        image_pipeline.submit(digest, image_data)
+        return
+    variants = render_variants(image_data, image_pipeline.sizes)
+    db.session.add_all(_image_variant_rows(digest, variants))
+
+
+def load_image_variant(digest, requested_size, fmt):
+    """Return (bytes, mimetype) of the best stored variant for ``requested_size``, or None."""
+    row = (
+        db.session.query(ImageVariant.data, ImageVariant.mimetype)
+        .filter(
+            ImageVariant.source_sha256 == digest,
+            ImageVariant.size == pick_variant_size(requested_size, image_pipeline.sizes),
+            ImageVariant.format == fmt,
+        )
+        .first()
+    )
+    return (row.data, row.mimetype) if row else None
+
+
+def load_profile_image(owner):
+    """Return (bytes, mimetype) of a User's or Sponsor's original photo, or None."""
+    if not owner.has_profile_image:
+        return None
+    if owner.profile_image_hash:
+        row = (
+            db.session.query(ImageBlob.data, ImageBlob.mimetype)
+            .filter(ImageBlob.sha256 == owner.profile_image_hash)
+            .first()
+        )
+        if row:
+            return row.data, row.mimetype
+    if owner.profile_image:  # legacy row, not migrated yet (loads the deferred column)
+        image_data = base64.b64decode(owner.profile_image)
+        return image_data, sniff_image_mimetype(image_data)
+    return None
+
+
+def migrate_legacy_profile_images(batch_size=50) -> dict:
+    """Move base64 photos out of users/sponsors rows into image_blobs. Safe to re-run."""
+    moved = {"users": 0, "sponsors": 0, "failed": 0}
+    for model, label in ((User, "users"), (Sponsor, "sponsors")):
+        legacy = model.__table__.c.profile_image
+        last_id = 0
+        while True:
+            rows = (
+                db.session.query(model.id, legacy)
+                .filter(model.id > last_id, model.profile_image_hash.is_(None),
+                        legacy.isnot(None), legacy != '')
+                .order_by(model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for row_id, encoded in rows:
+                last_id = row_id
+                try:
+                    digest = store_image_blob(base64.b64decode(encoded))
+                except Exception as e:
+                    moved["failed"] += 1
+                    print(f"Skipped {label} {row_id}: {e}")
+                    continue
+                db.session.execute(
+                    model.__table__.update()
+                    .where(model.__table__.c.id == row_id)
+                    .values(profile_image_hash=digest, profile_image=None)
+                )
+                moved[label] += 1
+            db.session.commit()
+    return moved
+
+
+IMAGE_CACHE_FOREVER = "public, max-age=31536000, immutable"
+
+
+def image_fingerprint(image_hash):
+    return image_hash[:16] if image_hash else None
+
+
+def profile_image_url(user_id, image_hash=None, size=None):
+    """Photo URL fingerprinted with the content hash, so browsers can cache it for good."""
+    return url_for('profile_image', user_id=user_id, size=size, v=image_fingerprint(image_hash))
+
+
+def sponsor_image_url(sponsor_id, image_hash=None, size=None):
+    """Sponsor photo URL fingerprinted with the content hash."""
+    return url_for('sponsor_image', sponsor_id=sponsor_id, size=size, v=image_fingerprint(image_hash))
+
+
+def _image_response(data, mimetype, etag, cache_control, vary_accept):
+    response = Response(data, mimetype=mimetype) if data is not None else Response(status=304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    if vary_accept:
+        response.vary.add("Accept")  # WebP or JPEG depending on the client
+    return response
+
+
+def send_profile_image(owner, default_mimetype=None):
+    """Serve a User's or Sponsor's photo (?size= variant, ?v= fingerprint) with HTTP caching.
+
+    Stored images have content-hash ETags, so If-None-Match is answered before
+    any image data is read. Fingerprinted URLs that match the current photo are
+    immutable; anything else must revalidate.
+    """
+    g.skip_session_cookie = True  # never attach Set-Cookie to a publicly cached image
+    size = request.args.get("size", type=int)
+    digest = owner.profile_image_hash
+    fingerprinted = bool(digest) and request.args.get("v") == image_fingerprint(digest)
+    cache_control = IMAGE_CACHE_FOREVER if fingerprinted else "public, no-cache"
+
+    if digest:
+        fmt = preferred_format(request.headers.get("Accept"))
+        if size:
+            etag = f"{digest[:32]}-{pick_variant_size(size, image_pipeline.sizes)}-{fmt}"
+            if request.if_none_match.contains(etag):
+                return _image_response(None, None, etag, cache_control, True)
+            variant = load_image_variant(digest, size, fmt)
+            if variant:
+                return _image_response(*variant, etag, cache_control, True)
+            # Variants still rendering: the original, and don't let it be cached under this URL
+            cache_control = "public, no-cache"
+        etag = f"{digest[:32]}-orig"
+        if request.if_none_match.contains(etag):
+            return _image_response(None, None, etag, cache_control, bool(size))
+
+    image = load_profile_image(owner)
+    if image is None:
+        return None
+    data, mimetype = image
+    if default_mimetype and not mimetype.startswith("image/"):
+        mimetype = default_mimetype
+    if not digest:
+        # Legacy inline photo (not migrated yet): hash the bytes we already loaded
+        etag = hashlib.sha256(data).hexdigest()[:32] + "-orig"
+        if request.if_none_match.contains(etag):
+            return _image_response(None, None, etag, cache_control, bool(size))
+    return _image_response(data, mimetype, etag, cache_control, bool(size))
+
+
+def backfill_image_variants() -> int:
+    """Render variants for stored images that have none yet. Returns how many were processed."""
+    pending = (
+        db.session.query(ImageBlob.sha256)
+        .filter(~db.session.query(ImageVariant.id).filter(ImageVariant.source_sha256 == ImageBlob.sha256).exists())
+        .all()
+    )
+    for (digest,) in pending:
+        data = db.session.query(ImageBlob.data).filter(ImageBlob.sha256 == digest).scalar()
+        schedule_image_variants(digest, data, sync=True)
+        db.session.commit()
+    return len(pending)
+
+
 # ==========================
 # IMPORTERS / SYNC
 # ==========================
@@ -821,6 +1324,7 @@ def import_meetings_from_ics(ics_url: str, replace_future: bool = True) -> int:
         imported += 1
 
     db.session.commit()
+    invalidate_meeting_caches()
     return imported
 
 
@@ -919,6 +1423,7 @@ def seed_meetings_from_static_schedule(weeks: int = 52, replace_future: bool = T
             created += 1
 
     db.session.commit()
+    invalidate_meeting_caches()
     return created
 
 
@@ -1070,6 +1575,7 @@ def import_meetings_from_webpage(page_url: str, weeks: int = 52, replace_future:
             created += 1
 
     db.session.commit()
+    invalidate_meeting_caches()
     return created
 
 
@@ -1295,24 +1801,81 @@ def _get_client_ip() -> str | None:
     except Exception:
         return None
 
-def log_audit_event(action, user_id=None, resource_type=None, resource_id=None, details=None):
-    """Log security and administrative events."""
+def _write_audit_batch(rows):
+    """Bulk insert a batch of queued audit rows (runs on the writer thread)."""
+    with app.app_context():
+        try:
+            db.session.execute(db.insert(AuditLog), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+
+audit_writer = AuditWriter(
+    _write_audit_batch,
+    max_queue=app.config.get("AUDIT_LOG_QUEUE_SIZE", 5000),
+    batch_size=app.config.get("AUDIT_LOG_BATCH_SIZE", 200),
+    flush_interval=app.config.get("AUDIT_LOG_FLUSH_SECONDS", 2.0),
+)
+atexit.register(audit_writer.flush)
+
+
+# Async audit rows waiting for the caller's transaction to commit (see log_audit_event)
+AUDIT_PENDING_KEY = "pending_audit_rows"
+
+
+def audit_log_is_async():
+    return bool(app.config.get("AUDIT_LOG_ASYNC", True)) and not app.config.get("TESTING")
+
+
+def log_audit_event(action, user_id=None, resource_type=None, resource_id=None, details=None, commit=True):
+    """Log security and administrative events.
+
+    Rows go through the write-behind queue. In synchronous mode (tests, or
+    AUDIT_LOG_ASYNC=false) they are added to the current session instead and
+    committed unless ``commit=False``, in which case they ride along with the
+    caller's own commit. Async rows logged with ``commit=False`` likewise wait
+    for that commit and are dropped if the caller rolls back.
+    """
     try:
-        audit_log = AuditLog(
+        row = dict(
             user_id=user_id,
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
             ip_address=_get_client_ip(),
             user_agent=(request.headers.get('User-Agent') or request.environ.get('HTTP_USER_AGENT')),
-            details=details
+            details=details,
+            created_at=datetime.now(timezone.utc),
         )
-        db.session.add(audit_log)
-        db.session.commit()
+        if audit_log_is_async():
+            if commit:
+                audit_writer.enqueue(row)
+            else:
+                session = db.session()
+                if session.get_transaction() is None:
+                    session.begin()  # so a rollback with no SQL run yet still discards the row
+                session.info.setdefault(AUDIT_PENDING_KEY, []).append(row)
+            return
+        db.session.add(AuditLog(**row))
+        if commit:
+            db.session.commit()
     except Exception as e:
         print(f"Failed to log audit event: {e}")
 
 
+@event.listens_for(db.session, "after_commit")
+def _enqueue_audit_rows_after_commit(session):
+    for row in session.info.pop(AUDIT_PENDING_KEY, ()):
+        audit_writer.enqueue(row)
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_audit_rows(session):
+    session.info.pop(AUDIT_PENDING_KEY, None)
+
+
 def require_role(role_name):
     """Decorator to require specific role for access."""
     def decorator(f):
@@ -1431,41 +1994,168 @@ def backup_database(backup_type='manual', initiated_by_user_id=None):
         raise
 
 
+# ==========================
+# RATE LIMITING
+# ==========================
+# Limits are checked against Redis (shared by all workers) when REDIS_URL is set,
+# otherwise against per-process memory. Nothing here touches the database.
+
+def _build_rate_limiter():
+    storage = (app.config.get("RATELIMIT_STORAGE") or "auto").lower()
+    backend = None
+    if storage in ("auto", "redis") and REDIS_AVAILABLE and os.getenv('REDIS_URL'):
+        try:
+            backend = RedisBackend.from_url(os.getenv('REDIS_URL'))
+        except Exception as e:
+            print(f"⚠ Redis rate limiter unavailable, using in-process limits: {e}")
+    return RateLimiter(backend or MemoryBackend(), algorithm=app.config.get("RATELIMIT_ALGORITHM", "sliding_window"))
+
+
+rate_limiter = _build_rate_limiter()
+
+
+def rate_limits_enabled():
+    return bool(app.config.get("RATELIMIT_ENABLED", True)) and not app.config.get("TESTING")
+
+
+def hit_rate_limit(name, key, limit_setting):
+    """Count one hit of ``name`` for ``key`` against the limit in config[limit_setting].
+
+    Returns the seconds the client should wait, or 0 if the hit is allowed.
+    """
+    if not rate_limits_enabled():
+        return 0
+    allowed, retry_after = rate_limiter.hit(name, key, app.config.get(limit_setting))
+    return 0 if allowed else retry_after
+
+
+def rate_limit_key_ip():
+    return f"ip:{_get_client_ip() or 'unknown'}"
+
+
+def rate_limit_key_user():
+    user = get_current_user()
+    return f"user:{user.id}" if user else rate_limit_key_ip()
+
+
+def rate_limit_key_email(email):
+    email = normalize_email(email or "")
+    return f"email:{email}" if email else None
+
+
+def rate_limited_response(retry_after, status=429, message=None):
+    """Default JSON response for a throttled request; ``message`` adds human-readable text."""
+    payload = {"error": "rate_limited", "retry_after": retry_after}
+    if message:
+        payload["message"] = message
+    resp = jsonify(payload)
+    resp.status_code = status
+    resp.headers["Retry-After"] = str(retry_after)
+    return resp
+
+
+def rate_limited(name, limit_setting, key=rate_limit_key_ip, methods=None, on_limit=None):
+    """Throttle a view. ``on_limit(retry_after)`` builds the response (JSON 429 by default)."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(*args, **kwargs):
+            if methods is None or request.method in methods:
+                retry_after = hit_rate_limit(name, key(), limit_setting)
+                if retry_after:
+                    if on_limit is not None:
+                        return on_limit(retry_after)
+                    return rate_limited_response(retry_after)
+            return view_func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def rate_limited_page(template, retry_after, **context):
+    """Re-render a form page with a 429 when a login-style POST is throttled."""
+    minutes = max(1, (retry_after + 59) // 60)
+    flash(f"Too many attempts. Please wait {minutes} minute{'s' if minutes != 1 else ''} and try again.", "danger")
+    resp = make_response(render_template(template, **context), 429)
+    resp.headers["Retry-After"] = str(retry_after)
+    return resp
+
+
 def check_rate_limit(action, user_id, limit_per_hour=10):
-    """Simple rate limiting for sensitive actions."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
-    recent_attempts = AuditLog.query.filter(
-        AuditLog.user_id == user_id,
-        AuditLog.action == action,
-        AuditLog.created_at > cutoff
-    ).count()
-    
-    return recent_attempts < limit_per_hour
+    """Per-user hourly limit for sensitive actions.
+
+    Returns the seconds the user should wait, or 0 if the action is allowed.
+    """
+    if not rate_limits_enabled():
+        return 0
+    allowed, retry_after = rate_limiter.hit(action, f"user:{user_id}", f"{limit_per_hour}/hour")
+    return 0 if allowed else retry_after
 
 
 # ==========================
 # AUTH HELPERS
 # ==========================
 
+# The logged-in user, sponsor account and role names are loaded at most once per
+# request and kept on flask.g. Entries remember which id they were loaded for so
+# a login/logout mid-request is picked up on the next call.
+
 def get_current_user():
     user_id = session.get("user_id")
-    if not user_id:
-        return None
-    try:
-        return User.query.get(user_id)
-    except Exception:
-        # If database is unavailable, user is not logged in
-        return None
+    cached = g.get("_identity_user")
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+    user = None
+    if user_id:
+        try:
+            user = (
+                User.query
+                .options(db.defer(User.profile_image))
+                .filter(User.id == user_id)
+                .first()
+            )
+        except Exception:
+            # If database is unavailable, user is not logged in
+            user = None
+    g._identity_user = (user_id, user)
+    return user
 
 
 def get_current_sponsor_account():
     sponsor_account_id = session.get("sponsor_account_id")
-    if not sponsor_account_id:
-        return None
-    try:
-        return SponsorAccount.query.get(sponsor_account_id)
-    except Exception:
-        return None
+    cached = g.get("_identity_sponsor")
+    if cached is not None and cached[0] == sponsor_account_id:
+        return cached[1]
+    account = None
+    if sponsor_account_id:
+        try:
+            account = (
+                SponsorAccount.query
+                .options(db.joinedload(SponsorAccount.sponsor).defer(Sponsor.profile_image))
+                .filter(SponsorAccount.id == sponsor_account_id)
+                .first()
+            )
+        except Exception:
+            account = None
+    g._identity_sponsor = (sponsor_account_id, account)
+    return account
+
+
+def get_user_role_names(user_id):
+    """Active, unexpired role names for a user, cached for the rest of the request."""
+    cache_map = g.setdefault("_identity_roles", {})
+    if user_id in cache_map:
+        return cache_map[user_id]
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = (
+        db.session.query(UserRole.role)
+        .filter(
+            UserRole.user_id == user_id,
+            UserRole.is_active.is_(True),
+            or_(UserRole.expires_at.is_(None), UserRole.expires_at > now),
+        )
+        .all()
+    )
+    cache_map[user_id] = frozenset(r.role for r in rows)
+    return cache_map[user_id]
 
 
 def sponsor_login_required(view_func):
@@ -1500,21 +2190,1043 @@ def admin_required(view_func):
 
 
 # ==========================
-# PUBLIC ROUTES
+# CACHE GENERATIONS
 # ==========================
+# Cached entries are keyed by the generation of the namespaces they depend on.
+# A write bumps only its namespace's generation, so stale entries simply stop
+# being referenced and age out on their own; nothing calls cache.clear().
+#
+#   meetings   meetings and chair signups (calendar, feeds, reports)
+#   users      every user-scoped entry; "user:<id>" scopes one user's entries
+#              (cached_value adds "users" to any key that names a user:<id>)
+#   sponsors   sponsor directory data
+#   analytics  admin statistics that also depend on users (host counts)
+#
+# Meeting, ChairSignup, Sponsor and User writes bump their namespace when the
+# session commits (see the hooks after USER SERVICE STATS). Generations live in
+# the cache_generations table, not the cache: without Redis each process has its
+# own cache, and a bump must still reach every worker. Within a request they are
+# read once and remembered on flask.g.
+
+CACHE_GENERATIONS_G_KEY = "_cache_generations"
+
+
+def user_cache_namespace(user_id):
+    return f"user:{user_id}"
+
+
+def _request_generations():
+    return g.setdefault(CACHE_GENERATIONS_G_KEY, {}) if has_request_context() else {}
+
+
+def cache_generations(namespaces):
+    """Return the current generation of each namespace (None for all if the DB is unavailable)."""
+    known = _request_generations()
+    missing = [ns for ns in namespaces if ns not in known]
+    if missing:
+        table = CacheGeneration.__table__
+        try:
+            with db.engine.connect() as conn:
+                rows = conn.execute(
+                    db.select(table.c.namespace, table.c.generation).where(table.c.namespace.in_(missing))
+                ).all()
+        except Exception as e:
+            app.logger.warning(f"Failed to read cache generations: {e}")
+            return [None] * len(namespaces)
+        found = dict(rows)
+        for namespace in missing:
+            generation = found.get(namespace)
+            if generation is None:
+                generation = bump_cache_generation(namespace)
+                if generation is None:
+                    return [None] * len(namespaces)
+            known[namespace] = generation
+    return [known[ns] for ns in namespaces]
+
+
+def cache_generation(namespace):
+    """Return the current generation token of a namespace (None if it can't be read)."""
+    return cache_generations((namespace,))[0]
+
+
+def bump_cache_generation(namespace):
+    """Mark everything cached under ``namespace`` as stale, in every process.
+
+    Uses a millisecond timestamp rather than a counter so a namespace whose row
+    is recreated can never return to a value an older entry was stored under;
+    the ICS feeds also read it as a Last-Modified time. Returns the new
+    generation, or None if it could not be stored.
+    """
+    table = CacheGeneration.__table__
+    now = int(time.time() * 1000)
+    advance = case((table.c.generation >= now, table.c.generation + 1), else_=now)
+    try:
+        with db.engine.begin() as conn:
+            updated = conn.execute(
+                table.update().where(table.c.namespace == namespace).values(generation=advance)
+            ).rowcount
+            if not updated:
+                try:
+                    with conn.begin_nested():
+                        conn.execute(table.insert().values(namespace=namespace, generation=now))
+                except IntegrityError:
+                    # Another process created it first
+                    conn.execute(table.update().where(table.c.namespace == namespace).values(generation=advance))
+            generation = conn.execute(
+                db.select(table.c.generation).where(table.c.namespace == namespace)
+            ).scalar_one()
+    except Exception as e:
+        app.logger.warning(f"Failed to bump {namespace} cache generation: {e}")
+        _request_generations().pop(namespace, None)
+        return None
+    _request_generations()[namespace] = generation
+    return generation
 
-@app.context_processor
-def inject_globals():
+
+def cached_value(namespaces, key, build, timeout):
+    """Return ``build()``, cached under ``key`` and the generations of ``namespaces``.
+
+    On the tiered cache a missing value is built once across threads and
+    workers (see tiered_cache.TieredCache.get_or_compute). Falls back to
+    calling ``build()`` when the cache is unavailable. Entries scoped to a
+    ``user:<id>`` namespace also depend on "users", which bulk writes bump.
+    """
+    namespaces = tuple(namespaces)
+    if "users" not in namespaces and any(ns.startswith("user:") for ns in namespaces):
+        namespaces += ("users",)
+    generations = cache_generations(namespaces)
+    if None in generations:
+        return build()
+    full_key = f"{key}@{'-'.join(str(g) for g in generations)}"
+    get_or_compute = getattr(getattr(cache, "cache", None), "get_or_compute", None)
+    if get_or_compute is not None:
+        try:
+            return get_or_compute(full_key, build, timeout)
+        except Exception as e:
+            app.logger.warning(f"Failed to cache {key}: {e}")
+            return build()
     try:
-        return {
-            "current_user": get_current_user(),
-            "current_sponsor": (get_current_sponsor_account().sponsor if get_current_sponsor_account() else None),
-        }
+        value = cache.get(full_key)
     except Exception:
-        # If database is unavailable, provide None user
-        return {"current_user": None, "current_sponsor": None}
+        value = None
+    if value is None:
+        value = build()
+        try:
+            cache.set(full_key, value, timeout=timeout)
+        except Exception as e:
+            app.logger.warning(f"Failed to cache {key}: {e}")
+    return value
 
-# Ensure there are always meetings to show: if database is empty and
+
+def get_meetings_data_version():
+    """Return the meetings namespace generation, shared by every process via cache_generations."""
+    return cache_generation("meetings")
+
+
+def bump_meetings_data_version():
+    """Mark all meeting-derived cache entries as stale."""
+    return bump_cache_generation("meetings")
+
+
+# ==========================
+# CALENDAR SNAPSHOT CACHE
+# ==========================
+# Month views are rebuilt from a cached snapshot of plain data instead of
+# re-querying and re-grouping every meeting on each hit.
+
+def _snapshot_meeting(m):
+    """Flatten a Meeting (plus chair) into template-compatible plain data."""
+    chair = None
+    if m.chair_signup:
+        chair = {
+            "display_name_snapshot": m.chair_signup.display_name_snapshot,
+            "user_id": m.chair_signup.user_id,
+            # Only truthiness is used by the templates; never cache the image itself
+            "user": {
+                "has_profile_image": bool(m.chair_signup.user and m.chair_signup.user.has_profile_image),
+                "profile_image_hash": m.chair_signup.user.profile_image_hash if m.chair_signup.user else None,
+            },
+        }
+    return {
+        "id": m.id,
+        "title": m.title,
+        "event_date": m.event_date,
+        "start_time": m.start_time,
+        "end_time": m.end_time,
+        "is_open": m.is_open,
+        "meeting_type": m.meeting_type,
+        "chair_signup": chair,
+    }
+
+
+def build_calendar_month_weeks(year, month, q=""):
+    """Query a month of meetings and lay them out as Sunday-first week rows."""
+    start_date = date(year, month, 1)
+    _, last_day = calendar.monthrange(year, month)
+    end_date = date(year, month, last_day)
+
+    meetings = (
+        Meeting.query
+        .filter(Meeting.event_date >= start_date, Meeting.event_date <= end_date)
+        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
+        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
+        .all()
+    )
+
+    # Apply simple search filter (title or chair name)
+    if q:
+        def _matches(m):
+            title_match = q in (m.title or "").lower()
+            chair_name = (
+                m.chair_signup.display_name_snapshot if m.chair_signup else ""
+            )
+            chair_match = q in (chair_name or "").lower()
+            return title_match or chair_match
+        meetings = [m for m in meetings if _matches(m)]
+
+    # Map meetings by date
+    meetings_by_date = {}
+    for m in meetings:
+        meetings_by_date.setdefault(m.event_date, []).append(_snapshot_meeting(m))
+
+    # Build weeks for the month
+    cal = calendar.Calendar(firstweekday=6)  # Sunday start
+    weeks = []
+    for week in cal.monthdatescalendar(year, month):
+        week_cells = []
+        for d in week:
+            in_month = d.month == month
+            week_cells.append({
+                "date": d if in_month else None,  # hide out-of-month day number
+                "in_month": in_month,
+                "meetings": meetings_by_date.get(d, []) if in_month else [],
+            })
+        weeks.append(week_cells)
+    return weeks
+
+
+def get_calendar_month_snapshot(year, month, q=""):
+    """Return the week grid for a month, served from cache while the meetings generation is unchanged."""
+    key = f"calendar_month:{year:04d}-{month:02d}:{hashlib.sha1(q.encode('utf-8')).hexdigest()[:16]}"
+    return cached_value(
+        ("meetings",), key, lambda: build_calendar_month_weeks(year, month, q),
+        timeout=app.config.get("CALENDAR_SNAPSHOT_TIMEOUT", 3600),
+    )
+
+
+def ics_feed_validators(*scope, depends_on_today=False):
+    """Return (etag, last_modified) for an ICS feed without querying its meetings.
+
+    The validators are derived from the meetings data version (the millisecond
+    timestamp of the last meetings write, read from cache_generations so every
+    worker answers the same) plus whatever identifies the feed (its parameters,
+    host, user). Feeds whose window moves with the calendar day also fold in
+    today's date.
+    """
+    version = get_meetings_data_version()
+    if version is None:
+        return None, None
+
+    parts = [str(version), request.host_url] + [str(p) for p in scope]
+    last_modified = datetime.fromtimestamp(version / 1000, tz=timezone.utc).replace(microsecond=0)
+    if depends_on_today:
+        today = get_eastern_today()
+        parts.append(today.isoformat())
+        midnight = datetime.combine(today, datetime.min.time(), tzinfo=EASTERN_TZ).astimezone(timezone.utc)
+        last_modified = max(last_modified, midnight)
+    etag = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    return etag, last_modified
+
+
+def ics_not_modified(etag, last_modified, cache_control="no-cache"):
+    """Return a 304 response if the client's copy is current, else None."""
+    if not etag:
+        return None
+    if request.if_none_match:
+        fresh = request.if_none_match.contains(etag)
+    elif request.if_modified_since and last_modified:
+        fresh = last_modified <= request.if_modified_since
+    else:
+        fresh = False
+    if not fresh:
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+
+def set_ics_validators(response, etag, last_modified, cache_control="no-cache"):
+    """Attach the feed's validators so clients can poll with conditional GETs."""
+    if etag:
+        response.set_etag(etag)
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+
+# ==========================
+# MEETING DAILY STATS ROLLUP
+# ==========================
+# meeting_daily_stats holds per-day counts for the dashboard, analytics and
+# monthly report. Any ORM write that touches a meeting or chair signup (signup,
+# cancel, assign, edit, import, bulk delete) records the affected dates on the
+# session; after the commit those days are recounted in their own transaction.
+# A failed refresh only leaves the rollup stale until the nightly reconcile.
+
+DAILY_STATS_DATES_KEY = "meeting_daily_stats_dates"
+DAILY_STATS_REBUILD_KEY = "meeting_daily_stats_rebuild"
+DAILY_STATS_CHUNK = 500
+
+
+def _rollup_gender(column):
+    return case(
+        (func.lower(column).in_(['male', 'men']), 'male'),
+        (func.lower(column).in_(['female', 'women']), 'female'),
+        else_='',
+    )
+
+
+def _daily_stats_select(criteria):
+    """SELECT producing meeting_daily_stats rows for meetings matching criteria."""
+    gender = _rollup_gender(Meeting.gender_restriction)
+    meeting_type = func.coalesce(Meeting.meeting_type, '')
+    has_chair = ChairSignup.id.isnot(None)
+    return (
+        db.select(
+            Meeting.event_date,
+            gender,
+            meeting_type,
+            func.count(Meeting.id),
+            func.sum(case((has_chair, 1), else_=0)),
+            func.sum(case((and_(~has_chair, Meeting.is_open == True), 1), else_=0)),  # noqa: E712
+            func.count(ChairSignup.id),
+        )
+        .select_from(Meeting)
+        .outerjoin(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+        .where(criteria)
+        .group_by(Meeting.event_date, gender, meeting_type)
+    )
+
+
+def _write_daily_stats(conn, stat_criteria, meeting_criteria):
+    stats = MeetingDailyStat.__table__
+    now = datetime.utcnow()
+    rows = [
+        {
+            "stat_date": stat_date, "gender": gender, "meeting_type": meeting_type,
+            "total_meetings": total, "filled_meetings": filled or 0,
+            "open_meetings": open_ or 0, "signups": signups, "updated_at": now,
+        }
+        for stat_date, gender, meeting_type, total, filled, open_, signups
+        in conn.execute(_daily_stats_select(meeting_criteria))
+    ]
+    conn.execute(stats.delete().where(stat_criteria))
+    if rows:
+        conn.execute(stats.insert(), rows)
+    return len(rows)
+
+
+def refresh_meeting_daily_stats(dates):
+    """Recount the rollup rows for the given event dates."""
+    dates = sorted(set(d for d in dates if d is not None))
+    written = 0
+    for i in range(0, len(dates), DAILY_STATS_CHUNK):
+        chunk = dates[i:i + DAILY_STATS_CHUNK]
+        with db.engine.begin() as conn:
+            written += _write_daily_stats(
+                conn, MeetingDailyStat.stat_date.in_(chunk), Meeting.event_date.in_(chunk)
+            )
+    return written
+
+
+def rebuild_meeting_daily_stats(window_days=92):
+    """Recount the whole rollup, one window of dates per transaction."""
+    with db.engine.connect() as conn:
+        first, last = conn.execute(db.select(func.min(Meeting.event_date), func.max(Meeting.event_date))).one()
+    written = 0
+    with db.engine.begin() as conn:
+        outside = MeetingDailyStat.stat_date.isnot(None)
+        if first is not None:
+            outside = or_(MeetingDailyStat.stat_date < first, MeetingDailyStat.stat_date > last)
+        conn.execute(MeetingDailyStat.__table__.delete().where(outside))
+    while first is not None and first <= last:
+        window_end = min(first + timedelta(days=window_days - 1), last)
+        with db.engine.begin() as conn:
+            written += _write_daily_stats(
+                conn,
+                MeetingDailyStat.stat_date.between(first, window_end),
+                Meeting.event_date.between(first, window_end),
+            )
+        first = window_end + timedelta(days=1)
+    return written
+
+
+def reconcile_meeting_daily_stats():
+    """Nightly job: rebuild the rollup from meetings to repair any drift."""
+    with app.app_context():
+        try:
+            written = rebuild_meeting_daily_stats()
+            app.logger.info(f"Reconciled meeting_daily_stats: {written} rows")
+            return written
+        except Exception as e:
+            app.logger.error(f"meeting_daily_stats reconcile failed: {e}")
+            return 0
+
+
+def _dirty_stat_dates(session):
+    return session.info.setdefault(DAILY_STATS_DATES_KEY, set())
+
+
+def _signup_meeting_dates(session, meeting_ids):
+    meeting_ids = set(meeting_ids)
+    meeting_ids.discard(None)
+    if not meeting_ids:
+        return set()
+    with session.no_autoflush:
+        return {
+            d for (d,) in session.execute(db.select(Meeting.event_date).where(Meeting.id.in_(meeting_ids)))
+        }
+
+
+@event.listens_for(db.session, "before_flush")
+def _track_daily_stats_dates_before_flush(session, flush_context, instances):
+    # Deleted rows and the old dates of moved meetings must be read before the
+    # flush writes them (an expired attribute has no old value in its history)
+    signup_meetings = set()
+    for obj in session.deleted:
+        if isinstance(obj, Meeting):
+            _dirty_stat_dates(session).add(obj.event_date)
+        elif isinstance(obj, ChairSignup):
+            signup_meetings.add(obj.meeting_id)
+    moved_meetings, moved_signups = [], []
+    for obj in session.dirty:
+        if isinstance(obj, Meeting) and db.inspect(obj).attrs.event_date.history.has_changes():
+            moved_meetings.append(obj.id)
+        elif isinstance(obj, ChairSignup) and db.inspect(obj).attrs.meeting_id.history.has_changes():
+            moved_signups.append(obj.id)
+    with session.no_autoflush:
+        if moved_meetings:
+            _dirty_stat_dates(session).update(
+                d for (d,) in session.execute(
+                    db.select(Meeting.event_date).where(Meeting.id.in_(moved_meetings))
+                )
+            )
+        if moved_signups:
+            _dirty_stat_dates(session).update(
+                d for (d,) in session.execute(
+                    db.select(Meeting.event_date)
+                    .join(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+                    .where(ChairSignup.id.in_(moved_signups))
+                )
+            )
+    if signup_meetings:
+        _dirty_stat_dates(session).update(_signup_meeting_dates(session, signup_meetings))
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_daily_stats_dates_after_flush(session, flush_context):
+    signup_meetings = set()
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Meeting):
+            _dirty_stat_dates(session).add(obj.event_date)
+        elif isinstance(obj, ChairSignup):
+            signup_meetings.add(obj.meeting_id)
+    if signup_meetings:
+        _dirty_stat_dates(session).update(_signup_meeting_dates(session, signup_meetings))
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def _track_bulk_daily_stats_dates(orm_execute_state):
+    """Bulk query().delete()/update() bypass the flush; look their dates up first."""
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    statement = orm_execute_state.statement
+    mapper = orm_execute_state.bind_mapper
+    entity = mapper.class_ if mapper is not None else None
+    if entity is Meeting:
+        lookup = db.select(Meeting.event_date)
+    elif entity is ChairSignup:
+        lookup = db.select(Meeting.event_date).join(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+    else:
+        return
+    if statement.whereclause is not None:
+        lookup = lookup.where(statement.whereclause)
+    session = orm_execute_state.session
+    _dirty_stat_dates(session).update(d for (d,) in session.execute(lookup.distinct()))
+    # An UPDATE may also move meetings to new dates
+    if entity is Meeting and orm_execute_state.is_update:
+        session.info[DAILY_STATS_REBUILD_KEY] = True
+
+
+@event.listens_for(db.session, "after_commit")
+def _refresh_daily_stats_after_commit(session):
+    dates = session.info.pop(DAILY_STATS_DATES_KEY, None)
+    rebuild = session.info.pop(DAILY_STATS_REBUILD_KEY, False)
+    if not dates and not rebuild:
+        return
+    try:
+        if rebuild:
+            rebuild_meeting_daily_stats()
+        else:
+            refresh_meeting_daily_stats(dates)
+    except Exception as e:
+        app.logger.warning(f"meeting_daily_stats refresh failed (nightly reconcile will repair): {e}")
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_daily_stats_dates(session):
+    session.info.pop(DAILY_STATS_DATES_KEY, None)
+    session.info.pop(DAILY_STATS_REBUILD_KEY, None)
+
+
+# ==========================
+# USER SERVICE STATS
+# ==========================
+# user_service_stats holds each chair's past/future/last-30-day counts so the
+# monthly, all-users and leaderboard reports and the dashboard read one row per
+# user instead of counting chair_signups per user. Rows for users touched by a
+# flush are rewritten in the same transaction just before it commits. Because
+# "past" moves with the calendar, rows carry the day they were computed for and
+# are recomputed in bulk once that day is over.
+
+SERVICE_STATS_USERS_KEY = "user_service_stats_users"
+SERVICE_STATS_CHECKED_KEY = "user_service_stats_as_of"
+
+
+def _service_stats_select(today, user_criteria=None):
+    """SELECT producing user_service_stats rows from chair_signups."""
+    past = Meeting.event_date < today
+    recent = and_(past, Meeting.event_date >= today - timedelta(days=30))
+    query = (
+        db.select(
+            ChairSignup.user_id,
+            func.sum(case((past, 1), else_=0)),
+            func.sum(case((past, 0), else_=1)),
+            func.min(case((past, Meeting.event_date), else_=None)),
+            func.max(case((past, Meeting.event_date), else_=None)),
+            func.sum(case((recent, 1), else_=0)),
+            db.literal(today, db.Date),
+            db.literal(datetime.utcnow(), db.DateTime),
+        )
+        .select_from(ChairSignup)
+        .join(Meeting, Meeting.id == ChairSignup.meeting_id)
+        .group_by(ChairSignup.user_id)
+    )
+    if user_criteria is not None:
+        query = query.where(user_criteria)
+    return query
+
+
+def _write_service_stats(conn, today, user_ids=None):
+    stats = UserServiceStat.__table__
+    columns = ["user_id", "past_chaired", "future_chaired", "first_chaired_on",
+               "last_chaired_on", "last_30d", "as_of", "updated_at"]
+    if user_ids is None:
+        conn.execute(stats.delete())
+        conn.execute(stats.insert().from_select(columns, _service_stats_select(today)))
+        return
+    user_ids = sorted(user_ids)
+    for i in range(0, len(user_ids), DAILY_STATS_CHUNK):
+        chunk = user_ids[i:i + DAILY_STATS_CHUNK]
+        conn.execute(stats.delete().where(stats.c.user_id.in_(chunk)))
+        conn.execute(stats.insert().from_select(
+            columns, _service_stats_select(today, ChairSignup.user_id.in_(chunk))
+        ))
+
+
+def user_total_meetings():
+    """SQL expression for a user's chaired meetings; 0 when there is no stats row."""
+    return func.coalesce(UserServiceStat.past_chaired + UserServiceStat.future_chaired, 0)
+
+
+def rebuild_user_service_stats(today=None):
+    """Recompute every user's row in one INSERT ... SELECT; returns the row count."""
+    today = today or get_eastern_today()
+    with db.engine.begin() as conn:
+        _write_service_stats(conn, today)
+        count = conn.execute(db.select(func.count()).select_from(UserServiceStat.__table__)).scalar()
+    try:
+        cache.set(SERVICE_STATS_CHECKED_KEY, today.isoformat(), timeout=0)
+    except Exception:
+        pass
+    return count
+
+
+def ensure_user_service_stats_current():
+    """Roll the table forward if it was computed for an earlier day.
+
+    Checked at most once per day per cache; returns today's (Eastern) date.
+    """
+    today = get_eastern_today()
+    try:
+        if cache.get(SERVICE_STATS_CHECKED_KEY) == today.isoformat():
+            return today
+    except Exception:
+        pass
+    stale = db.session.query(UserServiceStat.user_id).filter(UserServiceStat.as_of < today).first()
+    if stale is not None:
+        rebuild_user_service_stats(today)
+    else:
+        try:
+            cache.set(SERVICE_STATS_CHECKED_KEY, today.isoformat(), timeout=0)
+        except Exception:
+            pass
+    return today
+
+
+def refresh_user_service_stats():
+    """Nightly job: recompute the table for the new day."""
+    with app.app_context():
+        try:
+            count = rebuild_user_service_stats()
+            app.logger.info(f"Rebuilt user_service_stats: {count} rows")
+            return count
+        except Exception as e:
+            app.logger.error(f"user_service_stats rebuild failed: {e}")
+            return 0
+
+
+def _dirty_service_users(session):
+    return session.info.setdefault(SERVICE_STATS_USERS_KEY, set())
+
+
+def _signup_users_for_meetings(session, meeting_criteria):
+    with session.no_autoflush:
+        return {
+            u for (u,) in session.execute(
+                db.select(ChairSignup.user_id)
+                .join(Meeting, Meeting.id == ChairSignup.meeting_id)
+                .where(meeting_criteria)
+            )
+        }
+
+
+@event.listens_for(db.session, "before_flush")
+def _track_service_users_before_flush(session, flush_context, instances):
+    # Chairs of moved or deleted meetings, and previous owners of reassigned signups
+    users = set()
+    meeting_ids = []
+    for obj in session.deleted:
+        if isinstance(obj, ChairSignup):
+            users.add(obj.user_id)
+        elif isinstance(obj, Meeting) and obj.id is not None:
+            meeting_ids.append(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, ChairSignup):
+            history = db.inspect(obj).attrs
+            if history.user_id.history.has_changes() or history.meeting_id.history.has_changes():
+                with session.no_autoflush:
+                    users.update(u for (u,) in session.execute(
+                        db.select(ChairSignup.user_id).where(ChairSignup.id == obj.id)
+                    ))
+        elif isinstance(obj, Meeting) and db.inspect(obj).attrs.event_date.history.has_changes():
+            meeting_ids.append(obj.id)
+    if meeting_ids:
+        users.update(_signup_users_for_meetings(session, Meeting.id.in_(meeting_ids)))
+    users.discard(None)
+    if users:
+        _dirty_service_users(session).update(users)
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_service_users_after_flush(session, flush_context):
+    users = {
+        obj.user_id for obj in list(session.new) + list(session.dirty)
+        if isinstance(obj, ChairSignup)
+    }
+    users.discard(None)
+    if users:
+        _dirty_service_users(session).update(users)
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def _track_bulk_service_users(orm_execute_state):
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    entity = mapper.class_ if mapper is not None else None
+    if entity not in (Meeting, ChairSignup):
+        return
+    criteria = orm_execute_state.statement.whereclause
+    if criteria is None:
+        criteria = db.true()
+    _dirty_service_users(orm_execute_state.session).update(
+        _signup_users_for_meetings(orm_execute_state.session, criteria)
+    )
+
+
+@event.listens_for(db.session, "before_commit")
+def _write_service_stats_before_commit(session):
+    session.flush()
+    users = session.info.pop(SERVICE_STATS_USERS_KEY, None)
+    if users:
+        _write_service_stats(session.connection(), get_eastern_today(), users)
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_service_users(session):
+    session.info.pop(SERVICE_STATS_USERS_KEY, None)
+
+
+# ==========================
+# CACHE GENERATION HOOKS
+# ==========================
+# Writes made through the session mark the cache namespaces they touch, and the
+# namespaces are bumped once the transaction commits, so every write path
+# (routes, imports, scheduled jobs, the admin console) invalidates the right
+# entries without remembering to. Registered after the stats hooks so cached
+# reads rebuilt right after the bump already see the refreshed rollups.
+
+CACHE_NAMESPACES_KEY = "cache_generation_namespaces"
+
+
+def _dirty_cache_namespaces(session):
+    return session.info.setdefault(CACHE_NAMESPACES_KEY, set())
+
+
+def _cache_namespaces_for(obj, created_or_deleted):
+    if isinstance(obj, Meeting):
+        return {"meetings"}
+    if isinstance(obj, ChairSignup):
+        namespaces = {"meetings"}
+        if obj.user_id:
+            namespaces.add(user_cache_namespace(obj.user_id))
+        return namespaces
+    if isinstance(obj, (Sponsor, SponsorAccount)):
+        return {"sponsors"}
+    if isinstance(obj, User):
+        namespaces = {user_cache_namespace(obj.id)} if obj.id else set()
+        if created_or_deleted:
+            namespaces.add("analytics")
+        return namespaces
+    return set()
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_cache_namespaces_after_flush(session, flush_context):
+    namespaces = _dirty_cache_namespaces(session)
+    for obj in list(session.new) + list(session.deleted):
+        namespaces.update(_cache_namespaces_for(obj, True))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            namespaces.update(_cache_namespaces_for(obj, False))
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def _track_bulk_cache_namespaces(orm_execute_state):
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    entity = mapper.class_ if mapper is not None else None
+    namespaces = _dirty_cache_namespaces(orm_execute_state.session)
+    if entity in (Meeting, ChairSignup):
+        namespaces.update(("meetings", "users"))
+    elif entity in (Sponsor, SponsorAccount):
+        namespaces.add("sponsors")
+    elif entity is User:
+        namespaces.update(("users", "analytics"))
+
+
+@event.listens_for(db.session, "after_commit")
+def _bump_cache_generations_after_commit(session):
+    for namespace in sorted(session.info.pop(CACHE_NAMESPACES_KEY, ())):
+        bump_cache_generation(namespace)
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_cache_namespaces(session):
+    session.info.pop(CACHE_NAMESPACES_KEY, None)
+
+
+# ==========================
+# MEETING INSTANTS
+# ==========================
+# Meetings are entered as Eastern wall-clock date + times. starts_at_utc and
+# ends_at_utc hold the same moments in UTC, so time-window scans are one
+# indexed range query and feeds can publish exact instants. They are set on
+# every ORM flush; bulk/raw SQL writes need `flask backfill-meeting-times --all`.
+# Until then such rows have NULL instants: Eastern-day lookups fall back to
+# event_date for them (meetings_on_eastern_days), and the reminder job fills
+# them in before it scans.
+
+def meeting_utc_instants(event_date, start_time, end_time=None):
+    """(starts_at_utc, ends_at_utc) for a meeting; no end time means one hour, past midnight means next day."""
+    starts_at = eastern_to_utc(event_date, start_time)
+    if end_time is None:
+        return starts_at, starts_at + timedelta(hours=1)
+    end_day = event_date + timedelta(days=1) if end_time <= start_time else event_date
+    return starts_at, eastern_to_utc(end_day, end_time)
+
+
+@event.listens_for(db.session, "before_flush")
+def _set_meeting_instants(session, flush_context, instances):
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Meeting) and obj.event_date and obj.start_time:
+            starts_at, ends_at = meeting_utc_instants(obj.event_date, obj.start_time, obj.end_time)
+            if obj.starts_at_utc != starts_at:
+                obj.starts_at_utc = starts_at
+            if obj.ends_at_utc != ends_at:
+                obj.ends_at_utc = ends_at
+
+
+def meetings_on_eastern_days(first_day, last_day=None):
+    """Filter for meetings on Eastern dates first_day..last_day.
+
+    Uses the starts_at_utc range, plus event_date for rows whose instants were
+    never filled in (inserted by raw SQL or before the backfill ran).
+    """
+    range_start, range_end = eastern_days_to_utc(first_day, last_day)
+    return or_(
+        and_(Meeting.starts_at_utc >= range_start, Meeting.starts_at_utc < range_end),
+        and_(Meeting.starts_at_utc.is_(None), Meeting.event_date.between(first_day, last_day or first_day)),
+    )
+
+
+def backfill_meeting_instants(recompute=False, batch_size=500):
+    """Set starts_at_utc/ends_at_utc from the Eastern date and times; returns meetings changed.
+
+    Only meetings missing an instant are visited unless ``recompute`` is set,
+    which rechecks every meeting (e.g. after editing times with raw SQL).
+    """
+    changed = 0
+    last_id = 0
+    while True:
+        query = Meeting.query.filter(Meeting.id > last_id)
+        if not recompute:
+            query = query.filter(or_(Meeting.starts_at_utc.is_(None), Meeting.ends_at_utc.is_(None)))
+        meetings = query.order_by(Meeting.id).limit(batch_size).all()
+        if not meetings:
+            return changed
+        last_id = meetings[-1].id
+        for m in meetings:
+            starts_at, ends_at = meeting_utc_instants(m.event_date, m.start_time, m.end_time)
+            if (m.starts_at_utc, m.ends_at_utc) != (starts_at, ends_at):
+                m.starts_at_utc, m.ends_at_utc = starts_at, ends_at
+                changed += 1
+        db.session.commit()
+
+
+# ==========================
+# ICS FEED RENDERING
+# ==========================
+# All calendar feeds and invite attachments share one renderer. Each meeting is
+# serialized to a VEVENT fragment once per revision of its row, chair assignment
+# and variant, and feeds are assembled by joining the cached fragments. Editing
+# one meeting or its chair only re-renders that meeting.
+
+ICS_PRODID = '-//Back Porch Meetings//backporchmeetings.org//'
+ICS_UID_DOMAIN = 'backporchmeetings.org'
+
+ics_fragment_cache = FragmentCache(max_entries=app.config.get("ICS_FRAGMENT_CACHE_SIZE", 20000))
+
+
+def _chair_label(signup):
+    """Chair name with BP ID when the signup belongs to a registered user."""
+    if signup.user_id:
+        return f"{signup.display_name_snapshot} ({format_bp_id(signup.user_id)})"
+    return signup.display_name_snapshot
+
+
+def _render_meeting_vevent(m, variant, chair_name=None):
+    # UTC instants (DTSTART:...Z), so every calendar shows the Eastern time correctly
+    if m.starts_at_utc and m.ends_at_utc:
+        start_dt, end_dt = m.starts_at_utc, m.ends_at_utc
+    else:  # not flushed yet
+        start_dt, end_dt = meeting_utc_instants(m.event_date, m.start_time or datetime.min.time(), m.end_time)
+    start_dt, end_dt = start_dt.replace(tzinfo=timezone.utc), end_dt.replace(tzinfo=timezone.utc)
+    location = m.zoom_link or 'Online'
+
+    if variant == "mine":
+        return render_event(
+            uid=f"my-meeting-{m.id}@{ICS_UID_DOMAIN}",
+            summary=f"Chair: {m.title}",
+            dtstart=start_dt,
+            dtend=end_dt,
+            location=location,
+            description=f"You are chairing this meeting.\n\n{m.description or ''}",
+            url=url_for('meeting_detail', meeting_id=m.id, _external=True),
+            alarms=[
+                (timedelta(hours=-24), f'Reminder: You are chairing {m.title} tomorrow'),
+                (timedelta(hours=-1), f'Reminder: You are chairing {m.title} in 1 hour'),
+            ],
+        )
+
+    if variant == "invite":
+        return render_event(
+            uid=f"chair-meeting-{m.id}@{ICS_UID_DOMAIN}",
+            summary=f"CHAIR: {m.title}",
+            dtstart=start_dt,
+            dtend=end_dt,
+            location=location,
+            description=f"""You are scheduled to chair this meeting.
+
+Meeting: {m.title}
+Type: {getattr(m, 'meeting_type', 'Regular')}
+Description: {m.description or 'Standard meeting format'}
+Zoom Link: {m.zoom_link or 'Contact admin'}
+
+Please join 10-15 minutes early to set up.""",
+            organizer=(chair_name, app.config.get('MAIL_DEFAULT_SENDER')) if chair_name else None,
+            alarms=[
+                (timedelta(hours=-24), f'Reminder: You are chairing {m.title} tomorrow'),
+                (timedelta(hours=-1), f'Starting soon: {m.title} in 1 hour'),
+            ],
+        )
+
+    if variant == "export":
+        description = m.description or ''
+        if m.chair_signup:
+            description += f"\n\nChair: {_chair_label(m.chair_signup)}"
+        return render_event(
+            uid=f"export-meeting-{m.id}@{ICS_UID_DOMAIN}",
+            summary=m.title,
+            dtstart=start_dt,
+            dtend=end_dt,
+            location=location,
+            description=description,
+        )
+
+    chair = _chair_label(m.chair_signup) if m.chair_signup else 'No chair yet'
+    return render_event(
+        uid=f"meeting-{m.id}@{ICS_UID_DOMAIN}",
+        summary=m.title,
+        dtstart=start_dt,
+        dtend=end_dt,
+        location=location,
+        description=f"{m.description or ''}\n\nChair: {chair}",
+        url=url_for('meeting_detail', meeting_id=m.id, _external=True),
+    )
+
+
+def _meeting_fragment_key(m, variant, host, chair_name):
+    signup = m.chair_signup
+    chair = (signup.id, signup.user_id, signup.display_name_snapshot) if signup else None
+    # created_at tells apart a new row that reused a deleted meeting's id
+    return (m.id, m.created_at, m.revision, chair, variant, host, chair_name)
+
+
+def meeting_vevent_fragments(meetings, variant="public", chair_name=None):
+    """Yield cached VEVENT fragments for meetings in the given variant."""
+    host = request.host_url if has_request_context() else None
+    for m in meetings:
+        if m.id is None or m.revision is None:  # not flushed yet
+            yield _render_meeting_vevent(m, variant, chair_name)
+            continue
+        key = _meeting_fragment_key(m, variant, host, chair_name)
+        yield ics_fragment_cache.get_or_render(key, lambda m=m: _render_meeting_vevent(m, variant, chair_name))
+
+
+def build_meetings_ics(meetings, variant="public", calname=None, prodid=ICS_PRODID, method=None, chair_name=None):
+    """Serialize meetings to a complete VCALENDAR byte string."""
+    header = calendar_header(prodid, calname=calname, method=method)
+    return render_calendar(header, meeting_vevent_fragments(meetings, variant, chair_name))
+
+
+# ==========================
+# STREAMING EXPORTS
+# ==========================
+# Large feeds and CSV exports are written incrementally: rows come off the DB
+# in fixed-size batches (server-side cursors where the driver supports them)
+# and are flushed to the client in chunks, so memory stays flat as history
+# grows and the first bytes go out before the last row is read.
+
+STREAM_BATCH_SIZE = 500
+
+
+def iter_query_batched(query, batch_size=STREAM_BATCH_SIZE):
+    """Iterate a query in batches using a streaming cursor."""
+    return query.execution_options(stream_results=True).yield_per(batch_size)
+
+
+def iter_ics_chunks(meetings, variant="public", calname=None, prodid=ICS_PRODID, chunk_rows=STREAM_BATCH_SIZE):
+    """Yield a VCALENDAR in chunks of roughly ``chunk_rows`` events."""
+    yield calendar_header(prodid, calname=calname)
+    buffer = []
+    for fragment in meeting_vevent_fragments(meetings, variant):
+        buffer.append(fragment)
+        if len(buffer) >= chunk_rows:
+            yield b"".join(buffer)
+            buffer = []
+    buffer.append(CALENDAR_FOOTER)
+    yield b"".join(buffer)
+
+
+def iter_csv_chunks(header, rows, chunk_rows=STREAM_BATCH_SIZE):
+    """Yield CSV text in chunks of ``chunk_rows`` rows, reusing one buffer."""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue()
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object that hands back what was written so far."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip_chunks(entries):
+    """Yield a ZIP archive of ``(filename, bytes)`` entries one file at a time.
+
+    Entries are stored uncompressed (PDFs and images already are) and nothing
+    but the current file is held in memory.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for filename, data in entries:
+            archive.writestr(filename, data)
+            yield sink.take()
+    yield sink.take()
+
+
+def streaming_download(chunks, content_type, filename):
+    """Wrap a chunk generator in a chunked-transfer attachment response."""
+    response = Response(stream_with_context(chunks), content_type=content_type)
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
+
+
+# ==========================
+# PUBLIC ROUTES
+# ==========================
+
+@app.context_processor
+def inject_globals():
+    try:
+        sponsor_account = get_current_sponsor_account()
+        return {
+            "current_user": get_current_user(),
+            "current_sponsor": sponsor_account.sponsor if sponsor_account else None,
+        }
+    except Exception:
+        # If database is unavailable, provide None user
+        return {"current_user": None, "current_sponsor": None}
+
+# Ensure there are always meetings to show: if database is empty and
 # static schedule is enabled, auto-seed a minimal horizon on the first request.
 # Flask 3.x removed before_first_request; emulate a one-time hook using a sentinel.
 _auto_seed_done = False
@@ -1554,25 +3266,156 @@ def favicon():
         mimetype='image/vnd.microsoft.icon'
     )
 
+def encode_meeting_cursor(row):
+    """Encode a (event_date, start_time, id) keyset position as an opaque string."""
+    return f"{row['event_date'].isoformat()}.{row['start_time'].strftime('%H%M%S')}.{row['id']}"
+
+
+def decode_meeting_cursor(cursor):
+    """Parse a cursor from encode_meeting_cursor; raises ValueError if malformed."""
+    date_part, time_part, id_part = cursor.split(".")
+    return (
+        date.fromisoformat(date_part),
+        datetime.strptime(time_part, "%H%M%S").time(),
+        int(id_part),
+    )
+
+
+def fetch_upcoming_meetings_page(after=None, from_date=None, before_date=None, limit=50):
+    """Return (rows, has_more) for upcoming meetings in (event_date, start_time, id) order.
+
+    Rows are plain dicts from a column projection (no User join, no image
+    columns). ``after`` is a decoded cursor; ``from_date`` / ``before_date``
+    bound the window by day.
+    """
+    query = (
+        db.session.query(
+            Meeting.id,
+            Meeting.event_date,
+            Meeting.start_time,
+            Meeting.end_time,
+            Meeting.title,
+            Meeting.description,
+            Meeting.is_open,
+            ChairSignup.display_name_snapshot,
+            ChairSignup.user_id,
+            ChairSignup.id.label("signup_id"),
+        )
+        .outerjoin(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+    )
+    if from_date:
+        query = query.filter(Meeting.event_date >= from_date)
+    if before_date:
+        query = query.filter(Meeting.event_date < before_date)
+    if after:
+        after_date, after_time, after_id = after
+        query = query.filter(or_(
+            Meeting.event_date > after_date,
+            and_(Meeting.event_date == after_date, or_(
+                Meeting.start_time > after_time,
+                and_(Meeting.start_time == after_time, Meeting.id > after_id),
+            )),
+        ))
+    results = (
+        query.order_by(Meeting.event_date.asc(), Meeting.start_time.asc(), Meeting.id.asc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    rows = []
+    for r in results[:limit]:
+        chair = None
+        if r.signup_id:
+            chair = {
+                "display_name_snapshot": r.display_name_snapshot,
+                "bp_id": format_bp_id(r.user_id) if r.user_id else None,
+            }
+        rows.append({
+            "id": r.id,
+            "event_date": r.event_date,
+            "start_time": r.start_time,
+            "end_time": r.end_time,
+            "title": r.title,
+            "description": r.description,
+            "is_open": r.is_open,
+            "chair_signup": chair,
+        })
+    return rows, len(results) > limit
+
+
 @app.route("/")
 def index():
-    """List upcoming meetings grouped by date for calendar view."""
+    """List the next couple of weeks of meetings; later weeks load on scroll."""
     today = get_eastern_today()
-    meetings = (
-        Meeting.query
-        .filter(Meeting.event_date >= today)
-        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
-        .all()
+    window_end = today + timedelta(days=app.config.get("HOME_INITIAL_DAYS", 14))
+    meetings, _ = fetch_upcoming_meetings_page(
+        from_date=today,
+        before_date=window_end,
+        limit=app.config.get("HOME_INITIAL_MAX_MEETINGS", 200),
     )
     # Group meetings by date
     meetings_by_date = {}
     for m in meetings:
-        date_str = m.event_date.strftime('%Y-%m-%d')
-        if date_str not in meetings_by_date:
-            meetings_by_date[date_str] = []
-        meetings_by_date[date_str].append(m)
-    return render_template("index.html", meetings_by_date=meetings_by_date)
+        date_str = m["event_date"].strftime('%Y-%m-%d')
+        meetings_by_date.setdefault(date_str, []).append(m)
+
+    # Lazy loader continues from the last rendered row, or from the window end
+    if meetings:
+        last = meetings[-1]
+        next_cursor, next_from = encode_meeting_cursor(last), None
+        _, has_more = fetch_upcoming_meetings_page(
+            after=(last["event_date"], last["start_time"], last["id"]), limit=0
+        )
+    else:
+        next_cursor, next_from = None, window_end.isoformat()
+        has_more = db.session.query(
+            Meeting.query.filter(Meeting.event_date >= window_end).exists()
+        ).scalar()
+
+    return render_template(
+        "index.html",
+        meetings_by_date=meetings_by_date,
+        next_cursor=next_cursor,
+        next_from=next_from,
+        has_more=has_more,
+    )
+
+
+@app.route("/api/meetings/upcoming")
+@rate_limited("public_api", "RATELIMIT_PUBLIC_API")
+def api_upcoming_meetings():
+    """Keyset-paginated upcoming meetings for the home page lazy loader."""
+    limit = min(max(request.args.get("limit", 50, type=int), 1), 200)
+    after = None
+    from_date = get_eastern_today()
+    try:
+        if request.args.get("cursor"):
+            after = decode_meeting_cursor(request.args["cursor"])
+        elif request.args.get("from"):
+            from_date = max(from_date, date.fromisoformat(request.args["from"]))
+    except ValueError:
+        return jsonify({"error": "invalid_cursor"}), 400
+
+    rows, has_more = fetch_upcoming_meetings_page(after=after, from_date=from_date, limit=limit)
+    return jsonify({
+        "meetings": [
+            {
+                "id": r["id"],
+                "date": r["event_date"].strftime('%Y-%m-%d'),
+                "date_label": r["event_date"].strftime('%A, %B %d, %Y'),
+                "start_time": r["start_time"].strftime('%I:%M %p'),
+                "end_time": r["end_time"].strftime('%I:%M %p') if r["end_time"] else None,
+                "title": r["title"],
+                "description": r["description"],
+                "is_open": bool(r["is_open"]),
+                "chair_name": r["chair_signup"]["display_name_snapshot"] if r["chair_signup"] else None,
+                "chair_bp_id": r["chair_signup"]["bp_id"] if r["chair_signup"] else None,
+                "url": url_for("meeting_detail", meeting_id=r["id"]),
+            }
+            for r in rows
+        ],
+        "next_cursor": encode_meeting_cursor(rows[-1]) if (rows and has_more) else None,
+    })
 
 
 @app.route("/chair-resources")
@@ -1662,7 +3505,7 @@ def sponsor_register():
                 is_active=True,
             )
 
-            # Optional sponsor bio photo upload (store as base64 like chair profile images)
+            # Optional sponsor bio photo upload (stored in image_blobs like chair profile images)
             try:
                 if getattr(form, "profile_image", None) and form.profile_image.data:
                     file = form.profile_image.data
@@ -1671,7 +3514,7 @@ def sponsor_register():
                         if len(image_data) > MAX_IMAGE_SIZE:
                             flash("Image file is too large. Maximum size is 5MB.", "danger")
                             return render_template("sponsor_register.html", form=form, access_codes_configured=True)
-                        sponsor.profile_image = base64.b64encode(image_data).decode('utf-8')
+                        set_profile_image(sponsor, image_data)
             except Exception as e:
                 app.logger.warning(f"Sponsor image upload skipped: {e}")
 
@@ -1745,6 +3588,12 @@ def sponsor_login():
             form.email.data = prefill_email
     if form.validate_on_submit():
         email = normalize_email(form.email.data)
+        retry_after = (
+            hit_rate_limit("sponsor_login", rate_limit_key_ip(), "RATELIMIT_LOGIN_PER_IP")
+            or hit_rate_limit("sponsor_login", rate_limit_key_email(email), "RATELIMIT_LOGIN_PER_EMAIL")
+        )
+        if retry_after:
+            return rate_limited_page("sponsor_login.html", retry_after, form=form)
         acct = SponsorAccount.query.filter_by(email=email).first()
         if not acct:
             flash("Invalid sponsor email or password.", "danger")
@@ -2033,7 +3882,7 @@ def sponsor_portal():
             file = getattr(form, "profile_image", None).data if getattr(form, "profile_image", None) else None
             has_new_upload = bool(file and hasattr(file, "filename") and (file.filename or "").strip())
             if wants_remove and not has_new_upload:
-                sponsor.profile_image = None
+                clear_profile_image(sponsor)
         except Exception:
             pass
 
@@ -2048,7 +3897,7 @@ def sponsor_portal():
                     if len(image_data) > MAX_IMAGE_SIZE:
                         flash("Image file is too large. Maximum size is 5MB.", "danger")
                         return redirect(url_for("sponsor_portal"))
-                    sponsor.profile_image = base64.b64encode(image_data).decode('utf-8')
+                    set_profile_image(sponsor, image_data)
         except Exception as e:
             app.logger.warning(f"Sponsor image update skipped: {e}")
 
@@ -2088,6 +3937,7 @@ def sponsor_delete_account():
         # Delete sponsor login + sponsor profile
         db.session.delete(acct)
         if sponsor:
+            clear_profile_image(sponsor)
             db.session.delete(sponsor)
         db.session.commit()
     except Exception:
@@ -2193,30 +4043,18 @@ def sponsor_request(sponsor_id: int):
 
 @app.route("/sponsor/image/<int:sponsor_id>")
 def sponsor_image(sponsor_id: int):
-    """Serve sponsor bio image from database (base64)."""
+    """Serve sponsor bio image from the image store."""
     sponsor = Sponsor.query.get_or_404(sponsor_id)
-    if sponsor.profile_image:
-        try:
-            image_data = base64.b64decode(sponsor.profile_image)
-            # Best-effort content-type detection (so PNG/GIF/WEBP render correctly)
-            mimetype = "application/octet-stream"
-            if len(image_data) >= 12:
-                if image_data.startswith(b"\xff\xd8\xff"):
-                    mimetype = "image/jpeg"
-                elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
-                    mimetype = "image/png"
-                elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
-                    mimetype = "image/gif"
-                elif image_data[0:4] == b"RIFF" and image_data[8:12] == b"WEBP":
-                    mimetype = "image/webp"
-            return Response(image_data, mimetype=mimetype)
-        except Exception as e:
-            app.logger.error(f"Error decoding sponsor image for sponsor {sponsor_id}: {e}")
-            return "", 404
-    return "", 404
+    try:
+        response = send_profile_image(sponsor)
+    except Exception as e:
+        app.logger.error(f"Error loading sponsor image for sponsor {sponsor_id}: {e}")
+        return "", 404
+    return response if response is not None else ("", 404)
 
 
 @app.route("/api/sponsor/validate-key", methods=["POST"])
+@rate_limited("sponsor_validate_key", "RATELIMIT_KEY_CHECKS")
 def api_validate_sponsor_key():
     """Validate Sponsor BP Key used to unlock sponsor registration form."""
     try:
@@ -2241,6 +4079,7 @@ def api_validate_sponsor_key():
 
 
 @app.route("/api/sponsor/prefill", methods=["POST"])
+@rate_limited("sponsor_prefill", "RATELIMIT_KEY_CHECKS")
 def api_sponsor_prefill():
     """Prefill sponsor sign-up fields from chairperson data (requires valid sponsor key)."""
     try:
@@ -2293,8 +4132,8 @@ def meetings_today():
     today = get_eastern_today()
     meetings = (
         Meeting.query
-        .filter(Meeting.event_date == today)
-        .order_by(Meeting.start_time.asc())
+        .filter(meetings_on_eastern_days(today))
+        .order_by(Meeting.start_time.asc(), Meeting.id.asc())
         .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
         .all()
     )
@@ -2310,49 +4149,7 @@ def calendar_view():
     month = int(request.args.get("month", today.month))
     q = (request.args.get("q", "") or "").strip().lower()
 
-    # Get all meetings for the month
-    start_date = date(year, month, 1)
-    # Compute last day of month
-    _, last_day = calendar.monthrange(year, month)
-    end_date = date(year, month, last_day)
-
-    meetings = (
-        Meeting.query
-        .filter(Meeting.event_date >= start_date, Meeting.event_date <= end_date)
-        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
-        .all()
-    )
-
-    # Apply simple search filter (title or chair name)
-    if q:
-        def _matches(m):
-            title_match = q in (m.title or "").lower()
-            chair_name = (
-                m.chair_signup.display_name_snapshot if m.chair_signup else ""
-            )
-            chair_match = q in chair_name.lower()
-            return title_match or chair_match
-        meetings = [m for m in meetings if _matches(m)]
-
-    # Map meetings by date
-    meetings_by_date = {}
-    for m in meetings:
-        meetings_by_date.setdefault(m.event_date, []).append(m)
-
-    # Build weeks for the month
-    cal = calendar.Calendar(firstweekday=6)  # Sunday start
-    weeks = []
-    for week in cal.monthdatescalendar(year, month):
-        week_cells = []
-        for d in week:
-            in_month = d.month == month
-            week_cells.append({
-                "date": d if in_month else None,  # hide out-of-month day number
-                "in_month": in_month,
-                "meetings": meetings_by_date.get(d, []) if in_month else [],
-            })
-        weeks.append(week_cells)
+    weeks = get_calendar_month_snapshot(year, month, q)
 
     # Previous/next month links
     prev_month = month - 1
@@ -2389,35 +4186,7 @@ def calendar_display():
     year = today.year
     month = today.month
 
-    # Build month data (reuse logic from calendar_view)
-    start_date = date(year, month, 1)
-    _, last_day = calendar.monthrange(year, month)
-    end_date = date(year, month, last_day)
-
-    meetings = (
-        Meeting.query
-        .filter(Meeting.event_date >= start_date, Meeting.event_date <= end_date)
-        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
-        .all()
-    )
-
-    meetings_by_date = {}
-    for m in meetings:
-        meetings_by_date.setdefault(m.event_date, []).append(m)
-
-    cal = calendar.Calendar(firstweekday=6)
-    weeks = []
-    for week in cal.monthdatescalendar(year, month):
-        week_cells = []
-        for d in week:
-            in_month = d.month == month
-            week_cells.append({
-                "date": d if in_month else None,
-                "in_month": in_month,
-                "meetings": meetings_by_date.get(d, []) if in_month else [],
-            })
-        weeks.append(week_cells)
+    weeks = get_calendar_month_snapshot(year, month)
 
     # prev/next computed but not shown
     prev_month = month - 1
@@ -2452,6 +4221,11 @@ def calendar_month_ics():
     year = int(request.args.get("year", today.year))
     month = int(request.args.get("month", today.month))
 
+    etag, last_modified = ics_feed_validators("month", year, month)
+    not_modified = ics_not_modified(etag, last_modified)
+    if not_modified:
+        return not_modified
+
     start_date = date(year, month, 1)
     _, last_day = calendar.monthrange(year, month)
     end_date = date(year, month, last_day)
@@ -2460,32 +4234,19 @@ def calendar_month_ics():
         Meeting.query
         .filter(Meeting.event_date >= start_date, Meeting.event_date <= end_date)
         .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
+        .options(db.joinedload(Meeting.chair_signup))
         .all()
     )
 
-    cal = Calendar()
-    cal.add('prodid', '-//Back Porch Meetings//backporchmeetings.org//')
-    cal.add('version', '2.0')
-    cal.add('x-wr-calname', f'Back Porch Chairperson Calendar - {calendar.month_name[month]} {year}')
+    ics_bytes = build_meetings_ics(
+        meetings,
+        calname=f'Back Porch Chairperson Calendar - {calendar.month_name[month]} {year}',
+    )
 
-    for m in meetings:
-        event = Event()
-        start_dt = datetime.combine(m.event_date, m.start_time)
-        end_dt = datetime.combine(m.event_date, m.end_time) if m.end_time else start_dt + timedelta(hours=1)
-        event.add('summary', m.title)
-        event.add('dtstart', start_dt)
-        event.add('dtend', end_dt)
-        event.add('location', m.zoom_link or 'Online')
-        event.add('description', f"{m.description or ''}\n\nChair: {m.chair_signup.display_name_snapshot + ' (' + m.chair_signup.user.bp_id + ')' if m.chair_signup else 'No chair yet'}")
-        event.add('url', url_for('meeting_detail', meeting_id=m.id, _external=True))
-        event.add('uid', f"meeting-{m.id}@backporchmeetings.org")
-        cal.add_component(event)
-
-    response = make_response(cal.to_ical())
+    response = make_response(ics_bytes)
     response.headers['Content-Type'] = 'text/calendar; charset=utf-8'
     response.headers['Content-Disposition'] = f'attachment; filename=backporch-calendar-{year}-{month}.ics'
-    return response
+    return set_ics_validators(response, etag, last_modified)
 
 
 @app.route("/calendar/day-ics")
@@ -2502,36 +4263,28 @@ def calendar_day_ics():
     else:
         event_date = today
 
+    etag, last_modified = ics_feed_validators("day", event_date.isoformat())
+    not_modified = ics_not_modified(etag, last_modified)
+    if not_modified:
+        return not_modified
+
     meetings = (
         Meeting.query
         .filter(Meeting.event_date == event_date)
         .order_by(Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
+        .options(db.joinedload(Meeting.chair_signup))
         .all()
     )
 
-    cal = Calendar()
-    cal.add('prodid', '-//Back Porch Meetings//backporchmeetings.org//')
-    cal.add('version', '2.0')
-    cal.add('x-wr-calname', f'Back Porch Meetings - {event_date.strftime("%B %d, %Y")}')
+    ics_bytes = build_meetings_ics(
+        meetings,
+        calname=f'Back Porch Meetings - {event_date.strftime("%B %d, %Y")}',
+    )
 
-    for m in meetings:
-        event = Event()
-        start_dt = datetime.combine(m.event_date, m.start_time)
-        end_dt = datetime.combine(m.event_date, m.end_time) if m.end_time else start_dt + timedelta(hours=1)
-        event.add('summary', m.title)
-        event.add('dtstart', start_dt)
-        event.add('dtend', end_dt)
-        event.add('location', m.zoom_link or 'Online')
-        event.add('description', f"{m.description or ''}\n\nChair: {m.chair_signup.display_name_snapshot + ' (' + m.chair_signup.user.bp_id + ')' if m.chair_signup else 'No chair yet'}")
-        event.add('url', url_for('meeting_detail', meeting_id=m.id, _external=True))
-        event.add('uid', f"meeting-{m.id}@backporchmeetings.org")
-        cal.add_component(event)
-
-    response = make_response(cal.to_ical())
+    response = make_response(ics_bytes)
     response.headers['Content-Type'] = 'text/calendar; charset=utf-8'
     response.headers['Content-Disposition'] = f'attachment; filename=backporch-{event_date.strftime("%Y-%m-%d")}.ics'
-    return response
+    return set_ics_validators(response, etag, last_modified)
 
 
 @app.route("/meeting/<int:meeting_id>", methods=["GET", "POST"])
@@ -2575,6 +4328,7 @@ def meeting_detail(meeting_id):
             )
             db.session.add(signup)
             db.session.commit()
+            invalidate_meeting_caches()
             
             # Send confirmation email immediately
             try:
@@ -2585,13 +4339,14 @@ def meeting_detail(meeting_id):
             
             # Schedule reminder email 24 hours before meeting (only in development)
             if scheduler:
-                reminder_time = datetime.combine(meeting.event_date, meeting.start_time) - timedelta(hours=24)
-                if reminder_time > datetime.now():
+                reminder_time = meeting.starts_at_utc.replace(tzinfo=timezone.utc) - timedelta(hours=24)
+                if reminder_time > datetime.now(timezone.utc):
                     scheduler.add_job(
                         send_chair_reminder,
                         'date',
                         run_date=reminder_time,
                         args=[meeting.id],
+                        kwargs={'once': True},
                         id=f"reminder-{meeting.id}",
                         replace_existing=True
                     )
@@ -2633,9 +4388,9 @@ def cancel_chair_signup(meeting_id):
         db.session.delete(signup)
         db.session.commit()
         
-        # Clear cache to ensure dashboard and calendar reflect the change
+        # Make sure the dashboard and calendar reflect the change
         try:
-            cache.clear()
+            invalidate_meeting_caches()
         except Exception as cache_error:
             app.logger.warning(f"Failed to clear cache: {cache_error}")
         
@@ -2651,38 +4406,24 @@ def cancel_chair_signup(meeting_id):
 @app.route("/calendar.ics")
 def calendar_ics():
     """Export meetings as iCal calendar feed."""
-    meetings = (
+    etag, last_modified = ics_feed_validators("upcoming", depends_on_today=True)
+    not_modified = ics_not_modified(etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    meetings = iter_query_batched(
         Meeting.query
         .filter(Meeting.event_date >= date.today())
-        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
-        .all()
+        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc(), Meeting.id.asc())
+        .options(db.joinedload(Meeting.chair_signup))
     )
-    
-    cal = Calendar()
-    cal.add('prodid', '-//Back Porch Meetings//backporchmeetings.org//')
-    cal.add('version', '2.0')
-    cal.add('x-wr-calname', 'Back Porch Chairperson Calendar')
-    
-    for m in meetings:
-        event = Event()
-        start_dt = datetime.combine(m.event_date, m.start_time)
-        end_dt = datetime.combine(m.event_date, m.end_time) if m.end_time else start_dt + timedelta(hours=1)
-        
-        event.add('summary', m.title)
-        event.add('dtstart', start_dt)
-        event.add('dtend', end_dt)
-        event.add('location', m.zoom_link or 'Online')
-        event.add('description', f"{m.description or ''}\n\nChair: {m.chair_signup.display_name_snapshot + ' (' + m.chair_signup.user.bp_id + ')' if m.chair_signup else 'No chair yet'}")
-        event.add('url', url_for('meeting_detail', meeting_id=m.id, _external=True))
-        event.add('uid', f"meeting-{m.id}@backporchmeetings.org")
-        
-        cal.add_component(event)
-    
-    response = make_response(cal.to_ical())
-    response.headers['Content-Type'] = 'text/calendar; charset=utf-8'
-    response.headers['Content-Disposition'] = 'attachment; filename=backporch-calendar.ics'
-    return response
+
+    response = streaming_download(
+        iter_ics_chunks(meetings, calname='Back Porch Chairperson Calendar'),
+        'text/calendar; charset=utf-8',
+        'backporch-calendar.ics',
+    )
+    return set_ics_validators(response, etag, last_modified)
 
 
 @app.route("/my-calendar.ics")
@@ -2692,6 +4433,11 @@ def my_calendar_ics():
     user = get_current_user()
     if not user:
         abort(403)
+
+    etag, last_modified = ics_feed_validators("mine", user.id, user.display_name, depends_on_today=True)
+    not_modified = ics_not_modified(etag, last_modified, cache_control="private, no-cache")
+    if not_modified:
+        return not_modified
     
     # Get meetings where this user is the chair
     my_meetings = (
@@ -2705,44 +4451,16 @@ def my_calendar_ics():
         .all()
     )
     
-    cal = Calendar()
-    cal.add('prodid', '-//Back Porch Meetings//backporchmeetings.org//')
-    cal.add('version', '2.0')
-    cal.add('x-wr-calname', f'My Back Porch Meetings - {user.display_name}')
-    
-    for m in my_meetings:
-        event = Event()
-        start_dt = datetime.combine(m.event_date, m.start_time)
-        end_dt = datetime.combine(m.event_date, m.end_time) if m.end_time else start_dt + timedelta(hours=1)
-        
-        event.add('summary', f"Chair: {m.title}")
-        event.add('dtstart', start_dt)
-        event.add('dtend', end_dt)
-        event.add('location', m.zoom_link or 'Online')
-        event.add('description', f"You are chairing this meeting.\n\n{m.description or ''}")
-        event.add('url', url_for('meeting_detail', meeting_id=m.id, _external=True))
-        event.add('uid', f"my-meeting-{m.id}@backporchmeetings.org")
-        
-        # Add reminder 24 hours before
-        alarm = Alarm()
-        alarm.add('action', 'DISPLAY')
-        alarm.add('description', f'Reminder: You are chairing {m.title} tomorrow')
-        alarm.add('trigger', timedelta(hours=-24))
-        event.add_component(alarm)
-        
-        # Add reminder 1 hour before
-        alarm2 = Alarm()
-        alarm2.add('action', 'DISPLAY')
-        alarm2.add('description', f'Reminder: You are chairing {m.title} in 1 hour')
-        alarm2.add('trigger', timedelta(hours=-1))
-        event.add_component(alarm2)
-        
-        cal.add_component(event)
-    
-    response = make_response(cal.to_ical())
+    ics_bytes = build_meetings_ics(
+        my_meetings,
+        variant="mine",
+        calname=f'My Back Porch Meetings - {user.display_name}',
+    )
+
+    response = make_response(ics_bytes)
     response.headers['Content-Type'] = 'text/calendar; charset=utf-8'
     response.headers['Content-Disposition'] = f'attachment; filename=my-backporch-meetings.ics'
-    return response
+    return set_ics_validators(response, etag, last_modified, cache_control="private, no-cache")
 
 
 @app.route("/calendar/google-add/<int:meeting_id>")
@@ -2758,12 +4476,13 @@ def google_calendar_add(meeting_id):
         return redirect(url_for('meeting_detail', meeting_id=meeting_id))
     
     # Format for Google Calendar URL
-    start_dt = datetime.combine(meeting.event_date, meeting.start_time)
-    end_dt = datetime.combine(meeting.event_date, meeting.end_time) if meeting.end_time else start_dt + timedelta(hours=1)
+    start_dt, end_dt = meeting.starts_at_utc, meeting.ends_at_utc
+    if start_dt is None or end_dt is None:
+        start_dt, end_dt = meeting_utc_instants(meeting.event_date, meeting.start_time, meeting.end_time)
     
     # Google Calendar date format: YYYYMMDDTHHMMSSZ
-    start_str = start_dt.strftime('%Y%m%dT%H%M%S')
-    end_str = end_dt.strftime('%Y%m%dT%H%M%S')
+    start_str = start_dt.strftime('%Y%m%dT%H%M%SZ')
+    end_str = end_dt.strftime('%Y%m%dT%H%M%SZ')
     
     title = f"Chair: {meeting.title}"
     details = f"You are chairing this Back Porch meeting.\n\n{meeting.description or ''}\n\nMeeting Link: {meeting.zoom_link or 'TBD'}"
@@ -3001,6 +4720,13 @@ def login():
     form = LoginForm()
     if form.validate_on_submit():
         email = normalize_email(form.email.data)
+        # Throttle before the user lookup and password hash check
+        retry_after = (
+            hit_rate_limit("login", rate_limit_key_ip(), "RATELIMIT_LOGIN_PER_IP")
+            or hit_rate_limit("login", rate_limit_key_email(email), "RATELIMIT_LOGIN_PER_EMAIL")
+        )
+        if retry_after:
+            return rate_limited_page("login.html", retry_after, form=form)
         user = User.query.filter_by(email=email).first()
 
         # Security configuration (configurable to reduce mobile lockout pain)
@@ -3037,14 +4763,13 @@ def login():
                 user.last_login = datetime.utcnow()
                 user.failed_login_attempts = 0  # Reset failed attempts
                 user.locked_until = None
-                db.session.commit()
-                
                 log_audit_event('login_success', user.id, details={
                     'email': email,
                     'user_agent': (request.headers.get('User-Agent') or '')[:200],
                     'compat_password_normalization_used': bool(allow_trim and (raw_password != raw_password.strip() or raw_password != strip_zero_width(raw_password))),
                     'session_id_set': bool(session.get('user_id')),
-                })
+                }, commit=False)
+                db.session.commit()
 
                 if allow_trim and (not password_ok_direct) and raw_password != raw_password.strip():
                     # Gentle hint: this is a common mobile autofill issue.
@@ -3070,7 +4795,6 @@ def login():
                     should_lock = True
 
                 if should_lock and lock_minutes > 0:
-                    user.lock_account(lock_minutes)
                     log_audit_event('account_locked', user.id, details={
                         'email': email,
                         'failed_attempts': user.failed_login_attempts,
@@ -3078,10 +4802,10 @@ def login():
                         'user_agent': (request.headers.get('User-Agent') or '')[:200],
                         'password_length': len(raw_password),
                         'password_had_outer_whitespace': raw_password != raw_password.strip(),
-                    })
+                    }, commit=False)
+                    user.lock_account(lock_minutes)
                     flash(f"Account locked due to too many failed login attempts. Please try again in {lock_minutes} minutes.", "danger")
                 else:
-                    db.session.commit()
                     log_audit_event('login_failure', user.id, details={
                         'email': email,
                         'failed_attempts': user.failed_login_attempts,
@@ -3089,7 +4813,8 @@ def login():
                         'user_agent': (request.headers.get('User-Agent') or '')[:200],
                         'password_length': len(raw_password),
                         'password_had_outer_whitespace': raw_password != raw_password.strip(),
-                    })
+                    }, commit=False)
+                    db.session.commit()
                     if enable_lockout and max_attempts > 0:
                         remaining = max(0, max_attempts - user.failed_login_attempts)
                         flash(f"Invalid password. {remaining} attempts remaining.", "danger")
@@ -3270,7 +4995,14 @@ def reset_password(token: str):
     return render_template("reset_password.html", form=form)
 
 # API: validate registration unlock key
+def _registration_key_rate_limited(retry_after):
+    resp = jsonify({"ok": False, "reason": "rate_limited"})
+    resp.headers["Retry-After"] = str(retry_after)
+    return resp
+
+
 @app.route("/api/registration/validate-key", methods=["POST"])
+@rate_limited("registration_validate_key", "RATELIMIT_KEY_CHECKS", on_limit=_registration_key_rate_limited)
 def api_validate_registration_key():
     # IMPORTANT: Always return 200 for this endpoint so the frontend can "fail closed"
     # without treating it as a network/server error.
@@ -3366,7 +5098,7 @@ def dashboard():
                         if len(image_data) > MAX_IMAGE_SIZE:
                             flash("Image file is too large. Maximum size is 5MB.", "danger")
                             return redirect(url_for("dashboard"))
-                        user.profile_image = base64.b64encode(image_data).decode("utf-8")
+                        set_profile_image(user, image_data)
                 db.session.commit()
                 flash("Profile updated successfully!", "success")
             except Exception as e:
@@ -3375,27 +5107,35 @@ def dashboard():
                 flash(f"Error updating profile: {str(e)}", "danger")
             return redirect(url_for("dashboard"))
         
+        # Service totals come from user_service_stats (split at the Eastern date);
+        # only the meetings actually listed are loaded
+        today = ensure_user_service_stats_current()
+        service = db.session.get(UserServiceStat, user.id)
+
         # Get user's meetings - use explicit SELECT with proper joins
         # Only get meetings where ChairSignup.user_id matches current user
-        all_meetings = (
+        user_meetings = (
             db.session.query(Meeting)
             .select_from(Meeting)
             .join(ChairSignup, Meeting.id == ChairSignup.meeting_id)
             .filter(ChairSignup.user_id == user.id)
             .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
+        )
+        future_meetings = (
+            user_meetings.filter(Meeting.event_date >= today)
             .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
             .all()
         )
+        past_meetings = list(reversed(
+            user_meetings.filter(Meeting.event_date < today)
+            .order_by(Meeting.event_date.desc(), Meeting.start_time.desc())
+            .limit(10)
+            .all()
+        ))
         
-        # Debug logging
-        app.logger.info(f"Dashboard for user {user.id} ({user.email}): Found {len(all_meetings)} total meetings")
-        for m in all_meetings:
-            app.logger.info(f"  - Meeting {m.id}: {m.title} on {m.event_date}")
-        
-        # Separate today's, upcoming, and past meetings
-        todays_meetings = [m for m in all_meetings if m.event_date == today]
-        upcoming_meetings = [m for m in all_meetings if m.event_date > today]
-        past_meetings = [m for m in all_meetings if m.event_date < today]
+        # Separate today's and upcoming meetings
+        todays_meetings = [m for m in future_meetings if m.event_date == today]
+        upcoming_meetings = [m for m in future_meetings if m.event_date > today]
         
         # Combine today's and future meetings for "upcoming commitments" stat
         all_future_meetings = todays_meetings + upcoming_meetings
@@ -3418,14 +5158,12 @@ def dashboard():
             upcoming_availability = []
         
         # Calculate service stats
-        total_meetings_chaired = len(past_meetings)
+        total_meetings_chaired = service.past_chaired if service else 0
         upcoming_commitments = len(all_future_meetings)  # Include today's meetings
         volunteer_signups = len(upcoming_availability)
         
-        # Calculate recent meetings (last 30 days)
-        recent_cutoff = today - timedelta(days=30)
-        recent_meetings = [m for m in past_meetings if m.event_date >= recent_cutoff]
-        recent_meetings_count = len(recent_meetings)
+        # Recent meetings (last 30 days)
+        recent_meetings_count = service.last_30d if service else 0
         
         # Get recent open meetings that need chairs
         try:
@@ -3455,144 +5193,7 @@ def dashboard():
         admin_charts = None
         if user.is_admin:
             try:
-                # Count all registered hosts (non-admin users)
-                total_hosts = User.query.filter_by(is_admin=False, is_active=True).count()
-                
-                # Count current chairs (meetings from today going forward that have chair signups)
-                current_chairs = (
-                    db.session.query(Meeting)
-                    .filter(
-                        Meeting.event_date >= today,
-                        Meeting.chair_signup.has()
-                    )
-                    .count()
-                )
-                
-                # Count future chairs needed (meetings from today going forward)
-                future_chairs_needed = (
-                    Meeting.query
-                    .filter(Meeting.event_date >= today)
-                    .count()
-                )
-                
-                # Calculate percentage of completed chairs
-                chair_completion_percent = 0
-                if future_chairs_needed > 0:
-                    chair_completion_percent = round((current_chairs / future_chairs_needed) * 100, 1)
-                
-                admin_stats = {
-                    'total_hosts': total_hosts,
-                    'current_chairs': current_chairs,
-                    'future_chairs_needed': future_chairs_needed,
-                    'chair_completion_percent': chair_completion_percent,
-                    'unfilled_chairs': future_chairs_needed - current_chairs
-                }
-                
-                # Calculate chart data for last 30 days
-                last_30_days = today - timedelta(days=30)
-                
-                # Men's meetings coverage (last 30 days)
-                mens_total = Meeting.query.filter(
-                    Meeting.event_date >= last_30_days,
-                    Meeting.event_date <= today,
-                    Meeting.gender_restriction == 'men'
-                ).count()
-                
-                mens_filled = db.session.query(Meeting).filter(
-                    Meeting.event_date >= last_30_days,
-                    Meeting.event_date <= today,
-                    Meeting.gender_restriction == 'men',
-                    Meeting.chair_signup.has()
-                ).count()
-                
-                # Women's meetings coverage (last 30 days)
-                womens_total = Meeting.query.filter(
-                    Meeting.event_date >= last_30_days,
-                    Meeting.event_date <= today,
-                    Meeting.gender_restriction == 'women'
-                ).count()
-                
-                womens_filled = db.session.query(Meeting).filter(
-                    Meeting.event_date >= last_30_days,
-                    Meeting.event_date <= today,
-                    Meeting.gender_restriction == 'women',
-                    Meeting.chair_signup.has()
-                ).count()
-                
-                # All meetings coverage (last 30 days)
-                all_total = Meeting.query.filter(
-                    Meeting.event_date >= last_30_days,
-                    Meeting.event_date <= today
-                ).count()
-                
-                all_filled = db.session.query(Meeting).filter(
-                    Meeting.event_date >= last_30_days,
-                    Meeting.event_date <= today,
-                    Meeting.chair_signup.has()
-                ).count()
-                
-                # Weekly trend data (last 4 weeks)
-                weekly_data = []
-                for week in range(4):
-                    week_start = today - timedelta(days=(week + 1) * 7)
-                    week_end = today - timedelta(days=week * 7)
-                    
-                    week_total = Meeting.query.filter(
-                        Meeting.event_date >= week_start,
-                        Meeting.event_date < week_end
-                    ).count()
-                    
-                    week_filled = db.session.query(Meeting).filter(
-                        Meeting.event_date >= week_start,
-                        Meeting.event_date < week_end,
-                        Meeting.chair_signup.has()
-                    ).count()
-                    
-                    weekly_data.insert(0, {
-                        'week': f'Week {4-week}',
-                        'total': week_total,
-                        'filled': week_filled,
-                        'percent': round((week_filled / week_total * 100) if week_total > 0 else 0, 1)
-                    })
-                
-                # User participation percentages (top 10)
-                user_participation = []
-                users = User.query.filter_by(is_admin=False).all()
-                
-                for u in users:
-                    user_total = db.session.query(Meeting).join(ChairSignup).filter(
-                        ChairSignup.user_id == u.id
-                    ).count()
-                    
-                    if user_total > 0:
-                        user_participation.append({
-                            'name': u.display_name,
-                            'count': user_total,
-                            'percent': round((user_total / all_total * 100) if all_total > 0 else 0, 1)
-                        })
-                
-                user_participation.sort(key=lambda x: x['count'], reverse=True)
-                user_participation = user_participation[:10]
-                
-                admin_charts = {
-                    'mens_coverage': {
-                        'filled': mens_filled,
-                        'unfilled': mens_total - mens_filled,
-                        'percent': round((mens_filled / mens_total * 100) if mens_total > 0 else 0, 1)
-                    },
-                    'womens_coverage': {
-                        'filled': womens_filled,
-                        'unfilled': womens_total - womens_filled,
-                        'percent': round((womens_filled / womens_total * 100) if womens_total > 0 else 0, 1)
-                    },
-                    'overall_coverage': {
-                        'filled': all_filled,
-                        'unfilled': all_total - all_filled,
-                        'percent': round((all_filled / all_total * 100) if all_total > 0 else 0, 1)
-                    },
-                    'weekly_trend': weekly_data,
-                    'user_participation': user_participation
-                }
+                admin_stats, admin_charts = get_admin_dashboard_stats(today)
                 
                 app.logger.info(f"Admin stats: {admin_stats}")
                 app.logger.info(f"Admin charts: {admin_charts}")
@@ -3636,9 +5237,12 @@ def dashboard():
 def dashboard_refresh():
     """Refresh dashboard by clearing cache and reloading data."""
     try:
-        # Clear all cached data
+        # Only this user's entries (and the admin statistics for admins) go stale
         try:
-            cache.clear()
+            user = get_current_user()
+            clear_dashboard_cache(user.id)
+            if user.is_admin:
+                bump_cache_generation("analytics")
         except Exception as cache_error:
             app.logger.warning(f"Failed to clear cache: {cache_error}")
         flash("Dashboard data refreshed!", "success")
@@ -3707,72 +5311,77 @@ def debug_my_signups():
     return jsonify(debug_info)
 
 
-@cache.memoize(timeout=180)  # Cache for 3 minutes
 def get_open_meetings_cached():
     """Get open meetings that need chairs - cached for performance."""
     today = date.today()
-    
-    return (
-        Meeting.query
-        .filter(
-            Meeting.event_date >= today,
-            Meeting.event_date <= today + timedelta(days=30),
-            Meeting.is_open == True,
-            ~Meeting.chair_signup.has()
+
+    def build():
+        return (
+            Meeting.query
+            .filter(
+                Meeting.event_date >= today,
+                Meeting.event_date <= today + timedelta(days=30),
+                Meeting.is_open == True,
+                ~Meeting.chair_signup.has()
+            )
+            .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
+            .limit(20)  # Reasonable limit
+            .all()
         )
-        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .limit(20)  # Reasonable limit
-        .all()
-    )
+
+    return cached_value(("meetings",), f"open_meetings:{today.isoformat()}", build, timeout=180)
 
 
-@cache.memoize(timeout=600)  # Cache for 10 minutes
 def get_meeting_stats_cached():
     """Get meeting statistics - cached for performance."""
     today = date.today()
-    
-    # Use more efficient count queries
-    total_meetings = Meeting.query.count()
-    upcoming_meetings = Meeting.query.filter(Meeting.event_date >= today).count()
-    need_chairs = Meeting.query.filter(
-        Meeting.event_date >= today,
-        Meeting.is_open == True,
-        ~Meeting.chair_signup.has()
-    ).count()
-    
-    return {
-        'total_meetings': total_meetings,
-        'upcoming_meetings': upcoming_meetings,
-        'need_chairs': need_chairs
-    }
+
+    def build():
+        # Use more efficient count queries
+        total_meetings = Meeting.query.count()
+        upcoming_meetings = Meeting.query.filter(Meeting.event_date >= today).count()
+        need_chairs = Meeting.query.filter(
+            Meeting.event_date >= today,
+            Meeting.is_open == True,
+            ~Meeting.chair_signup.has()
+        ).count()
+        return {
+            'total_meetings': total_meetings,
+            'upcoming_meetings': upcoming_meetings,
+            'need_chairs': need_chairs
+        }
+
+    return cached_value(("meetings",), f"meeting_stats:{today.isoformat()}", build, timeout=600)
 
 
-@cache.memoize(timeout=1800)  # Cache for 30 minutes
-def get_analytics_data_cached():
-    """Get analytics data for admin dashboard - cached for performance."""
-    # This would contain the heavy analytics queries
-    # Moved from admin_analytics route for better performance
-    pass
+def get_admin_dashboard_stats(today=None):
+    """Admin dashboard stats/charts, cached per day and meetings/analytics generation.
+
+    Renamed chairs do not bump either generation, so entries also expire after
+    ADMIN_STATS_CACHE_SECONDS.
+    """
+    today = today or date.today()
+    return cached_value(
+        ("meetings", "analytics"), f"admin_dashboard_stats:{today.isoformat()}",
+        lambda: compute_admin_dashboard(db.session, Meeting, ChairSignup, User, today, DailyStat=MeetingDailyStat),
+        timeout=app.config.get("ADMIN_STATS_CACHE_SECONDS", 300),
+    )
 
 
 # Cache busting function for when data changes
 def clear_dashboard_cache(user_id=None):
-    """Clear dashboard cache when meetings change."""
+    """Mark one user's cached data as stale, or every user's and the admin analytics."""
     if user_id:
-        # Clear specific user's cache
-        today = date.today()
-        cache.delete(f"dashboard_data_{user_id}_{today.isoformat()}")
+        bump_cache_generation(user_cache_namespace(user_id))
     else:
-        # Clear all dashboard caches (less efficient but thorough)
-        cache.clear()
+        bump_cache_generation("users")
+        bump_cache_generation("analytics")
 
 
 # Cache busting when meetings are modified
 def invalidate_meeting_caches():
     """Invalidate all meeting-related caches."""
-    cache.delete_memoized(get_open_meetings_cached)
-    cache.delete_memoized(get_meeting_stats_cached)
-    cache.delete_memoized(get_analytics_data_cached)
+    bump_meetings_data_version()
 
 
 class ProfileForm(FlaskForm):
@@ -3883,7 +5492,7 @@ def profile():
                 user.display_name = form.display_name.data.strip()
                 user.gender = form.gender.data or None
                 
-                # Handle profile image upload - store as base64 in database
+                # Handle profile image upload - stored in the image_blobs table
                 if form.profile_image.data:
                     file = form.profile_image.data
                     if file and allowed_file(file.filename):
@@ -3893,8 +5502,7 @@ def profile():
                         if len(image_data) > 5 * 1024 * 1024:
                             flash("Image file is too large. Maximum size is 5MB.", "danger")
                             return redirect(url_for("profile"))
-                        # Encode to base64 and store as text
-                        user.profile_image = base64.b64encode(image_data).decode('utf-8')
+                        set_profile_image(user, image_data)
                 
                 db.session.commit()
                 flash("Profile updated.", "success")
@@ -3936,9 +5544,9 @@ def profile():
 def profile_refresh():
     """Refresh profile by clearing cache and reloading data."""
     try:
-        # Clear all cached data
+        # Only this user's entries go stale
         try:
-            cache.clear()
+            clear_dashboard_cache(get_current_user().id)
         except Exception as cache_error:
             app.logger.warning(f"Failed to clear cache: {cache_error}")
         flash("Profile data refreshed!", "success")
@@ -3951,20 +5559,18 @@ def profile_refresh():
 
 @app.route("/profile/image/<int:user_id>")
 def profile_image(user_id):
-    """Serve profile image from database."""
+    """Serve profile image from the image store."""
     user = User.query.get_or_404(user_id)
-    if user.profile_image:
-        try:
-            # Decode base64 image data
-            image_data = base64.b64decode(user.profile_image)
-            # Default to jpeg since we're not storing type
-            return Response(image_data, mimetype='image/jpeg')
-        except Exception as e:
-            app.logger.error(f"Error decoding profile image for user {user_id}: {e}")
-            return "", 404
-    else:
+    try:
+        # Default to jpeg when the type can't be sniffed (historical behaviour)
+        response = send_profile_image(user, default_mimetype='image/jpeg')
+    except Exception as e:
+        app.logger.error(f"Error loading profile image for user {user_id}: {e}")
+        return "", 404
+    if response is None:
         # Return a default placeholder image or 404
         return "", 404
+    return response
 
 
 @app.route("/change-password", methods=["GET", "POST"])
@@ -4457,6 +6063,64 @@ def generate_standard_certificate(user, attempt):
     return buffer
 
 
+# Decoded template and fonts stay in memory; PDFs are stored per cache key
+certificate_renderer = CertificateRenderer(os.path.join(app.root_path, 'static', 'img', 'certificate_template.png'))
+# More workers than CPUs only adds process overhead to CPU-bound renders
+certificate_export_pool = CertificateExportPool(
+    certificate_renderer, workers=min(app.config.get("CERTIFICATE_EXPORT_WORKERS", 2), os.cpu_count() or 1)
+)
+atexit.register(certificate_export_pool.shutdown, wait=False)
+
+
+def latest_certificate_attempt(attempts):
+    """The most recent passed training quiz attempt; it supplies the certificate details."""
+    return max(
+        (a for a in attempts if a.quiz_id in QUIZZES),
+        key=lambda a: a.completed_at or datetime.min,
+        default=None,
+    )
+
+
+def render_certificate_pdf(user, attempt):
+    """Custom template certificate, or the programmatic one when that's unavailable."""
+    try:
+        pdf = certificate_renderer.render(user.display_name, attempt.completed_at)
+        if pdf is not None:
+            return pdf
+    except Exception as e:
+        app.logger.error(f"Error using custom certificate: {e}")
+    return generate_standard_certificate(user, attempt).getvalue()
+
+
+def load_certificate_pdf(key):
+    row = db.session.query(RenderedCertificate.data).filter(RenderedCertificate.cache_key == key).first()
+    return row.data if row else None
+
+
+def store_certificate_pdf(user_id, key, pdf):
+    """Keep only the user's current certificate; a concurrent render of the same key is fine."""
+    try:
+        RenderedCertificate.query.filter(RenderedCertificate.user_id == user_id).delete()
+        db.session.add(RenderedCertificate(cache_key=key, user_id=user_id, data=pdf))
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f"Could not store certificate for user {user_id}: {e}")
+
+
+def certificate_response(pdf, key, user):
+    response = make_response(pdf) if pdf is not None else Response(status=304)
+    response.set_etag(key)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    if pdf is not None:
+        response.headers['Content-Type'] = 'application/pdf'
+        filename = f'BP_Certificate_{user.display_name.replace(" ", "_")}.pdf'
+        response.headers['Content-Disposition'] = f'inline; filename={filename}'
+    return response
+
+
 @app.route("/certificate")
 @app.route("/certificate/<int:user_id>")
 @login_required
@@ -4480,155 +6144,48 @@ def quiz_certificate(user_id=None):
             flash("User not found.", "error")
             return redirect(url_for("admin_certificates") if current_user_obj.is_admin else url_for("dashboard"))
     
-    # Check if user has completed BOTH quizzes
-    all_quiz_ids = list(QUIZZES.keys())  # ['registration_quiz', 'hosting_quiz']
-    passed_quizzes = QuizAttempt.query.filter_by(
-        user_id=user.id,
-        passed=True
-    ).filter(QuizAttempt.quiz_id.in_(all_quiz_ids)).all()
-    
-    passed_quiz_ids = set([q.quiz_id for q in passed_quizzes])
-    required_quiz_ids = set(all_quiz_ids)
-    
-    if not required_quiz_ids.issubset(passed_quiz_ids):
-        missing_quizzes = required_quiz_ids - passed_quiz_ids
-        missing_titles = [QUIZZES.get(qid, {}).get('title', qid) for qid in missing_quizzes]
-        flash(f"Certificate not available. All video quizzes must be completed. Still needed: {', '.join(missing_titles)}", "warning")
-        return redirect(url_for("quizzes_list"))
-    
-    # Get the most recent passed attempt for certificate details
-    attempt = QuizAttempt.query.filter_by(
-        user_id=user.id,
-        passed=True
-    ).order_by(QuizAttempt.completed_at.desc()).first()
-    
-    if not attempt:
-        flash("No certificate data found.", "error")
-        return redirect(url_for("quizzes_list"))
-    
-    # Try to use custom certificate image if available
-    cert_image_path = os.path.join(app.root_path, 'static', 'img', 'certificate_template.png')
-    
-    if os.path.exists(cert_image_path):
-        # Use custom certificate image with PIL
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            # Open the certificate template
-            img = Image.open(cert_image_path)
-            draw = ImageDraw.Draw(img)
-            
-            # Get image dimensions
-            img_width, img_height = img.size
-            
-            # ===== CERTIFICATE POSITIONING CONFIGURATION =====
-            # Adjust these percentages to align text with your template's lines
-            # Values are percentages of image height from top (0.0 = top, 1.0 = bottom)
-            NAME_LINE_POSITION = 0.48   # Where the name line appears on your template
-            DATE_LINE_POSITION = 0.78   # Where the date line appears on your template (moved down)
-            PROGRAM_TEXT_POSITION = 0.72  # Additional program text position
-            BP_ID_POSITION = 0.88        # BP ID position (moved down to avoid overlap)
-            # =================================================
-            
-            # Try to load a nice font, fallback to default
-            try:
-                # Try different font sizes for name and date - SIGNIFICANTLY INCREASED FOR LEGIBILITY
-                # Try bold fonts first for better visibility
-                try:
-                    name_font = ImageFont.truetype("arialbd.ttf", 350)  # ~32pt on letter PDF at 300dpi
-                    date_font = ImageFont.truetype("arialbd.ttf", 220)  # ~20pt on letter PDF at 300dpi
-                except:
-                    # Fallback to regular Arial with larger sizes
-                    name_font = ImageFont.truetype("arial.ttf", 350)
-                    date_font = ImageFont.truetype("arial.ttf", 220)
-            except:
-                # Fallback to default font
-                name_font = ImageFont.load_default()
-                date_font = ImageFont.load_default()
-            
-            # Text color (dark, will work on light backgrounds)
-            text_color = (0, 0, 0)  # Black - adjust if needed
-            
-            # NAME LINE - Align text baseline with template line
-            name_text = user.display_name
-            name_bbox = draw.textbbox((0, 0), name_text, font=name_font)
-            name_width = name_bbox[2] - name_bbox[0]
-            name_height = name_bbox[3] - name_bbox[1]
-            name_x = (img_width - name_width) // 2
-            # Position text so bottom of text sits ON the line at NAME_LINE_POSITION
-            name_y = int(img_height * NAME_LINE_POSITION) - name_height
-            draw.text((name_x, name_y), name_text, fill=text_color, font=name_font)
-            
-            # DATE LINE - Align text baseline with template line (positioned on Date line)
-            date_text = attempt.completed_at.strftime('%B %d, %Y')
-            date_bbox = draw.textbbox((0, 0), date_text, font=date_font)
-            date_width = date_bbox[2] - date_bbox[0]
-            date_height = date_bbox[3] - date_bbox[1]
-            date_x = int(img_width * 0.18)  # Position at 18% from left edge (slightly left of center)
-            # Position text so bottom of text sits ON the line at DATE_LINE_POSITION
-            date_y = int(img_height * DATE_LINE_POSITION) - date_height
-            draw.text((date_x, date_y), date_text, fill=text_color, font=date_font)
-            
-            # ADDITIONAL INFO - Not needed, template already has the program information
-            
-            # Convert PIL image to PDF
-            img_buffer = BytesIO()
-            img.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
-            
-            # Create PDF with the image
-            buffer = BytesIO()
-            c = canvas.Canvas(buffer, pagesize=letter)
-            width, height = letter
-            
-            # Calculate scaling to fit letter size while maintaining aspect ratio
-            aspect = img_width / img_height
-            if aspect > (width / height):
-                # Image is wider
-                new_width = width
-                new_height = width / aspect
-            else:
-                # Image is taller
-                new_height = height
-                new_width = height * aspect
-            
-            # Center the image
-            x = (width - new_width) / 2
-            y = (height - new_height) / 2
-            
-            # Draw the image
-            if ImageReader is None:
-                raise RuntimeError(
-                    "Certificate image rendering is unavailable because Pillow/ImageReader could not be imported."
-                )
-            c.drawImage(ImageReader(img_buffer), x, y, width=new_width, height=new_height)
-            
-            c.save()
-            buffer.seek(0)
-            
-        except Exception as e:
-            app.logger.error(f"Error using custom certificate: {e}")
-            # Fall back to generating standard certificate
-            buffer = generate_standard_certificate(user, attempt)
-    else:
-        # No custom image, use standard certificate
-        buffer = generate_standard_certificate(user, attempt)
+    # Check if user has completed BOTH quizzes
+    all_quiz_ids = list(QUIZZES.keys())  # ['registration_quiz', 'hosting_quiz']
+    passed_quizzes = QuizAttempt.query.filter_by(
+        user_id=user.id,
+        passed=True
+    ).filter(QuizAttempt.quiz_id.in_(all_quiz_ids)).all()
+    
+    passed_quiz_ids = set([q.quiz_id for q in passed_quizzes])
+    required_quiz_ids = set(all_quiz_ids)
     
-    # Return PDF as downloadable file
-    response = make_response(buffer.getvalue())
-    response.headers['Content-Type'] = 'application/pdf'
-    filename = f'BP_Certificate_{user.display_name.replace(" ", "_")}.pdf'
-    response.headers['Content-Disposition'] = f'inline; filename={filename}'
+    if not required_quiz_ids.issubset(passed_quiz_ids):
+        missing_quizzes = required_quiz_ids - passed_quiz_ids
+        missing_titles = [QUIZZES.get(qid, {}).get('title', qid) for qid in missing_quizzes]
+        flash(f"Certificate not available. All video quizzes must be completed. Still needed: {', '.join(missing_titles)}", "warning")
+        return redirect(url_for("quizzes_list"))
     
-    return response
+    attempt = latest_certificate_attempt(passed_quizzes)
+
+    key = certificate_renderer.cache_key(user.id, attempt.id, user.display_name)
+    if request.if_none_match.contains(key):
+        return certificate_response(None, key, user)
+    pdf = load_certificate_pdf(key)
+    if pdf is None:
+        pdf = render_certificate_pdf(user, attempt)
+        store_certificate_pdf(user.id, key, pdf)
+    return certificate_response(pdf, key, user)
 
 
 # ==========================
-# EMAIL FUNCTIONS
+# EMAIL OUTBOX
 # ==========================
-
-def send_email(to, subject, body, ical_attachment=None, ical_filename=None):
-    """Send an email using Flask-Mail with optional iCal attachment."""
+# send_email() stores the message in email_outbox and returns; request
+# handlers no longer wait on DreamHost's SMTP server. drain_email_outbox()
+# (worker.py's sender loop, cron_worker.py, or the dev scheduler) sends due
+# rows in batches over one reused SMTP session, under a per-minute cap.
+# Failed sends are retried with exponential backoff and dead-lettered after
+# EMAIL_OUTBOX_MAX_ATTEMPTS; refused recipients are dead-lettered at once.
+# Rows are claimed with a lease, so a crashed sender's batch is picked up
+# again once the lease runs out.
+
+def mail_configured():
+    """True when outgoing mail is configured (never while TESTING)."""
     # Best-effort: if mail isn't configured, do nothing (avoid noisy failures).
     try:
         if app.config.get("TESTING"):
@@ -4640,9 +6197,12 @@ def send_email(to, subject, body, ical_attachment=None, ical_filename=None):
             return False
     except Exception:
         return False
+    return True
 
+
+def build_email_message(to, subject, body, ical_attachment=None, ical_filename=None):
     msg = Message(subject, recipients=[to], body=body)
-    
+
     # Attach iCal file if provided
     if ical_attachment and ical_filename:
         msg.attach(
@@ -4651,77 +6211,272 @@ def send_email(to, subject, body, ical_attachment=None, ical_filename=None):
             ical_attachment,
             headers=[('Content-Class', 'urn:content-classes:calendarmessage')]
         )
-    
+    return msg
+
+
+def enqueue_email(to, subject, body, ical_attachment=None, ical_filename=None, commit=True):
+    """Add an email to the outbox.
+
+    With ``commit=False`` the row joins the caller's transaction, so the email
+    goes out only if the caller's own changes commit.
+    """
+    row = EmailOutbox(
+        recipient=to,
+        subject=subject[:255],
+        body=body,
+        attachment=ical_attachment if ical_attachment and ical_filename else None,
+        attachment_name=ical_filename if ical_attachment and ical_filename else None,
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.session.add(row)
+    if commit:
+        db.session.commit()
+    return row
+
+
+def send_email(to, subject, body, ical_attachment=None, ical_filename=None):
+    """Queue an email (with optional iCal attachment) for the outbox sender.
+
+    Returns True once the message is accepted for delivery. With
+    EMAIL_OUTBOX_ENABLED off it is sent inline through Flask-Mail instead.
+    """
+    if not mail_configured():
+        return False
+
+    if not app.config.get("EMAIL_OUTBOX_ENABLED", True):
+        try:
+            mail.send(build_email_message(to, subject, body, ical_attachment, ical_filename))
+            return True
+        except Exception as e:
+            print(f"Email send failed: {e}")
+            return False
+
     try:
-        mail.send(msg)
+        enqueue_email(to, subject, body, ical_attachment, ical_filename)
         return True
     except Exception as e:
-        print(f"Email send failed: {e}")
+        db.session.rollback()
+        print(f"Email enqueue failed: {e}")
         return False
 
 
+def _outbox_retry_delay(attempts):
+    base = app.config.get("EMAIL_OUTBOX_RETRY_BASE_SECONDS", 60)
+    return min(base * 2 ** max(attempts - 1, 0), app.config.get("EMAIL_OUTBOX_RETRY_MAX_SECONDS", 21600))
+
+
+def claim_email_batch(limit, now=None):
+    """Lease up to ``limit`` due outbox rows to this sender and return them."""
+    now = now or datetime.utcnow()
+    due = or_(
+        and_(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= now),
+        and_(EmailOutbox.status == "sending", EmailOutbox.lease_until < now),
+    )
+    ids = [
+        row_id for (row_id,) in db.session.execute(
+            db.select(EmailOutbox.id).where(due).order_by(EmailOutbox.id).limit(limit)
+        )
+    ]
+    if not ids:
+        return []
+    token = secrets.token_hex(8)
+    lease = now + timedelta(seconds=app.config.get("EMAIL_OUTBOX_LEASE_SECONDS", 300))
+    # Another sender may have claimed some of these since the SELECT
+    db.session.execute(
+        db.update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids), due)
+        .values(status="sending", claimed_by=token, lease_until=lease),
+        execution_options={"synchronize_session": False},
+    )
+    db.session.commit()
+    return EmailOutbox.query.filter_by(claimed_by=token, status="sending").order_by(EmailOutbox.id).all()
+
+
+def _release_email_rows(rows):
+    """Hand claimed but unsent rows back without counting an attempt."""
+    for row in rows:
+        row.status, row.claimed_by, row.lease_until = "pending", None, None
+
+
+def _record_email_failure(row, error, permanent=False):
+    row.attempts += 1
+    row.last_error = str(error)[:2000]
+    row.claimed_by, row.lease_until = None, None
+    if permanent or row.attempts >= app.config.get("EMAIL_OUTBOX_MAX_ATTEMPTS", 6):
+        row.status = "dead"
+        app.logger.error(f"Email {row.id} to {row.recipient} dead-lettered after {row.attempts} attempt(s): {error}")
+    else:
+        row.status = "pending"
+        row.next_attempt_at = datetime.utcnow() + timedelta(seconds=_outbox_retry_delay(row.attempts))
+
+
+def _smtp_session_lost(error):
+    """True when ``error`` means the SMTP session itself is unusable."""
+    import smtplib
+
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+def _close_smtp_session(connection):
+    try:
+        connection.__exit__(None, None, None)
+    except Exception:
+        pass
+
+
+def drain_email_outbox(max_batches=None):
+    """Send due outbox emails over one SMTP session.
+
+    Returns ``{"sent", "failed", "dead", "wait"}``; ``wait`` is the number of
+    seconds the caller should pause when the per-minute cap or an unreachable
+    server stopped the drain early.
+    """
+    import smtplib
+
+    result = {"sent": 0, "failed": 0, "dead": 0, "wait": 0}
+    batch_size = max(1, app.config.get("EMAIL_OUTBOX_BATCH_SIZE", 50))
+    rate = app.config.get("EMAIL_OUTBOX_RATE")
+    connection = None
+    batches = 0
+    try:
+        while not result["wait"] and (max_batches is None or batches < max_batches):
+            batch = claim_email_batch(batch_size)
+            if not batch:
+                break
+            batches += 1
+            for index, row in enumerate(batch):
+                allowed, retry_after = rate_limiter.hit("email_outbox", "smtp", rate)
+                if not allowed:
+                    _release_email_rows(batch[index:])
+                    result["wait"] = retry_after
+                    break
+                if connection is None:
+                    try:
+                        session = mail.connect()
+                        session.__enter__()
+                        connection = session
+                    except Exception as e:
+                        # Not the message's fault: hand the rest back and back off
+                        app.logger.warning(f"Email outbox: SMTP connect failed: {e}")
+                        _release_email_rows(batch[index:])
+                        result["wait"] = app.config.get("EMAIL_OUTBOX_RETRY_BASE_SECONDS", 60)
+                        break
+                try:
+                    connection.send(build_email_message(
+                        row.recipient, row.subject, row.body, row.attachment, row.attachment_name
+                    ))
+                except smtplib.SMTPRecipientsRefused as e:
+                    _record_email_failure(row, e, permanent=True)
+                except Exception as e:
+                    if _smtp_session_lost(e):
+                        _close_smtp_session(connection)
+                        connection = None
+                    _record_email_failure(row, e)
+                else:
+                    row.status, row.sent_at = "sent", datetime.utcnow()
+                    row.claimed_by, row.lease_until = None, None
+                    result["sent"] += 1
+                    continue
+                result["dead" if row.status == "dead" else "failed"] += 1
+            db.session.commit()
+    finally:
+        if connection is not None:
+            _close_smtp_session(connection)
+    return result
+
+
+def _drain_email_outbox_job():
+    with app.app_context():
+        try:
+            drain_email_outbox()
+        finally:
+            db.session.remove()
+
+
+# Development has no worker process; drain the outbox from the local scheduler
+if scheduler and app.config.get("EMAIL_OUTBOX_ENABLED", True) and not (app.config.get("TESTING") or os.getenv("TESTING")):
+    scheduler.add_job(
+        _drain_email_outbox_job,
+        'interval',
+        seconds=app.config.get("EMAIL_OUTBOX_POLL_SECONDS", 5),
+        id='email-outbox',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+
 def generate_meeting_ical(meeting, chair_name=None):
     """Generate iCal data for a meeting."""
-    cal = Calendar()
-    cal.add('prodid', '-//Back Porch Meetings//Chairperson Scheduler//EN')
-    cal.add('version', '2.0')
-    cal.add('method', 'REQUEST')
-    
-    event = Event()
-    event.add('summary', f"CHAIR: {meeting.title}")
-    event.add('description', f"""You are scheduled to chair this meeting.
+    return build_meetings_ics(
+        [meeting],
+        variant="invite",
+        prodid='-//Back Porch Meetings//Chairperson Scheduler//EN',
+        method='REQUEST',
+        chair_name=chair_name,
+    )
 
-Meeting: {meeting.title}
-Type: {getattr(meeting, 'meeting_type', 'Regular')}
-Description: {meeting.description or 'Standard meeting format'}
-Zoom Link: {meeting.zoom_link or 'Contact admin'}
+# ==========================
+# NOTIFICATION LEDGER
+# ==========================
+# Confirmations and 24h/1h reminders are recorded in notification_ledger under a
+# unique (meeting, user, kind) key. The scans below skip anything already in
+# the ledger, so the reminder jobs can run as often as we like. With the outbox,
+# the ledger row and the queued email are committed together.
+
+# kind -> (hours_before for the email, earliest and latest start it covers from now)
+REMINDER_WINDOWS = (
+    ("reminder_24h", 24, timedelta(hours=20), timedelta(hours=24)),
+    ("reminder_1h", 1, timedelta(minutes=30), timedelta(minutes=65)),
+)
 
-Please join 10-15 minutes early to set up.""")
-    
-    # Set start and end times
-    start_datetime = datetime.combine(meeting.event_date, meeting.start_time or datetime.min.time())
-    
-    # Calculate end time
-    if meeting.end_time:
-        end_datetime = datetime.combine(meeting.event_date, meeting.end_time)
-    else:
-        # Default to 1 hour duration if no end time specified
-        end_datetime = start_datetime + timedelta(hours=1)
-    
-    event.add('dtstart', start_datetime)
-    event.add('dtend', end_datetime)
-    event.add('location', meeting.zoom_link or 'Online')
-    
-    if chair_name:
-        event.add('organizer', chair_name)
-    
-    # Add reminder alarms
-    # 24 hours before
-    alarm_24h = Alarm()
-    alarm_24h.add('action', 'DISPLAY')
-    alarm_24h.add('description', f'Reminder: You are chairing {meeting.title} tomorrow')
-    alarm_24h.add('trigger', timedelta(hours=-24))
-    event.add_component(alarm_24h)
-    
-    # 1 hour before
-    alarm_1h = Alarm()
-    alarm_1h.add('action', 'DISPLAY')
-    alarm_1h.add('description', f'Starting soon: {meeting.title} in 1 hour')
-    alarm_1h.add('trigger', timedelta(hours=-1))
-    event.add_component(alarm_1h)
-    
-    cal.add_component(event)
-    return cal.to_ical()
-
-def send_chair_reminder(meeting_id, hours_before=24):
-    """Send reminder email to chair before meeting."""
-    meeting = Meeting.query.get(meeting_id)
-    if not meeting or not meeting.chair_signup:
+
+@event.listens_for(db.session, "before_flush")
+def _reset_ledger_for_new_signups(session, flush_context, instances):
+    """A new signup (e.g. after a cancel) gets its confirmation and reminders again."""
+    for obj in session.new:
+        if not isinstance(obj, ChairSignup):
+            continue
+        meeting_id = obj.meeting_id or (obj.meeting.id if obj.meeting is not None else None)
+        user_id = obj.user_id or (obj.user.id if obj.user is not None else None)
+        if meeting_id and user_id:
+            session.query(NotificationLedger).filter(
+                NotificationLedger.meeting_id == meeting_id, NotificationLedger.user_id == user_id
+            ).delete(synchronize_session=False)
+
+
+def send_notification_once(kind, meeting_id, user, subject, body, ical_data=None, ical_filename=None):
+    """Send ``kind`` for this meeting to ``user`` unless the ledger has it; True when sent now."""
+    if not mail_configured():
         return False
-    
-    chair = meeting.chair_signup.user
-    
-    # Determine subject and content based on timing
+
+    entry = NotificationLedger(meeting_id=meeting_id, user_id=user.id, kind=kind, sent_at=datetime.utcnow())
+    db.session.add(entry)
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()  # another run got there first
+        return False
+
+    if app.config.get("EMAIL_OUTBOX_ENABLED", True):
+        enqueue_email(user.email, subject, body, ical_data, ical_filename, commit=False)
+        db.session.commit()
+        return True
+
+    db.session.commit()
+    if send_email(user.email, subject, body, ical_data, ical_filename):
+        return True
+    db.session.delete(entry)  # not sent; let the next run retry
+    db.session.commit()
+    return False
+
+
+def _chair_reminder_email(meeting, chair, hours_before):
+    """Subject, body, iCal data and filename of the 24h / 1h chair reminder."""
     if hours_before == 24:
         subject = f"Reminder: You're chairing tomorrow — {meeting.title}"
         timing_text = "tomorrow"
@@ -4769,32 +6524,49 @@ Thank you for serving the Back Porch community!
     # Generate iCal attachment
     ical_data = generate_meeting_ical(meeting, chair.display_name)
     ical_filename = f"meeting_{meeting.id}_reminder.ics"
+    return subject, body, ical_data, ical_filename
+
+
+def send_chair_reminder(meeting_id, hours_before=24, once=False):
+    """Send reminder email to chair before meeting.
+
+    With ``once`` the reminder goes through the notification ledger, so it is
+    skipped if this chair already got it.
+    """
+    meeting = Meeting.query.get(meeting_id)
+    if not meeting or not meeting.chair_signup:
+        return False
     
-    return send_email(chair.email, subject, body, ical_data, ical_filename)
+    chair = meeting.chair_signup.user
+    email = _chair_reminder_email(meeting, chair, hours_before)
+    if once:
+        kind = "reminder_24h" if hours_before == 24 else "reminder_1h"
+        return send_notification_once(kind, meeting.id, chair, *email)
+    return send_email(chair.email, *email)
 
 
 def send_meeting_confirmations():
-    """Send confirmation emails for newly assigned meetings."""
-    from datetime import datetime, timedelta
-    
-    # Find meetings in the next 30 days that were recently assigned (created in last 24 hours)
-    cutoff_time = datetime.utcnow() - timedelta(hours=24)
-    upcoming_start = datetime.utcnow().date()
-    upcoming_end = (datetime.utcnow() + timedelta(days=30)).date()
-    
-    recent_signups = (
+    """Send confirmation emails for signups from the last 24 hours that haven't had one."""
+    now = datetime.utcnow()
+    pending = (
         ChairSignup.query
-        .join(Meeting)
+        .join(Meeting, Meeting.id == ChairSignup.meeting_id)
+        .outerjoin(NotificationLedger, and_(
+            NotificationLedger.meeting_id == ChairSignup.meeting_id,
+            NotificationLedger.user_id == ChairSignup.user_id,
+            NotificationLedger.kind == "confirmation",
+        ))
         .filter(
-            ChairSignup.created_at >= cutoff_time,
-            Meeting.event_date >= upcoming_start,
-            Meeting.event_date <= upcoming_end
+            ChairSignup.created_at >= now - timedelta(hours=24),
+            Meeting.starts_at_utc > now,
+            Meeting.starts_at_utc <= now + timedelta(days=30),
+            NotificationLedger.id.is_(None),
         )
         .all()
     )
     
     sent_count = 0
-    for signup in recent_signups:
+    for signup in pending:
         if send_chair_confirmation(signup):
             sent_count += 1
     
@@ -4802,7 +6574,7 @@ def send_meeting_confirmations():
 
 
 def send_chair_confirmation(chair_signup):
-    """Send confirmation email when someone signs up to chair."""
+    """Send confirmation email when someone signs up to chair (once per signup)."""
     meeting = chair_signup.meeting
     chair = chair_signup.user
     
@@ -4835,101 +6607,183 @@ Thank you for stepping up to serve!
     ical_data = generate_meeting_ical(meeting, chair.display_name)
     ical_filename = f"chairperson_meeting_{meeting.event_date.strftime('%Y%m%d')}_{meeting.id}.ics"
     
-    return send_email(chair.email, subject, body, ical_data, ical_filename)
+    return send_notification_once("confirmation", meeting.id, chair, subject, body, ical_data, ical_filename)
 
 
 def check_and_send_reminders():
-    """Check for meetings that need reminder emails and send them."""
-    from datetime import datetime, timedelta
-    
+    """Send the 24-hour and 1-hour chair reminders that are due and not yet sent."""
+    backfill_meeting_instants()  # rows added by raw SQL have no instants to scan yet
     now = datetime.utcnow()
-    
-    # Find meetings needing 24-hour reminders
-    tomorrow_start = now + timedelta(hours=23)
-    tomorrow_end = now + timedelta(hours=25)
-    
-    meetings_24h = (
-        Meeting.query
-        .join(ChairSignup)
-        .filter(
-            Meeting.event_date == tomorrow_start.date(),
-            Meeting.start_time >= tomorrow_start.time(),
-            Meeting.start_time <= tomorrow_end.time()
-        )
-        .all()
-    )
-    
-    # Find meetings needing 1-hour reminders
-    hour_start = now + timedelta(minutes=55)
-    hour_end = now + timedelta(minutes=65)
-    
-    meetings_1h = (
-        Meeting.query
-        .join(ChairSignup)
-        .filter(
-            Meeting.event_date == now.date(),
-            Meeting.start_time >= hour_start.time(),
-            Meeting.start_time <= hour_end.time()
-        )
-        .all()
-    )
-    
     sent_count = 0
-    
-    # Send 24-hour reminders
-    for meeting in meetings_24h:
-        if send_chair_reminder(meeting.id, hours_before=24):
-            sent_count += 1
-            print(f"Sent 24h reminder for meeting {meeting.id}")
-    
-    # Send 1-hour reminders
-    for meeting in meetings_1h:
-        if send_chair_reminder(meeting.id, hours_before=1):
-            sent_count += 1
-            print(f"Sent 1h reminder for meeting {meeting.id}")
+
+    for kind, hours_before, earliest, latest in REMINDER_WINDOWS:
+        due = (
+            db.session.query(Meeting.id, ChairSignup.user_id)
+            .join(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+            .outerjoin(NotificationLedger, and_(
+                NotificationLedger.meeting_id == Meeting.id,
+                NotificationLedger.user_id == ChairSignup.user_id,
+                NotificationLedger.kind == kind,
+            ))
+            .filter(
+                Meeting.starts_at_utc > now + earliest,
+                Meeting.starts_at_utc <= now + latest,
+                NotificationLedger.id.is_(None),
+            )
+            .all()
+        )
+        for meeting_id, _ in due:
+            if send_chair_reminder(meeting_id, hours_before=hours_before, once=True):
+                sent_count += 1
+                print(f"Sent {hours_before}h reminder for meeting {meeting_id}")
     
     return sent_count
-    
-    send_email(chair.email, subject, body)
 
-def send_open_slot_reminder():
-    """Send weekly reminder about open chair slots."""
-    tomorrow = date.today() + timedelta(days=1)
+
+# ==========================
+# OPEN-SLOT BROADCAST
+# ==========================
+# The weekly "open chair positions" email. Open meetings are loaded once and
+# split by audience, and recipients are streamed from users in id order a chunk
+# at a time. Each recipient is sent only the meetings they may chair: coed ones
+# plus those matching their gender. Each chunk is written to the email outbox
+# in one transaction, and the worker's senders deliver it over their reused
+# SMTP sessions. With the outbox disabled, the whole run shares one SMTP
+# session. Every run is recorded in broadcast_runs.
+
+OPEN_SLOTS_SUBJECT = "Back Porch: Open Chair Positions This Week"
+
+
+def _meeting_audience(gender_restriction):
+    """'male', 'female' or '' (coed), accepting the legacy 'men'/'women' values."""
+    value = (gender_restriction or '').strip().lower()
+    if value in ('male', 'men'):
+        return 'male'
+    if value in ('female', 'women'):
+        return 'female'
+    return ''
+
+
+def open_slot_lines_by_audience(start, end):
+    """Listing lines of open, unchaired meetings on Eastern dates start..end, keyed by audience."""
     meetings = (
         Meeting.query
-        .filter(Meeting.event_date >= tomorrow, Meeting.event_date <= tomorrow + timedelta(days=7))
+        .filter(meetings_on_eastern_days(start, end))
         .filter(Meeting.is_open == True)
         .filter(Meeting.chair_signup == None)
+        .order_by(Meeting.event_date, Meeting.start_time, Meeting.id)
         .all()
     )
-    
-    if not meetings:
-        return
-    
-    # Send to all users (or admins could send manually)
-    users = User.query.filter_by(is_admin=False).all()
-    subject = "Back Porch: Open Chair Positions This Week"
-    body = """Dear Back Porch Chairperson,
+    lines = {'': [], 'male': [], 'female': []}
+    for m in meetings:
+        lines[_meeting_audience(m.gender_restriction)].append(
+            f"- {m.title} on {m.event_date.strftime('%A, %B %d')} at {m.start_time.strftime('%I:%M %p')}"
+        )
+    return lines, len(meetings)
+
+
+def iter_broadcast_recipients(chunk_size):
+    """Yield chunks of (email, display_name, gender) for non-admin users, walking users by id."""
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            db.select(User.id, User.email, User.display_name, User.gender)
+            .where(User.is_admin == False, User.id > last_id, User.email.isnot(None))
+            .order_by(User.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        yield [(row.email, row.display_name, (row.gender or '').lower()) for row in rows]
 
-There are open chair positions available this week. Please visit the chairperson portal to sign up:
 
-"""
-    for m in meetings:
-        body += f"- {m.title} on {m.event_date.strftime('%A, %B %d')} at {m.start_time.strftime('%I:%M %p')}\n"
-    
-    body += "\nThank you for your service!\n\nBack Porch Meetings"
-    
-    for user in users:
-        send_email(user.email, subject, body)
+def _open_slot_body(display_name, lines):
+    return (
+        f"Dear {display_name or 'Back Porch Chairperson'},\n\n"
+        "There are open chair positions available this week. "
+        "Please visit the chairperson portal to sign up:\n\n"
+        + "\n".join(lines)
+        + "\n\nThank you for your service!\n\nBack Porch Meetings"
+    )
+
+
+def send_open_slot_reminder():
+    """Send the weekly open chair slots email; returns the run's BroadcastRun (None if nothing to send)."""
+    started = time.perf_counter()
+    tomorrow = get_eastern_today() + timedelta(days=1)
+    lines, meeting_count = open_slot_lines_by_audience(tomorrow, tomorrow + timedelta(days=7))
+    if not meeting_count or not mail_configured():
+        return None
+
+    run = BroadcastRun(kind="open_slots", started_at=datetime.utcnow(), meetings=meeting_count,
+                       recipients=0, skipped=0, sent=0, failed=0)
+    use_outbox = app.config.get("EMAIL_OUTBOX_ENABLED", True)
+    connection = None
+    try:
+        for chunk in iter_broadcast_recipients(app.config.get("BROADCAST_CHUNK_SIZE", 500)):
+            messages = []
+            for email, display_name, gender in chunk:
+                eligible = lines[''] + (lines[gender] if gender in ('male', 'female') else [])
+                if eligible:
+                    messages.append((email, _open_slot_body(display_name, eligible)))
+            run.recipients += len(chunk)
+            run.skipped += len(chunk) - len(messages)
+            if not messages:
+                continue
+
+            if use_outbox:
+                try:
+                    db.session.execute(db.insert(EmailOutbox), [
+                        {"recipient": email, "subject": OPEN_SLOTS_SUBJECT, "body": body,
+                         "next_attempt_at": datetime.utcnow()}
+                        for email, body in messages
+                    ])
+                    db.session.commit()
+                    run.sent += len(messages)
+                except Exception as e:
+                    db.session.rollback()
+                    run.failed += len(messages)
+                    app.logger.error(f"Open-slot broadcast: failed to queue {len(messages)} emails: {e}")
+                continue
+
+            for email, body in messages:
+                try:
+                    if connection is None:
+                        session = mail.connect()
+                        session.__enter__()
+                        connection = session
+                    connection.send(build_email_message(email, OPEN_SLOTS_SUBJECT, body))
+                    run.sent += 1
+                except Exception as e:
+                    run.failed += 1
+                    app.logger.error(f"Open-slot broadcast: send to {email} failed: {e}")
+                    if connection is not None and _smtp_session_lost(e):
+                        _close_smtp_session(connection)
+                        connection = None
+    finally:
+        if connection is not None:
+            _close_smtp_session(connection)
+
+    run.duration_ms = int((time.perf_counter() - started) * 1000)
+    db.session.add(run)
+    db.session.commit()
+    app.logger.info(
+        f"Open-slot broadcast: {run.recipients} recipients, {run.sent} sent, {run.failed} failed, "
+        f"{run.skipped} skipped in {run.duration_ms} ms"
+    )
+    return run
+
 
 def send_day_of_chair_reminders(run_date: date = None):
     """Send reminder emails to chairs on the morning of their scheduled meeting day.
     If run_date is provided, use it; otherwise, use today's date.
     """
-    target_day = run_date or date.today()
+    target_day = run_date or get_eastern_today()
     meetings = (
         Meeting.query
-        .filter(Meeting.event_date == target_day)
+        .filter(meetings_on_eastern_days(target_day))
+        .order_by(Meeting.start_time, Meeting.id)
         .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
         .all()
     )
@@ -5013,7 +6867,7 @@ def award_chair_points_for_completed_meetings():
             # Award 1 point
             chair.chair_points = (chair.chair_points or 0) + 1
             points_awarded += 1
-            app.logger.info(f"Awarded 1 ChairPoint to {chair.display_name} (BP-{1000 + chair.id}) for meeting {meeting.title}")
+            app.logger.info(f"Awarded 1 ChairPoint to {chair.display_name} ({format_bp_id(chair.id)}) for meeting {meeting.title}")
     
     if points_awarded > 0:
         db.session.commit()
@@ -5022,59 +6876,208 @@ def award_chair_points_for_completed_meetings():
     return points_awarded
 
 
-# ==========================
-# ADMIN ROUTES
-# ==========================
+# ==========================
+# ADMIN ROUTES
+# ==========================
+
+CERTIFICATE_QUIZZES = len(QUIZZES)  # registration and hosting
+
+
+def certificate_recipients_query():
+    """Users who passed both quizzes, one row each, latest completion first."""
+    quizzes_passed = db.func.count(QuizAttempt.id).label('quizzes_passed')
+    latest_completion = db.func.max(QuizAttempt.completed_at).label('latest_completion')
+    return db.session.query(
+        User.id,
+        User.display_name,
+        User.email,
+        quizzes_passed,
+        latest_completion,
+    ).join(
+        QuizAttempt, User.id == QuizAttempt.user_id
+    ).filter(
+        QuizAttempt.passed == True
+    ).group_by(
+        User.id, User.display_name, User.email
+    ).having(
+        quizzes_passed >= CERTIFICATE_QUIZZES
+    ).order_by(
+        latest_completion.desc(), User.id.desc()
+    )
+
+
+def passed_attempts_by_user(user_ids):
+    """Load the passed attempts of ``user_ids`` (a list or a subquery) in one query."""
+    attempts = defaultdict(list)
+    query = QuizAttempt.query.filter(
+        QuizAttempt.passed == True,
+        QuizAttempt.user_id.in_(user_ids),
+    ).order_by(QuizAttempt.user_id, QuizAttempt.completed_at.desc())
+    for attempt in query:
+        attempts[attempt.user_id].append(attempt)
+    return attempts
+
+
+def certificate_registry_rows(recipients, attempts):
+    """Combine recipient rows with their attempts for the template and CSV."""
+    return [
+        {
+            'user_id': recipient.id,
+            'display_name': recipient.display_name,
+            'bp_id': format_bp_id(recipient.id),
+            'email': recipient.email,
+            'quizzes_passed': recipient.quizzes_passed,
+            'latest_completion': recipient.latest_completion,
+            'attempts': attempts.get(recipient.id, []),
+        }
+        for recipient in recipients
+    ]
+
+
+@app.route("/admin/certificates")
+@admin_required
+def admin_certificates():
+    """Admin page to view all certificate recipients.
+    Optional CSV export with ?format=csv
+    """
+    fmt = request.args.get("format", "html").lower()
+    recipients = certificate_recipients_query()
+
+    if fmt == "csv":
+        recipient_ids = recipients.with_entities(User.id).order_by(None).subquery()
+        attempts = passed_attempts_by_user(db.select(recipient_ids.c.id))
+
+        def rows():
+            for row in certificate_registry_rows(recipients.all(), attempts):
+                by_quiz = {a.quiz_id: a for a in row['attempts']}
+                line = [row['bp_id'], row['display_name'], row['email'] or '', row['quizzes_passed'],
+                        row['latest_completion'].strftime('%Y-%m-%d %H:%M') if row['latest_completion'] else '']
+                for quiz_id in ('registration', 'hosting'):
+                    attempt = by_quiz.get(quiz_id)
+                    line += [attempt.score, attempt.completed_at.strftime('%Y-%m-%d %H:%M')] if attempt else ['', '']
+                yield line
+
+        header = ["bp_id", "display_name", "email", "quizzes_passed", "latest_completion",
+                  "registration_score", "registration_completed", "hosting_score", "hosting_completed"]
+        return streaming_download(iter_csv_chunks(header, rows()), 'text/csv; charset=utf-8',
+                                  'certificate_recipients.csv')
+
+    page = request.args.get('page', 1, type=int)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 10), 500)
+    pagination = recipients.paginate(page=page, per_page=per_page, error_out=False)
+    attempts = passed_attempts_by_user([r.id for r in pagination.items])
+
+    return render_template(
+        'admin_certificates.html',
+        recipients=certificate_registry_rows(pagination.items, attempts),
+        pagination=pagination,
+        per_page=per_page,
+        total_recipients=pagination.total
+    )
+
+CERTIFICATE_EXPORT_FETCH = 20  # stored PDFs read per query while streaming an export
+CERTIFICATE_EXPORT_PROGRESS_TTL = 3600
+
+
+def certificate_export_progress_key(job_id):
+    return f"certificate_export:{job_id}"
+
+
+def _export_job_id(raw):
+    """The page's progress id for an export, if it is a short alphanumeric token."""
+    raw = (raw or "").strip()
+    if 0 < len(raw) <= 64 and raw.replace("-", "").isalnum():
+        return raw
+    return None
+
+
+def certificate_filename(user):
+    return f"BP_Certificate_{user.bp_id}_{secure_filename(user.display_name) or 'chair'}.pdf"
+
+
+def iter_certificate_export(users, attempts, job_id=None):
+    """Yield ``(filename, pdf)`` per user: stored certificates first, then fresh renders.
+
+    Missing certificates render on the export pool (the programmatic fallback
+    inline) and are stored for later downloads. Progress is kept in the cache
+    under ``job_id`` for the page to poll.
+    """
+    todo = {}
+    for user in users:
+        attempt = latest_certificate_attempt(attempts.get(user.id, []))
+        if attempt is not None:
+            todo[certificate_renderer.cache_key(user.id, attempt.id, user.display_name)] = (user, attempt)
+    progress = {"status": "running", "total": len(todo), "done": 0, "rendered": 0}
+
+    def report(**changes):
+        progress.update(changes)
+        if job_id:
+            cache.set(certificate_export_progress_key(job_id), dict(progress),
+                      timeout=CERTIFICATE_EXPORT_PROGRESS_TTL)
+
+    report()
+    keys = list(todo)
+    for start in range(0, len(keys), CERTIFICATE_EXPORT_FETCH):
+        stored = db.session.query(RenderedCertificate.cache_key, RenderedCertificate.data).filter(
+            RenderedCertificate.cache_key.in_(keys[start:start + CERTIFICATE_EXPORT_FETCH])
+        ).all()
+        for key, data in stored:
+            user, _ = todo.pop(key)
+            report(done=progress["done"] + 1)
+            yield certificate_filename(user), data
+
+    pending = list(todo.items())
+    if certificate_renderer.template_hash:
+        results = certificate_export_pool.render_many(
+            (key, user.display_name, attempt.completed_at) for key, (user, attempt) in pending
+        )
+    else:
+        results = ((key, None) for key, _ in pending)
+    for key, pdf in results:
+        user, attempt = todo[key]
+        if pdf is None:
+            pdf = generate_standard_certificate(user, attempt).getvalue()
+        store_certificate_pdf(user.id, key, pdf)
+        report(done=progress["done"] + 1, rendered=progress["rendered"] + 1)
+        yield certificate_filename(user), pdf
+    report(status="done")
+
+
+@app.route("/admin/certificates/export", methods=["POST"])
+@admin_required
+def admin_certificates_export():
+    """Download the certificates of the selected recipients, or all of them, as one ZIP."""
+    recipient_ids = certificate_recipients_query().with_entities(User.id).order_by(None)
+    export_all = request.form.get("scope") == "all"
+    if not export_all:
+        selected = [int(v) for v in request.form.getlist("user_ids") if v.isdigit()]
+        if not selected:
+            flash("Select at least one recipient to export.", "warning")
+            return redirect(url_for("admin_certificates"))
+        recipient_ids = recipient_ids.filter(User.id.in_(selected))
+    log_audit_event('export_certificates', get_current_user().id, details={
+        'scope': 'all' if export_all else 'selected',
+    })
+
+    ids = db.select(recipient_ids.subquery().c.id)
+    users = User.query.filter(User.id.in_(ids)).order_by(User.display_name, User.id).all()
+    attempts = passed_attempts_by_user(ids)
+    # Storing each rendered PDF commits; detached rows keep their loaded values
+    for obj in users + [a for rows in attempts.values() for a in rows]:
+        db.session.expunge(obj)
+
+    entries = iter_certificate_export(users, attempts, _export_job_id(request.form.get("job_id")))
+    return streaming_download(iter_zip_chunks(entries), 'application/zip',
+                              f'certificates_{date.today().isoformat()}.zip')
 
-@app.route("/admin/certificates")
+
+@app.route("/admin/certificates/export/<job_id>")
 @admin_required
-def admin_certificates():
-    """Admin page to view all certificate recipients"""
-    # Get all passed quiz attempts with user info
-    certificate_recipients = db.session.query(
-        User.id,
-        User.display_name,
-        User.email,
-        db.func.count(QuizAttempt.id).label('quizzes_passed'),
-        db.func.max(QuizAttempt.completed_at).label('latest_completion')
-    ).join(
-        QuizAttempt, User.id == QuizAttempt.user_id
-    ).filter(
-        QuizAttempt.passed == True
-    ).group_by(
-        User.id
-    ).having(
-        db.func.count(QuizAttempt.id) >= 2  # Both quizzes passed
-    ).order_by(
-        db.desc('latest_completion')
-    ).all()
-    
-    # Get detailed quiz attempts for each recipient
-    recipients_with_details = []
-    for recipient in certificate_recipients:
-        user_attempts = QuizAttempt.query.filter_by(
-            user_id=recipient.id,
-            passed=True
-        ).order_by(QuizAttempt.completed_at.desc()).all()
-        
-        # Get the user object to access bp_id property
-        user_obj = User.query.get(recipient.id)
-        
-        recipients_with_details.append({
-            'user_id': recipient.id,
-            'display_name': recipient.display_name,
-            'bp_id': user_obj.bp_id if user_obj else 'N/A',
-            'email': recipient.email,
-            'quizzes_passed': recipient.quizzes_passed,
-            'latest_completion': recipient.latest_completion,
-            'attempts': user_attempts
-        })
-    
-    return render_template(
-        'admin_certificates.html',
-        recipients=recipients_with_details,
-        total_recipients=len(recipients_with_details)
-    )
+def admin_certificates_export_progress(job_id):
+    """Progress of a running certificate export, polled by the certificates page."""
+    progress = cache.get(certificate_export_progress_key(job_id)) if _export_job_id(job_id) else None
+    return jsonify(progress or {"status": "unknown"})
+
 
 @app.route("/admin/meetings")
 @admin_required
@@ -5172,11 +7175,11 @@ def admin_meetings():
     meetings = pagination.items
     
     # Get meeting type options for filter dropdown (cached)
-    meeting_types = cache.get('meeting_types_list')
-    if meeting_types is None:
-        meeting_types = db.session.query(Meeting.meeting_type).distinct().all()
-        meeting_types = [mt[0] for mt in meeting_types if mt[0]]
-        cache.set('meeting_types_list', meeting_types, timeout=3600)  # Cache for 1 hour
+    meeting_types = cached_value(
+        ("meetings",), 'meeting_types_list',
+        lambda: [mt[0] for mt in db.session.query(Meeting.meeting_type).distinct().all() if mt[0]],
+        timeout=3600,  # Cache for 1 hour
+    )
     
     # Removed all_users query - now using API endpoint for searchable autocomplete
     
@@ -5274,12 +7277,16 @@ def admin_diagnostics():
         "MAIL_PASSWORD_set": bool(app.config.get("MAIL_PASSWORD")),
     }
 
+    backend = getattr(cache, "cache", None)
+    cache_stats = backend.stats() if hasattr(backend, "stats") else None
+
     return render_template(
         "admin_diagnostics.html",
         engine_url=engine_url,
         tables=tables,
         counts=counts,
         mail_settings=mail_settings,
+        cache_stats=cache_stats,
         ics_source=SOURCE_MEETINGS_ICS_URL,
         web_source=SOURCE_MEETINGS_WEB_URL,
     )
@@ -5350,6 +7357,7 @@ def remove_sunday_signups():
     for a in sunday_avail:
         db.session.delete(a)
     db.session.commit()
+    invalidate_meeting_caches()
 
     return (
         f"<h2>Done. Removed {total} Sunday record(s) for {user.display_name}.</h2>"
@@ -5367,15 +7375,19 @@ def admin_all_users_report():
     fmt = request.args.get("format", "html").lower()
     
     # Get all users with their chair points and meeting counts
+    ensure_user_service_stats_current()
     all_users = db.session.query(
         User.id,
         User.display_name,
         User.email,
         User.chair_points,
-        User.profile_image,
+        User.has_profile_image,
+        User.profile_image_hash,
         User.created_at,
-        func.count(ChairSignup.id).label('total_meetings')
-    ).outerjoin(ChairSignup).group_by(User.id).order_by(User.chair_points.desc(), User.display_name).all()
+        user_total_meetings().label('total_meetings')
+    ).outerjoin(UserServiceStat, UserServiceStat.user_id == User.id).order_by(
+        User.chair_points.desc(), User.display_name
+    ).all()
     
     # Calculate totals
     total_users = len(all_users)
@@ -5394,7 +7406,7 @@ def admin_all_users_report():
         writer.writeheader()
         for user in all_users:
             writer.writerow({
-                "bp_id": f"BP-{1000 + user.id}",
+                "bp_id": format_bp_id(user.id),
                 "display_name": user.display_name,
                 "email": user.email,
                 "chair_points": user.chair_points,
@@ -5409,6 +7421,11 @@ def admin_all_users_report():
     # HTML view
     return render_template("admin_all_users_report.html", 
                          all_users=all_users,
+                         users_chart_data=[
+                             {"display_name": u.display_name, "chair_points": u.chair_points or 0,
+                              "total_meetings": u.total_meetings}
+                             for u in all_users
+                         ],
                          total_users=total_users,
                          total_points=total_points,
                          total_meetings=total_meetings,
@@ -5425,16 +7442,18 @@ def admin_chairpoints_leaderboard():
     fmt = request.args.get("format", "html").lower()
     
     # Get all users with chair points, sorted by points descending
+    ensure_user_service_stats_current()
     leaderboard = db.session.query(
         User.id,
         User.display_name,
         User.chair_points,
-        User.profile_image,
+        User.has_profile_image,
+        User.profile_image_hash,
         User.email,
-        func.count(ChairSignup.id).label('total_meetings')
-    ).outerjoin(ChairSignup).filter(
+        user_total_meetings().label('total_meetings')
+    ).outerjoin(UserServiceStat, UserServiceStat.user_id == User.id).filter(
         User.chair_points > 0
-    ).group_by(User.id).order_by(User.chair_points.desc()).all()
+    ).order_by(User.chair_points.desc()).all()
     
     if fmt == "csv":
         import csv
@@ -5447,7 +7466,7 @@ def admin_chairpoints_leaderboard():
         for idx, chair in enumerate(leaderboard, start=1):
             writer.writerow({
                 "rank": idx,
-                "bp_id": f"BP-{1000 + chair.id}",
+                "bp_id": format_bp_id(chair.id),
                 "display_name": chair.display_name,
                 "email": chair.email,
                 "chair_points": chair.chair_points,
@@ -5469,6 +7488,9 @@ def admin_report_chair_schedule():
     Optional CSV export with ?format=csv
     """
     fmt = request.args.get("format", "html").lower()
+    if fmt == "csv":
+        return _stream_chair_schedule_csv()
+
     meetings = (
         Meeting.query
         .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
@@ -5491,21 +7513,6 @@ def admin_report_chair_schedule():
             "is_open": m.is_open and not m.has_chair,
         })
 
-    if fmt == "csv":
-        import csv
-        from io import StringIO
-        si = StringIO()
-        writer = csv.DictWriter(si, fieldnames=[
-            "date","weekday","start","title","chair_name","bp_id","is_open"
-        ])
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
-        resp = make_response(si.getvalue())
-        resp.headers['Content-Type'] = 'text/csv; charset=utf-8'
-        resp.headers['Content-Disposition'] = 'attachment; filename=chair_schedule.csv'
-        return resp
-
     # Group by date for HTML
     grouped = {}
     for r in rows:
@@ -5514,6 +7521,38 @@ def admin_report_chair_schedule():
     return render_template("admin_chair_schedule.html", grouped=grouped)
 
 
+def _stream_chair_schedule_csv():
+    """Stream the full chair schedule as CSV straight from a column projection."""
+    query = (
+        db.session.query(
+            Meeting.event_date,
+            Meeting.start_time,
+            Meeting.title,
+            Meeting.is_open,
+            ChairSignup.id,
+            ChairSignup.display_name_snapshot,
+            ChairSignup.user_id,
+        )
+        .outerjoin(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc(), Meeting.id.asc())
+    )
+
+    def rows():
+        for event_date, start_time, title, is_open, signup_id, chair_name, user_id in iter_query_batched(query):
+            yield [
+                event_date.strftime('%Y-%m-%d'),
+                event_date.strftime('%A'),
+                start_time.strftime('%H:%M'),
+                title,
+                chair_name or '',
+                format_bp_id(user_id) if user_id else '',
+                bool(is_open and not signup_id),
+            ]
+
+    header = ["date", "weekday", "start", "title", "chair_name", "bp_id", "is_open"]
+    return streaming_download(iter_csv_chunks(header, rows()), 'text/csv; charset=utf-8', 'chair_schedule.csv')
+
+
 @app.route("/admin/reports/monthly-pdf")
 @admin_required
 def admin_monthly_pdf():
@@ -5648,74 +7687,56 @@ def admin_sponsor_request_status(req_id: int):
 @admin_required
 def admin_monthly_html():
     """Admin user statistics report showing chair assignments and completion rates."""
-    today = get_eastern_today()
-    
-    # Get all registered users (non-admin)
-    users = User.query.filter_by(is_admin=False).order_by(User.display_name).all()
-    
-    user_stats = []
-    for user in users:
-        # Count past meetings chaired (to date)
-        past_chaired = (
-            db.session.query(Meeting)
-            .join(ChairSignup, Meeting.id == ChairSignup.meeting_id)
-            .filter(
-                ChairSignup.user_id == user.id,
-                Meeting.event_date < today
-            )
-            .count()
-        )
-        
-        # Count future meetings chaired
-        future_chaired = (
-            db.session.query(Meeting)
-            .join(ChairSignup, Meeting.id == ChairSignup.meeting_id)
-            .filter(
-                ChairSignup.user_id == user.id,
-                Meeting.event_date >= today
-            )
-            .count()
-        )
-        
-        # Get future meeting details
-        future_meetings = (
-            db.session.query(Meeting)
-            .join(ChairSignup, Meeting.id == ChairSignup.meeting_id)
-            .filter(
-                ChairSignup.user_id == user.id,
-                Meeting.event_date >= today
-            )
-            .order_by(Meeting.event_date.asc())
-            .all()
+    today = ensure_user_service_stats_current()
+
+    # Non-admin users who have chaired or will chair, from user_service_stats
+    rows = (
+        db.session.query(
+            User.id, User.display_name, User.email, User.chair_points,
+            UserServiceStat.past_chaired, UserServiceStat.future_chaired,
         )
-        
-        # Calculate percentage (past + future)
-        total_chaired = past_chaired + future_chaired
-        
-        # Only include users who have chaired or will chair
-        if total_chaired > 0:
-            user_stats.append({
-                'user': user,
-                'past_chaired': past_chaired,
-                'future_chaired': future_chaired,
-                'total_chaired': total_chaired,
-                'future_meetings': future_meetings
-            })
-    
+        .join(UserServiceStat, UserServiceStat.user_id == User.id)
+        .filter(User.is_admin == False)  # noqa: E712
+        .order_by(User.display_name)
+        .all()
+    )
+
+    # Everyone's upcoming meetings in one query
+    future_by_user = {}
+    upcoming = (
+        db.session.query(ChairSignup.user_id, Meeting)
+        .join(Meeting, Meeting.id == ChairSignup.meeting_id)
+        .join(User, User.id == ChairSignup.user_id)
+        .filter(Meeting.event_date >= today, User.is_admin == False)  # noqa: E712
+        .order_by(Meeting.event_date.asc())
+        .all()
+    )
+    for user_id, meeting in upcoming:
+        future_by_user.setdefault(user_id, []).append(meeting)
+
+    user_stats = [
+        {
+            'user': row,
+            'past_chaired': row.past_chaired,
+            'future_chaired': row.future_chaired,
+            'total_chaired': row.past_chaired + row.future_chaired,
+            'future_meetings': future_by_user.get(row.id, []),
+        }
+        for row in rows
+        if row.past_chaired + row.future_chaired > 0
+    ]
+
     # Calculate totals
     total_past = sum(s['past_chaired'] for s in user_stats)
     total_future = sum(s['future_chaired'] for s in user_stats)
     total_all = total_past + total_future
     total_chairpoints = sum(s['user'].chair_points or 0 for s in user_stats)
     
-    # Count unfilled future meetings
-    unfilled_future = (
-        Meeting.query
-        .filter(
-            Meeting.event_date >= today,
-            ~Meeting.chair_signup.has()
-        )
-        .count()
+    # Count unfilled future meetings (from the daily rollup)
+    unfilled_future = int(
+        db.session.query(
+            func.coalesce(func.sum(MeetingDailyStat.total_meetings - MeetingDailyStat.filled_meetings), 0)
+        ).filter(MeetingDailyStat.stat_date >= today).scalar()
     )
     
     return render_template(
@@ -5748,6 +7769,7 @@ def admin_meeting_new():
         )
         db.session.add(meeting)
         db.session.commit()
+        invalidate_meeting_caches()
         flash("Meeting created.", "success")
         return redirect(url_for("admin_meetings"))
     return render_template("admin_meeting_form.html", form=form, mode="new")
@@ -5770,6 +7792,7 @@ def admin_meeting_edit(meeting_id):
         meeting.gender_restriction = form.gender_restriction.data or None
         meeting.meeting_type = form.meeting_type.data
         db.session.commit()
+        invalidate_meeting_caches()
         flash("Meeting updated.", "success")
         return redirect(url_for("admin_meetings"))
 
@@ -5782,6 +7805,7 @@ def admin_meeting_delete(meeting_id):
     meeting = Meeting.query.get_or_404(meeting_id)
     db.session.delete(meeting)
     db.session.commit()
+    invalidate_meeting_caches()
     flash("Meeting deleted.", "info")
     return redirect(url_for("admin_meetings"))
 
@@ -5793,6 +7817,7 @@ def admin_meeting_clear_chair(meeting_id):
     if meeting.chair_signup:
         db.session.delete(meeting.chair_signup)
         db.session.commit()
+        invalidate_meeting_caches()
         flash("Chair signup cleared.", "info")
     else:
         flash("This meeting currently has no chair to clear.", "warning")
@@ -5856,7 +7881,56 @@ def offline():
 # API: Interactive Calendar
 # ==========================
 
+def query_calendar_rows(start_date, end_date):
+    """Column-projection read of meetings with their chair for a date range.
+
+    Returns plain dicts. The chair's profile image is reduced to a boolean
+    computed in SQL (plus its content hash for fingerprinted URLs) so no image
+    data leaves the database.
+    """
+    rows = (
+        db.session.query(
+            Meeting.id,
+            Meeting.title,
+            Meeting.event_date,
+            Meeting.start_time,
+            Meeting.is_open,
+            Meeting.gender_restriction,
+            ChairSignup.id.label("signup_id"),
+            ChairSignup.user_id.label("chair_user_id"),
+            User.display_name.label("chair_name"),
+            User.has_profile_image.label("chair_has_image"),
+            User.profile_image_hash.label("chair_image_hash"),
+        )
+        .outerjoin(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+        .outerjoin(User, User.id == ChairSignup.user_id)
+        .filter(meetings_on_eastern_days(start_date, end_date))
+        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc(), Meeting.id.asc())
+        .all()
+    )
+    return [row._asdict() for row in rows]
+
+
+def get_calendar_rows_cached(start_date, end_date):
+    """query_calendar_rows() memoized per meetings generation and date range."""
+    return cached_value(
+        ("meetings",), f"calendar_rows:{start_date.isoformat()}:{end_date.isoformat()}",
+        lambda: query_calendar_rows(start_date, end_date),
+        timeout=app.config.get("CALENDAR_API_CACHE_SECONDS", 60),
+    )
+
+
+def _calendar_api_response(payload, shared=True):
+    """JSON response with short-TTL caching; shared only when not user-specific."""
+    response = jsonify(payload)
+    max_age = app.config.get("CALENDAR_API_MAX_AGE", 30)
+    response.headers['Cache-Control'] = f"{'public' if shared else 'private'}, max-age={max_age}"
+    response.headers['Vary'] = 'Cookie'
+    return response
+
+
 @app.route("/api/day-meetings")
+@rate_limited("public_api", "RATELIMIT_PUBLIC_API")
 def api_day_meetings():
     """Return JSON list of meetings for a given date (YYYY-MM-DD)."""
     date_str = request.args.get("date")
@@ -5865,34 +7939,32 @@ def api_day_meetings():
     except Exception:
         return jsonify({"error": "Invalid date"}), 400
 
-    meetings = (
-        Meeting.query
-        .filter(Meeting.event_date == target)
-        .order_by(Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
-        .all()
-    )
-    user = get_current_user()
+    rows = get_calendar_rows_cached(target, target)
+
+    # Eligibility is the only per-user field; only look the user up if it matters
+    restricted = any(r["gender_restriction"] in ('male', 'female') for r in rows)
+    user = get_current_user() if restricted else None
     data = []
-    for m in meetings:
+    for r in rows:
         eligible = True
-        if m.gender_restriction in ('male','female'):
-            eligible = bool(user and user.gender == m.gender_restriction)
+        if r["gender_restriction"] in ('male', 'female'):
+            eligible = bool(user and user.gender == r["gender_restriction"])
         data.append({
-            "id": m.id,
-            "title": m.title,
-            "time": m.start_time.strftime('%I:%M %p'),
-            "has_chair": bool(m.chair_signup),
-            "chair_name": m.chair_signup.user.display_name if (m.chair_signup and m.chair_signup.user) else None,
-            "chair_profile_url": url_for('profile_image', user_id=m.chair_signup.user_id) if (m.chair_signup and m.chair_signup.user and m.chair_signup.user.profile_image) else None,
-            "is_open": m.is_open and not m.chair_signup,
+            "id": r["id"],
+            "title": r["title"],
+            "time": r["start_time"].strftime('%I:%M %p'),
+            "has_chair": bool(r["signup_id"]),
+            "chair_name": r["chair_name"],
+            "chair_profile_url": profile_image_url(r["chair_user_id"], r["chair_image_hash"], size=48) if r["chair_has_image"] else None,
+            "is_open": bool(r["is_open"] and not r["signup_id"]),
             "eligible": eligible,
-            "detail_url": url_for('meeting_detail', meeting_id=m.id),
+            "detail_url": url_for('meeting_detail', meeting_id=r["id"]),
         })
-    return jsonify({"date": date_str, "meetings": data})
+    return _calendar_api_response({"date": date_str, "meetings": data}, shared=not restricted)
 
 
 @app.route("/api/week-meetings")
+@rate_limited("public_api", "RATELIMIT_PUBLIC_API")
 def api_week_meetings():
     """Return JSON list of meetings for a date range."""
     start_str = request.args.get("start")
@@ -5903,25 +7975,17 @@ def api_week_meetings():
     except Exception:
         return jsonify({"error": "Invalid date"}), 400
 
-    meetings = (
-        Meeting.query
-        .filter(Meeting.event_date >= start_date, Meeting.event_date <= end_date)
-        .order_by(Meeting.event_date.asc(), Meeting.start_time.asc())
-        .options(db.joinedload(Meeting.chair_signup).joinedload(ChairSignup.user))
-        .all()
-    )
-    
     data = []
-    for m in meetings:
+    for r in get_calendar_rows_cached(start_date, end_date):
         data.append({
-            "id": m.id,
-            "title": m.title,
-            "date": m.event_date.strftime('%m/%d'),
-            "time": m.start_time.strftime('%I:%M %p') if m.start_time else '',
-            "chair_name": m.chair_signup.user.display_name if (m.chair_signup and m.chair_signup.user) else None,
-            "chair_profile_url": url_for('profile_image', user_id=m.chair_signup.user_id) if (m.chair_signup and m.chair_signup.user and m.chair_signup.user.profile_image) else None,
+            "id": r["id"],
+            "title": r["title"],
+            "date": r["event_date"].strftime('%m/%d'),
+            "time": r["start_time"].strftime('%I:%M %p') if r["start_time"] else '',
+            "chair_name": r["chair_name"],
+            "chair_profile_url": profile_image_url(r["chair_user_id"], r["chair_image_hash"], size=48) if r["chair_has_image"] else None,
         })
-    return jsonify({"meetings": data})
+    return _calendar_api_response({"meetings": data})
 
 
 @app.route("/api/meetings/<int:meeting_id>/claim", methods=["POST"])
@@ -5952,6 +8016,7 @@ def api_meeting_claim(meeting_id):
     )
     db.session.add(signup)
     db.session.commit()
+    invalidate_meeting_caches()
 
     return jsonify({
         "ok": True,
@@ -6376,61 +8441,38 @@ def admin_analytics():
         filter_end = today
 
     # --- Summary statistics (scoped to date range) ---
-    total_meetings = Meeting.query.filter(
-        Meeting.event_date >= filter_start,
-        Meeting.event_date <= filter_end
-    ).count()
+    # Meeting counts come from the meeting_daily_stats rollup (O(days) rows)
+    in_range = MeetingDailyStat.stat_date.between(filter_start, filter_end)
+    total_meetings, covered_meetings = (
+        db.session.query(
+            func.coalesce(func.sum(MeetingDailyStat.total_meetings), 0),
+            func.coalesce(func.sum(MeetingDailyStat.filled_meetings), 0),
+        ).filter(in_range).one()
+    )
+    total_meetings, covered_meetings = int(total_meetings), int(covered_meetings)
     active_chairpersons = (
         User.query.join(ChairSignup).join(Meeting)
         .filter(Meeting.event_date >= filter_start, Meeting.event_date <= filter_end)
         .distinct().count()
     )
-    covered_meetings = (
-        Meeting.query.join(ChairSignup)
-        .filter(Meeting.event_date >= filter_start, Meeting.event_date <= filter_end)
-        .count()
-    )
     coverage_percentage = round((covered_meetings / total_meetings * 100) if total_meetings > 0 else 0)
 
     # --- Average signup time (scoped to date range) ---
+    # Whole days from signup to meeting start, negative (late) signups counted as 0
     avg_signup_time = "N/A"
     try:
-        dialect = db.engine.dialect.name
-    except Exception:
-        dialect = ""
-
-    try:
-        if dialect == "sqlite":
-            rows = (
-                db.session.query(ChairSignup.created_at, Meeting.event_date, Meeting.start_time)
-                .join(Meeting)
-                .filter(Meeting.event_date >= filter_start, Meeting.event_date <= filter_end)
-                .all()
-            )
-            diffs = []
-            for created_at, event_date, start_time in rows:
-                if not created_at or not event_date:
-                    continue
-                meeting_time = start_time or datetime.min.time()
-                meeting_dt = datetime.combine(event_date, meeting_time)
-                delta = meeting_dt - created_at
-                diffs.append(max(int(delta.total_seconds() // 86400), 0))
-            if diffs:
-                avg_signup_time = f"{int(sum(diffs) / len(diffs))} days"
-        else:
-            signups_with_days = db.session.query(
-                func.avg(
-                    func.datediff(
-                        func.concat(Meeting.event_date, ' ', func.coalesce(Meeting.start_time, '00:00:00')),
-                        ChairSignup.created_at
-                    )
-                )
-            ).join(Meeting).filter(
-                Meeting.event_date >= filter_start, Meeting.event_date <= filter_end
-            ).scalar()
-            avg_signup_time = f"{int(signups_with_days or 0)} days" if signups_with_days else "N/A"
-    except Exception:
-        avg_signup_time = "N/A"
+        lead_days = whole_days_between(ChairSignup.created_at, at_time(Meeting.event_date, Meeting.start_time))
+        avg_days = db.session.query(
+            func.avg(case((lead_days > 0, lead_days), else_=0))
+        ).select_from(ChairSignup).join(Meeting).filter(
+            ChairSignup.created_at.isnot(None),
+            Meeting.event_date >= filter_start, Meeting.event_date <= filter_end
+        ).scalar()
+        if avg_days is not None:
+            avg_signup_time = f"{int(avg_days)} days"
+    except Exception as e:
+        app.logger.warning(f"Analytics signup lead time failed: {e}")
+        db.session.rollback()
 
     # --- Attendance trends broken out by meeting description (gender/audience) ---
     # Map gender_restriction values to friendly labels
@@ -6445,42 +8487,25 @@ def admin_analytics():
         None:     '#0f6f75',
     }
 
-    # Find which gender categories exist in the date range
-    existing_genders = [
-        row[0]
-        for row in db.session.query(Meeting.gender_restriction)
-        .filter(Meeting.event_date >= filter_start, Meeting.event_date <= filter_end)
-        .distinct().all()
-    ]
-    # Normalise: treat any non-male/female value as None (Coed)
+    # One GROUP BY over (week since filter_start, audience); the rollup stores
+    # any non-male/female value as '' (Coed)
+    week_index = (days_between(filter_start, MeetingDailyStat.stat_date) // 7).label('week')
+    trend_rows = db.session.query(
+        week_index, MeetingDailyStat.gender, func.sum(MeetingDailyStat.total_meetings)
+    ).filter(in_range).group_by(week_index, MeetingDailyStat.gender).all()
+    trend_rows = [(week, gender or None, int(count)) for week, gender, count in trend_rows if count]
+
     existing_keys = sorted(
-        set(g if g in ('male', 'female') else None for g in existing_genders),
+        set(row[1] for row in trend_rows),
         key=lambda x: (x is None, x or '')
     )
-
-    trend_labels = []
-    type_series = {k: [] for k in existing_keys}
-
-    current_date = filter_start
-    while current_date <= filter_end:
-        week_end = min(current_date + timedelta(days=6), filter_end)
-        trend_labels.append(current_date.strftime('%m/%d'))
-        for gkey in existing_keys:
-            if gkey is None:
-                count = Meeting.query.filter(
-                    Meeting.event_date >= current_date,
-                    Meeting.event_date <= week_end,
-                    Meeting.gender_restriction.notin_(['male', 'female'])
-                    | Meeting.gender_restriction.is_(None)
-                ).count()
-            else:
-                count = Meeting.query.filter(
-                    Meeting.event_date >= current_date,
-                    Meeting.event_date <= week_end,
-                    Meeting.gender_restriction == gkey
-                ).count()
-            type_series[gkey].append(count)
-        current_date += timedelta(weeks=1)
+    week_count = (filter_end - filter_start).days // 7 + 1
+    trend_labels = [
+        (filter_start + timedelta(weeks=i)).strftime('%m/%d') for i in range(week_count)
+    ]
+    type_series = {k: [0] * week_count for k in existing_keys}
+    for week, gkey, count in trend_rows:
+        type_series[gkey][int(week)] += count
 
     datasets = []
     for gkey in existing_keys:
@@ -6501,12 +8526,14 @@ def admin_analytics():
     }
 
     # --- Meeting audience distribution (gender_restriction) for donut chart ---
-    gender_dist = db.session.query(
-        Meeting.gender_restriction,
-        func.count(Meeting.id)
-    ).filter(
-        Meeting.event_date >= filter_start, Meeting.event_date <= filter_end
-    ).group_by(Meeting.gender_restriction).all()
+    gender_dist = [
+        (gender or None, int(count))
+        for gender, count in db.session.query(
+            MeetingDailyStat.gender,
+            func.sum(MeetingDailyStat.total_meetings)
+        ).filter(in_range).group_by(MeetingDailyStat.gender).all()
+        if count
+    ]
 
     _gender_label_map = {'male': "Men's Meeting", 'female': "Women's Meeting"}
     _gender_color_map = {'male': '#17a2b8', 'female': '#e83e8c', None: '#0f6f75'}
@@ -6519,29 +8546,17 @@ def admin_analytics():
 
     # --- Popular time slots (scoped) ---
     try:
-        if dialect == "sqlite":
-            counts = {}
-            for m in Meeting.query.filter(
-                Meeting.start_time.isnot(None),
-                Meeting.event_date >= filter_start,
-                Meeting.event_date <= filter_end
-            ).all():
-                try:
-                    h = int(m.start_time.hour)
-                except Exception:
-                    continue
-                counts[h] = counts.get(h, 0) + 1
-            time_slots = sorted([(h, c) for h, c in counts.items()], key=lambda x: x[0])
-        else:
-            time_slots = db.session.query(
-                func.hour(Meeting.start_time).label('hour'),
-                func.count(Meeting.id).label('count')
-            ).filter(
-                Meeting.start_time.isnot(None),
-                Meeting.event_date >= filter_start,
-                Meeting.event_date <= filter_end
-            ).group_by('hour').order_by('hour').all()
-    except Exception:
+        hour = hour_of(Meeting.start_time).label('hour')
+        time_slots = db.session.query(
+            hour, func.count(Meeting.id).label('count')
+        ).filter(
+            Meeting.start_time.isnot(None),
+            Meeting.event_date >= filter_start,
+            Meeting.event_date <= filter_end
+        ).group_by(hour).order_by(hour).all()
+    except Exception as e:
+        app.logger.warning(f"Analytics time slots failed: {e}")
+        db.session.rollback()
         time_slots = []
 
     time_slots_data = {
@@ -6553,24 +8568,15 @@ def admin_analytics():
     day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
     weekly_data = [0] * 7
     try:
-        if dialect == "sqlite":
-            for m in Meeting.query.filter(
-                Meeting.event_date.isnot(None),
-                Meeting.event_date >= filter_start,
-                Meeting.event_date <= filter_end
-            ).all():
-                idx = (m.event_date.weekday() + 1) % 7
-                weekly_data[idx] += 1
-        else:
-            weekly_dist = db.session.query(
-                func.dayofweek(Meeting.event_date).label('day'),
-                func.count(Meeting.id).label('count')
-            ).filter(
-                Meeting.event_date >= filter_start, Meeting.event_date <= filter_end
-            ).group_by('day').order_by('day').all()
-            for day, count in weekly_dist:
-                weekly_data[int(day) - 1] = count
-    except Exception:
+        weekday = weekday_of(MeetingDailyStat.stat_date).label('day')
+        weekly_dist = db.session.query(
+            weekday, func.sum(MeetingDailyStat.total_meetings).label('count')
+        ).filter(in_range).group_by(weekday).all()
+        for day, count in weekly_dist:
+            weekly_data[int(day)] = int(count or 0)
+    except Exception as e:
+        app.logger.warning(f"Analytics weekday distribution failed: {e}")
+        db.session.rollback()
         weekly_data = [0] * 7
 
     weekly_distribution_data = {
@@ -6608,7 +8614,8 @@ def admin_analytics():
         User.id,
         User.display_name,
         User.chair_points,
-        User.profile_image
+        User.has_profile_image,
+        User.profile_image_hash
     ).filter(User.chair_points > 0).order_by(User.chair_points.desc()).limit(20).all()
 
     return render_template(
@@ -6639,6 +8646,9 @@ def admin_security():
     if not current_user.is_admin:
         abort(403)
     
+    # Make sure queued audit events show up
+    audit_writer.flush()
+    
     # Security overview stats
     total_users = User.query.count()
     active_sessions = AuditLog.query.filter(
@@ -6686,8 +8696,9 @@ def admin_create_backup():
     
     try:
         # Check rate limiting
-        if not check_rate_limit('manual_backup', current_user.id, 5):  # Max 5 per hour
-            return jsonify({"success": False, "error": "Too many backup requests. Please try again later."}), 429
+        retry_after = check_rate_limit('manual_backup', current_user.id, 5)  # Max 5 per hour
+        if retry_after:
+            return rate_limited_response(retry_after, message="Too many backup requests. Please try again later.")
         
         backup_log = backup_database('manual', current_user.id)
         return jsonify({"success": True, "backup_id": backup_log.id})
@@ -6738,8 +8749,9 @@ def admin_bulk_delete_meetings():
             return jsonify({"success": False, "error": "Some meetings not found"}), 404
         
         # Check rate limiting
-        if not check_rate_limit('bulk_delete', current_user.id, 3):  # Max 3 bulk deletes per hour
-            return jsonify({"success": False, "error": "Too many bulk operations. Please try again later."}), 429
+        retry_after = check_rate_limit('bulk_delete', current_user.id, 3)  # Max 3 bulk deletes per hour
+        if retry_after:
+            return rate_limited_response(retry_after, message="Too many bulk operations. Please try again later.")
         
         # Delete meetings and associated chair signups
         deleted_count = 0
@@ -6749,21 +8761,20 @@ def admin_bulk_delete_meetings():
                 'title': meeting.title,
                 'date': meeting.event_date.isoformat(),
                 'bulk_operation': True
-            })
+            }, commit=False)
             
             db.session.delete(meeting)
             deleted_count += 1
         
+        log_audit_event('bulk_delete_meetings', current_user.id, details={
+            'meeting_count': deleted_count,
+            'meeting_ids': meeting_ids
+        }, commit=False)
         db.session.commit()
         
         # Invalidate caches
         invalidate_meeting_caches()
         
-        log_audit_event('bulk_delete_meetings', current_user.id, details={
-            'meeting_count': deleted_count,
-            'meeting_ids': meeting_ids
-        })
-        
         return jsonify({"success": True, "deleted_count": deleted_count})
         
     except Exception as e:
@@ -6803,39 +8814,33 @@ def admin_export_meetings():
 
 def export_meetings_csv(meetings):
     """Export meetings as CSV."""
-    import csv
-    from io import StringIO
-    
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        'ID', 'Title', 'Description', 'Date', 'Start Time', 'End Time', 
+    def rows():
+        for meeting in meetings:
+            chair = meeting.chair_signup
+            chair_user = chair.user if chair else None
+            yield [
+                meeting.id,
+                meeting.title,
+                meeting.description or '',
+                meeting.event_date.strftime('%Y-%m-%d'),
+                meeting.start_time.strftime('%H:%M') if meeting.start_time else '',
+                meeting.end_time.strftime('%H:%M') if meeting.end_time else '',
+                meeting.meeting_type,
+                chair.display_name_snapshot if chair else '',
+                chair_user.email if chair_user else '',
+                chair_user.bp_id if chair_user else '',
+                meeting.zoom_link or ''
+            ]
+
+    header = [
+        'ID', 'Title', 'Description', 'Date', 'Start Time', 'End Time',
         'Meeting Type', 'Chair Name', 'Chair Email', 'Chair BP ID', 'Zoom Link'
-    ])
-    
-    # Write meeting data
-    for meeting in meetings:
-        chair = meeting.chair_signup
-        writer.writerow([
-            meeting.id,
-            meeting.title,
-            meeting.description or '',
-            meeting.event_date.strftime('%Y-%m-%d'),
-            meeting.start_time.strftime('%H:%M') if meeting.start_time else '',
-            meeting.end_time.strftime('%H:%M') if meeting.end_time else '',
-            meeting.meeting_type,
-            chair.display_name_snapshot if chair else '',
-            chair.user.email if chair else '',
-            chair.user.bp_id if chair else '',
-            meeting.zoom_link or ''
-        ])
-    
-    # Create response
-    response = make_response(output.getvalue())
-    response.headers['Content-Type'] = 'text/csv'
-    response.headers['Content-Disposition'] = f'attachment; filename=meetings_export_{date.today().isoformat()}.csv'
+    ]
+    response = streaming_download(
+        iter_csv_chunks(header, rows()),
+        'text/csv',
+        f'meetings_export_{date.today().isoformat()}.csv',
+    )
     
     log_audit_event('export_meetings', get_current_user().id, details={
         'format': 'csv',
@@ -6847,31 +8852,14 @@ def export_meetings_csv(meetings):
 
 def export_meetings_ics(meetings):
     """Export meetings as ICS calendar file."""
-    cal = Calendar()
-    cal.add('prodid', '-//Back Porch Meetings Export//backporchmeetings.org//')
-    cal.add('version', '2.0')
-    cal.add('x-wr-calname', 'Back Porch Meetings Export')
-    
-    for meeting in meetings:
-        event = Event()
-        start_dt = datetime.combine(meeting.event_date, meeting.start_time)
-        end_dt = datetime.combine(meeting.event_date, meeting.end_time) if meeting.end_time else start_dt + timedelta(hours=1)
-        
-        event.add('summary', meeting.title)
-        event.add('dtstart', start_dt)
-        event.add('dtend', end_dt)
-        event.add('location', meeting.zoom_link or 'Online')
-        
-        description = meeting.description or ''
-        if meeting.chair_signup:
-            description += f"\n\nChair: {meeting.chair_signup.display_name_snapshot} ({meeting.chair_signup.user.bp_id})"
-        
-        event.add('description', description)
-        event.add('uid', f"export-meeting-{meeting.id}@backporchmeetings.org")
-        
-        cal.add_component(event)
+    ics_bytes = build_meetings_ics(
+        meetings,
+        variant="export",
+        calname='Back Porch Meetings Export',
+        prodid='-//Back Porch Meetings Export//backporchmeetings.org//',
+    )
     
-    response = make_response(cal.to_ical())
+    response = make_response(ics_bytes)
     response.headers['Content-Type'] = 'text/calendar; charset=utf-8'
     response.headers['Content-Disposition'] = f'attachment; filename=meetings_export_{date.today().isoformat()}.ics'
     
@@ -6929,13 +8917,25 @@ def admin_email_chairs():
         # Send emails
         sent_count = 0
         failed_count = 0
-        for user in users:
+        if mail_configured() and app.config.get("EMAIL_OUTBOX_ENABLED", True):
+            # Queue the whole list in one transaction
             try:
-                send_email(user.email, subject, message)
-                sent_count += 1
+                for user in users:
+                    enqueue_email(user.email, subject, message, commit=False)
+                db.session.commit()
+                sent_count = len(users)
             except Exception as e:
-                failed_count += 1
-                app.logger.error(f"Failed to send email to {user.email}: {e}")
+                db.session.rollback()
+                failed_count = len(users)
+                app.logger.error(f"Failed to queue chair emails: {e}")
+        else:
+            for user in users:
+                try:
+                    send_email(user.email, subject, message)
+                    sent_count += 1
+                except Exception as e:
+                    failed_count += 1
+                    app.logger.error(f"Failed to send email to {user.email}: {e}")
         
         flash(f"Sent {sent_count} emails. {failed_count} failed.", "success" if failed_count == 0 else "warning")
         log_audit_event('bulk_email_chairs', get_current_user().id, details={
@@ -7010,6 +9010,7 @@ def admin_assign_chair(meeting_id):
     )
     db.session.add(signup)
     db.session.commit()
+    invalidate_meeting_caches()
     
     flash(f"Assigned {chair_name} to chair this meeting.", "success")
     log_audit_event('assign_chair', get_current_user().id, details={
@@ -7081,6 +9082,7 @@ def api_admin_assign_chair(meeting_id):
         )
         db.session.add(signup)
         db.session.commit()
+        invalidate_meeting_caches()
     except Exception as e:
         db.session.rollback()
         app.logger.error(f"Error assigning chair: {e}")
@@ -7137,6 +9139,7 @@ def api_admin_clear_chair(meeting_id):
             name = meeting.chair_signup.display_name_snapshot
             db.session.delete(meeting.chair_signup)
             db.session.commit()
+            invalidate_meeting_caches()
             log_audit_event('clear_chair', current.id, details={
                 'meeting_id': meeting_id,
                 'cleared_name': name,
@@ -7195,6 +9198,7 @@ def api_admin_bulk_assign_chair():
             assigned.append(mid)
 
         db.session.commit()
+        invalidate_meeting_caches()
     except Exception as e:
         db.session.rollback()
         app.logger.error(f"Error in bulk assign: {e}")
@@ -7319,6 +9323,12 @@ def init_db_command():
     else:
         print("Admin already exists.")
 
+    # First deploy of the daily rollup: fill it from existing meetings
+    if MeetingDailyStat.query.first() is None:
+        print(f"Built meeting_daily_stats ({rebuild_meeting_daily_stats()} rows).")
+    if UserServiceStat.query.first() is None:
+        print(f"Built user_service_stats ({rebuild_user_service_stats()} rows).")
+
     # Schedule weekly open slots reminder (only in development)
     # Skip scheduler in Heroku release phase
     if scheduler and not os.environ.get('DYNO'):
@@ -7389,6 +9399,62 @@ def upgrade_schema_command():
             except Exception as e:
                 print(f"Skipped adding sponsors.profile_image: {e}")
 
+    # Out-of-row image storage: hash columns on users/sponsors (image_blobs comes from create_all)
+    for table in ('users', 'sponsors'):
+        if table in inspector.get_table_names():
+            cols = [c['name'] for c in inspector.get_columns(table)]
+            if 'profile_image_hash' not in cols:
+                try:
+                    conn.execute(db.text(f"ALTER TABLE {table} ADD COLUMN profile_image_hash VARCHAR(64) NULL"))
+                    conn.execute(db.text(f"CREATE INDEX ix_{table}_profile_image_hash ON {table} (profile_image_hash)"))
+                    conn.commit()
+                    print(f"Added {table}.profile_image_hash")
+                except Exception as e:
+                    print(f"Skipped adding {table}.profile_image_hash: {e}")
+
+    # UTC start/end instants on meetings (notification_ledger comes from create_all)
+    if 'meetings' in inspector.get_table_names():
+        cols = [c['name'] for c in inspector.get_columns('meetings')]
+        if 'starts_at_utc' not in cols:
+            try:
+                conn.execute(db.text("ALTER TABLE meetings ADD COLUMN starts_at_utc DATETIME NULL"))
+                conn.execute(db.text("CREATE INDEX ix_meetings_starts_at_utc ON meetings (starts_at_utc)"))
+                conn.commit()
+                print("Added meetings.starts_at_utc")
+            except Exception as e:
+                print(f"Skipped adding meetings.starts_at_utc: {e}")
+        if 'ends_at_utc' not in cols:
+            try:
+                conn.execute(db.text("ALTER TABLE meetings ADD COLUMN ends_at_utc DATETIME NULL"))
+                conn.commit()
+                print("Added meetings.ends_at_utc")
+            except Exception as e:
+                print(f"Skipped adding meetings.ends_at_utc: {e}")
+
+    # Per-row revision keying the cached ICS fragments
+    if 'meetings' in inspector.get_table_names():
+        cols = [c['name'] for c in inspector.get_columns('meetings')]
+        if 'revision' not in cols:
+            try:
+                conn.execute(db.text("ALTER TABLE meetings ADD COLUMN revision INTEGER NOT NULL DEFAULT 1"))
+                conn.commit()
+                print("Added meetings.revision")
+            except Exception as e:
+                print(f"Skipped adding meetings.revision: {e}")
+
+    # Certificate registry index on quiz_attempts
+    if 'quiz_attempts' in inspector.get_table_names():
+        existing = [ix['name'] for ix in inspector.get_indexes('quiz_attempts')]
+        if 'ix_quiz_attempts_passed_user' not in existing:
+            try:
+                conn.execute(db.text(
+                    "CREATE INDEX ix_quiz_attempts_passed_user ON quiz_attempts (passed, user_id, completed_at)"
+                ))
+                conn.commit()
+                print("Added ix_quiz_attempts_passed_user")
+            except Exception as e:
+                print(f"Skipped adding ix_quiz_attempts_passed_user: {e}")
+
     # Ensure sponsor_accounts and sponsor_requests tables exist (create_all will create them for SQLAlchemy DBs)
     try:
         db.create_all()
@@ -7396,9 +9462,67 @@ def upgrade_schema_command():
         print(f"db.create_all() skipped/failed: {e}")
 
     conn.close()
+    try:
+        print(f"Backfilled UTC start/end instants on {backfill_meeting_instants()} meetings.")
+    except Exception as e:
+        print(f"Meeting instant backfill skipped/failed: {e}")
     print("Schema upgrade complete.")
 
 
+@app.cli.command("migrate-images")
+def migrate_images_command():
+    """Move legacy base64 profile/sponsor photos into the image_blobs table and render
+    thumbnails for any stored image that lacks them.
+    Run once after upgrade-schema: flask --app app.py migrate-images
+    Optionally set BATCH_SIZE env variable (default 50 rows per commit).
+    """
+    db.create_all()
+    moved = migrate_legacy_profile_images(batch_size=int(os.environ.get("BATCH_SIZE", "50")))
+    print(f"Moved {moved['users']} user and {moved['sponsors']} sponsor images "
+          f"({moved['failed']} could not be decoded).")
+    print(f"Rendered thumbnails for {backfill_image_variants()} stored images.")
+
+
+@app.cli.command("rebuild-daily-stats")
+def rebuild_daily_stats_command():
+    """Recount the meeting_daily_stats rollup from the meetings table.
+    Run once after deploying the rollup (the worker also reconciles nightly):
+    flask --app app.py rebuild-daily-stats
+    """
+    db.create_all()
+    print(f"Wrote {rebuild_meeting_daily_stats()} meeting_daily_stats rows.")
+
+
+@app.cli.command("send-email-outbox")
+def send_email_outbox_command():
+    """Send every due email in the outbox, then exit.
+    For hosts without a worker process (DreamHost), run it from cron every minute:
+    flask --app app.py send-email-outbox
+    """
+    result = drain_email_outbox()
+    print(f"Sent {result['sent']}, {result['failed']} to retry, {result['dead']} dead-lettered.")
+
+
+@app.cli.command("backfill-meeting-times")
+@click.option("--all", "recompute", is_flag=True, help="Recheck every meeting, not just ones missing instants.")
+def backfill_meeting_times_command(recompute):
+    """Fill meetings.starts_at_utc / ends_at_utc from the Eastern date and times.
+    Run after upgrade-schema, or with --all after editing meeting times by raw SQL:
+    flask --app app.py backfill-meeting-times [--all]
+    """
+    print(f"Updated UTC start/end instants on {backfill_meeting_instants(recompute)} meetings.")
+
+
+@app.cli.command("rebuild-service-stats")
+def rebuild_service_stats_command():
+    """Recompute user_service_stats for every user in one bulk statement.
+    Run after deploying the table or after editing chair_signups by hand:
+    flask --app app.py rebuild-service-stats
+    """
+    db.create_all()
+    print(f"Wrote {rebuild_user_service_stats()} user_service_stats rows.")
+
+
 @app.cli.command("import-ics")
 def import_ics_command():
     """Import meetings from ICS URL defined in env var SOURCE_MEETINGS_ICS_URL.
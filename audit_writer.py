@@ -0,0 +1,94 @@
+"""
+Write-behind buffer for audit log rows.
+
+Callers hand over plain dicts; a daemon thread drains the queue and passes
+batches to a flush callback (a single bulk INSERT in the app), so request
+handlers no longer pay a commit per audit event. The queue is bounded: when it
+is full the caller waits briefly and then drains a batch itself, which slows
+producers down instead of dropping events.
+"""
+
+import os
+import queue
+import threading
+
+
+class AuditWriter:
+    """Bounded in-process queue of audit rows flushed in batches."""
+
+    def __init__(self, flush_batch, max_queue=5000, batch_size=200, flush_interval=2.0, block_timeout=0.5):
+        self.flush_batch = flush_batch
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.written = 0
+        self.failed = 0
+        self.backpressure_flushes = 0
+
+    def enqueue(self, row):
+        """Queue one row, applying backpressure when the buffer is full."""
+        self._ensure_started()
+        try:
+            self._queue.put(row, timeout=self.block_timeout)
+        except queue.Full:
+            # Writer can't keep up: do a batch of its work on this thread, then retry.
+            self.backpressure_flushes += 1
+            self._drain_once()
+            self._queue.put(row)
+
+    def flush(self):
+        """Synchronously write everything queued so far."""
+        while self._drain_once():
+            pass
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _ensure_started(self):
+        # Started lazily (and again after a fork) so each worker process gets its own thread.
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _take_batch(self, first=None):
+        batch = [] if first is None else [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        if not batch:
+            return
+        with self._flush_lock:
+            try:
+                self.flush_batch(batch)
+                self.written += len(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                print(f"Failed to write {len(batch)} audit events: {e}")
+
+    def _drain_once(self):
+        batch = self._take_batch()
+        self._write(batch)
+        return bool(batch)
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            self._write(self._take_batch(first))
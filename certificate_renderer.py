@@ -0,0 +1,245 @@
+"""
+Render chairperson training certificates onto the custom PNG template.
+
+Decoding the full-page template and loading the large TrueType fonts used to
+take most of every /certificate request. CertificateRenderer keeps the
+decoded template and the fonts in memory for the life of the process. A
+render copies the template, draws the name and date, and hands the image to
+ReportLab directly. The old round trip through an in-memory PNG encoded and
+decoded every pixel once more for an identical PDF.
+
+Rendered PDFs are meant to be stored under cache_key(). The key covers the
+user, the certificate's attempt, the printed name and the template's content
+hash, so replacing the PNG or renaming a user produces a fresh certificate.
+
+Bulk exports render on CertificateExportPool. Drawing and ReportLab's
+compression hold the GIL for most of a render, so it fans out to worker
+processes, each with its own cached template.
+
+Pillow and ReportLab are optional: without them, or without a template file,
+render() returns None and callers fall back to the programmatic certificate.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from io import BytesIO
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except Exception:
+    Image = None
+    ImageDraw = None
+    ImageFont = None
+    PIL_AVAILABLE = False
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+    REPORTLAB_AVAILABLE = True
+except Exception:
+    letter = None
+    ImageReader = None
+    canvas = None
+    REPORTLAB_AVAILABLE = False
+
+# Bump when the layout changes so stored certificates are rendered again
+RENDER_VERSION = 1
+
+# ===== CERTIFICATE POSITIONING CONFIGURATION =====
+# Fractions of the template height from the top (0.0 = top, 1.0 = bottom)
+NAME_LINE_POSITION = 0.48   # Where the name line appears on the template
+DATE_LINE_POSITION = 0.78   # Where the date line appears on the template
+DATE_LEFT_POSITION = 0.18   # Date starts 18% from the left edge
+# ~32pt / ~20pt on a letter page at 300dpi
+NAME_FONT_SIZE = 350
+DATE_FONT_SIZE = 220
+# =================================================
+
+FONT_CANDIDATES = ("arialbd.ttf", "arial.ttf")
+TEXT_COLOR = (0, 0, 0)
+
+
+@lru_cache(maxsize=8)
+def load_font(size):
+    """First available TrueType font at ``size``; Pillow's default font otherwise."""
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, size)
+        except Exception:
+            continue
+    return ImageFont.load_default()
+
+
+def _flatten(img):
+    """RGB copy of the template; transparent areas become white."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+class CertificateRenderer:
+    """Process-wide holder of the decoded certificate template.
+
+    The template is re-read only when the file's mtime or size changes.
+    """
+
+    def __init__(self, template_path):
+        self.template_path = template_path
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._template = None
+        self._template_hash = None
+
+    def _load(self):
+        """Return ``(image, sha256)`` for the current template file, or None."""
+        if not PIL_AVAILABLE:
+            return None
+        try:
+            st = os.stat(self.template_path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if self._stamp != stamp:
+                with open(self.template_path, "rb") as f:
+                    data = f.read()
+                with Image.open(BytesIO(data)) as src:
+                    self._template = _flatten(src)
+                self._template_hash = hashlib.sha256(data).hexdigest()
+                self._stamp = stamp
+            return self._template, self._template_hash
+
+    @property
+    def template_hash(self):
+        """Content hash of the template, or None when the custom certificate is unavailable."""
+        if not REPORTLAB_AVAILABLE:
+            return None
+        loaded = self._load()
+        return loaded[1] if loaded else None
+
+    def cache_key(self, user_id, attempt_id, display_name):
+        """Storage key for one user's certificate as rendered right now."""
+        template = self.template_hash or "standard"
+        raw = f"{RENDER_VERSION}:{template}:{user_id}:{attempt_id}:{display_name}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def render(self, display_name, completed_at):
+        """PDF bytes of the custom certificate, or None when it can't be rendered."""
+        if not REPORTLAB_AVAILABLE:
+            return None
+        loaded = self._load()
+        if loaded is None:
+            return None
+        page = loaded[0].copy()
+        img_width, img_height = page.size
+        draw = ImageDraw.Draw(page)
+        name_font = load_font(NAME_FONT_SIZE)
+        date_font = load_font(DATE_FONT_SIZE)
+
+        # Bottom of the text sits on the template's name line, centred
+        left, top, right, bottom = draw.textbbox((0, 0), display_name, font=name_font)
+        name_x = (img_width - (right - left)) // 2
+        name_y = int(img_height * NAME_LINE_POSITION) - (bottom - top)
+        draw.text((name_x, name_y), display_name, fill=TEXT_COLOR, font=name_font)
+
+        date_text = completed_at.strftime('%B %d, %Y')
+        left, top, right, bottom = draw.textbbox((0, 0), date_text, font=date_font)
+        date_x = int(img_width * DATE_LEFT_POSITION)
+        date_y = int(img_height * DATE_LINE_POSITION) - (bottom - top)
+        draw.text((date_x, date_y), date_text, fill=TEXT_COLOR, font=date_font)
+
+        # Fit the page inside letter size, keeping the aspect ratio, centred
+        buffer = BytesIO()
+        c = canvas.Canvas(buffer, pagesize=letter)
+        width, height = letter
+        aspect = img_width / img_height
+        if aspect > (width / height):
+            new_width, new_height = width, width / aspect
+        else:
+            new_width, new_height = height * aspect, height
+        c.drawImage(ImageReader(page), (width - new_width) / 2, (height - new_height) / 2,
+                    width=new_width, height=new_height)
+        c.save()
+        return buffer.getvalue()
+
+
+# One renderer per template in each export worker process
+_process_renderers = {}
+
+
+def render_certificate(template_path, display_name, completed_at):
+    """Process pool entry point: render() with this process's cached template."""
+    renderer = _process_renderers.get(template_path)
+    if renderer is None:
+        renderer = _process_renderers[template_path] = CertificateRenderer(template_path)
+    return renderer.render(display_name, completed_at)
+
+
+class CertificateExportPool:
+    """Renders many certificates on a bounded process pool.
+
+    Workers are started lazily with "spawn", so they don't inherit the web
+    process's threads or database connections, and stay up for later exports.
+    At most ``workers * 2`` renders are in flight, which bounds the finished
+    PDFs held in memory while the caller streams them out.
+    """
+
+    def __init__(self, renderer, workers=2):
+        self.renderer = renderer
+        self.workers = max(1, workers)
+        self._executor = None
+
+    def render_many(self, jobs):
+        """Yield ``(key, pdf_or_None)`` for ``(key, display_name, completed_at)`` jobs as they finish.
+
+        None means the custom certificate couldn't be rendered for that job.
+        """
+        jobs = iter(jobs)
+        if self.workers == 1:
+            for key, display_name, completed_at in jobs:
+                yield key, self._render_inline(display_name, completed_at)
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        template_path = self.renderer.template_path
+        pending = {}
+        while True:
+            for key, display_name, completed_at in jobs:
+                future = self._executor.submit(render_certificate, template_path, display_name, completed_at)
+                pending[future] = key
+                if len(pending) >= self.workers * 2:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    yield key, future.result()
+                except Exception as e:
+                    print(f"Certificate render failed: {e}")
+                    yield key, None
+
+    def _render_inline(self, display_name, completed_at):
+        try:
+            return self.renderer.render(display_name, completed_at)
+        except Exception as e:
+            print(f"Certificate render failed: {e}")
+            return None
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
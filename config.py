@@ -51,6 +51,26 @@ class Config:
     MAIL_PASSWORD = os.environ.get("MAIL_PASSWORD")
     MAIL_DEFAULT_SENDER = os.environ.get("MAIL_DEFAULT_SENDER", "noreply@backporchmeetings.org")
 
+    # Outgoing email is queued in email_outbox and sent by the worker's sender loop
+    # (worker.py, or cron_worker.py on DreamHost). Set EMAIL_OUTBOX_ENABLED=false
+    # to send inline from the web request when no sender process runs.
+    EMAIL_OUTBOX_ENABLED = os.environ.get("EMAIL_OUTBOX_ENABLED", "True").lower() == "true"
+    EMAIL_OUTBOX_BATCH_SIZE = int(os.environ.get("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+    # Per-minute send cap across all senders (same syntax as the rate limits below).
+    EMAIL_OUTBOX_RATE = os.environ.get("EMAIL_OUTBOX_RATE", "60/minute")
+    # Failed sends retry after base * 2^(attempt-1) seconds, capped; then dead-lettered.
+    EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS = int(os.environ.get("EMAIL_OUTBOX_RETRY_BASE_SECONDS", "60"))
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS = int(os.environ.get("EMAIL_OUTBOX_RETRY_MAX_SECONDS", "21600"))
+    # A sender that dies mid-batch loses its claim after this long.
+    EMAIL_OUTBOX_LEASE_SECONDS = int(os.environ.get("EMAIL_OUTBOX_LEASE_SECONDS", "300"))
+    EMAIL_OUTBOX_POLL_SECONDS = float(os.environ.get("EMAIL_OUTBOX_POLL_SECONDS", "5"))
+    # Sender threads in worker.py, each with its own SMTP session; lease claims keep
+    # their batches apart and EMAIL_OUTBOX_RATE is shared between them.
+    EMAIL_OUTBOX_SENDERS = int(os.environ.get("EMAIL_OUTBOX_SENDERS", "2"))
+    # Recipients loaded (and queued in one transaction) per step of a bulk email.
+    BROADCAST_CHUNK_SIZE = int(os.environ.get("BROADCAST_CHUNK_SIZE", "500"))
+
     # Scheduler configuration
     SCHEDULER_API_ENABLED = True
 
@@ -148,6 +168,79 @@ class Config:
     # If True, send a welcome/confirmation email to the registering user (chair + sponsor).
     SEND_REGISTRATION_CONFIRMATION_TO_USER = os.environ.get("SEND_REGISTRATION_CONFIRMATION_TO_USER", "True").lower() == "true"
 
+    # ==========================
+    # Caching
+    # ==========================
+    # Every worker keeps up to CACHE_LOCAL_MAX_ENTRIES hot entries in memory in front
+    # of Redis (REDIS_URL), for at most CACHE_LOCAL_TTL seconds: the longest another
+    # worker may serve a value after it was replaced. Generation bumps (cache_generations
+    # table) reach every worker at once, with or without Redis.
+    CACHE_LOCAL_MAX_ENTRIES = int(os.environ.get("CACHE_LOCAL_MAX_ENTRIES", "2000"))
+    CACHE_LOCAL_TTL = float(os.environ.get("CACHE_LOCAL_TTL", "5"))
+    # A missing value is rebuilt by one worker while the others wait up to
+    # CACHE_LOCK_WAIT seconds; the build lock expires after CACHE_LOCK_TIMEOUT.
+    CACHE_LOCK_TIMEOUT = int(os.environ.get("CACHE_LOCK_TIMEOUT", "30"))
+    CACHE_LOCK_WAIT = float(os.environ.get("CACHE_LOCK_WAIT", "5"))
+    # How eagerly hot entries are rebuilt ahead of expiry (0 disables early refresh).
+    CACHE_EARLY_REFRESH_BETA = float(os.environ.get("CACHE_EARLY_REFRESH_BETA", "1.0"))
+    # Month calendar snapshots are invalidated by the meetings data version, so this
+    # is only an upper bound on how long an unused snapshot stays in the cache.
+    CALENDAR_SNAPSHOT_TIMEOUT = int(os.environ.get("CALENDAR_SNAPSHOT_TIMEOUT", "3600"))
+    # Max rendered VEVENT fragments kept per process for the ICS feeds.
+    ICS_FRAGMENT_CACHE_SIZE = int(os.environ.get("ICS_FRAGMENT_CACHE_SIZE", "20000"))
+    # /api/day-meetings and /api/week-meetings: server-side row cache and HTTP max-age (seconds).
+    CALENDAR_API_CACHE_SECONDS = int(os.environ.get("CALENDAR_API_CACHE_SECONDS", "60"))
+    CALENDAR_API_MAX_AGE = int(os.environ.get("CALENDAR_API_MAX_AGE", "30"))
+    # Admin dashboard statistics are cached per day and meetings/analytics generation;
+    # this bounds how long renamed chairs take to show.
+    ADMIN_STATS_CACHE_SECONDS = int(os.environ.get("ADMIN_STATS_CACHE_SECONDS", "300"))
+
+    # ==========================
+    # Audit log
+    # ==========================
+    # Audit events are queued and bulk-inserted by a background thread. Set to
+    # false to write each event inline (always the case when TESTING).
+    AUDIT_LOG_ASYNC = os.environ.get("AUDIT_LOG_ASYNC", "True").lower() == "true"
+    AUDIT_LOG_QUEUE_SIZE = int(os.environ.get("AUDIT_LOG_QUEUE_SIZE", "5000"))
+    AUDIT_LOG_BATCH_SIZE = int(os.environ.get("AUDIT_LOG_BATCH_SIZE", "200"))
+    AUDIT_LOG_FLUSH_SECONDS = float(os.environ.get("AUDIT_LOG_FLUSH_SECONDS", "2"))
+
+    # ==========================
+    # Uploaded images
+    # ==========================
+    # Photos are resized to these longest-edge sizes (WebP + JPEG) on a background
+    # thread pool; set IMAGE_PROCESSING_ASYNC=false to render inline (always when TESTING).
+    IMAGE_VARIANT_SIZES = os.environ.get("IMAGE_VARIANT_SIZES", "48,128,512")
+    IMAGE_PROCESSING_ASYNC = os.environ.get("IMAGE_PROCESSING_ASYNC", "True").lower() == "true"
+    IMAGE_PROCESSING_WORKERS = int(os.environ.get("IMAGE_PROCESSING_WORKERS", "2"))
+
+    # ==========================
+    # Certificates
+    # ==========================
+    # Bulk certificate exports render on this many worker processes (1 = inline).
+    CERTIFICATE_EXPORT_WORKERS = int(os.environ.get("CERTIFICATE_EXPORT_WORKERS", "2"))
+
+    # ==========================
+    # Rate limiting
+    # ==========================
+    # Limits look like "10/minute" or "10/15 minutes"; an empty value disables one.
+    # Storage "auto" uses Redis when REDIS_URL is set, otherwise per-process memory.
+    # Limits are not enforced when TESTING.
+    RATELIMIT_ENABLED = os.environ.get("RATELIMIT_ENABLED", "True").lower() == "true"
+    RATELIMIT_STORAGE = os.environ.get("RATELIMIT_STORAGE", "auto")
+    RATELIMIT_ALGORITHM = os.environ.get("RATELIMIT_ALGORITHM", "sliding_window")  # or token_bucket
+    RATELIMIT_LOGIN_PER_IP = os.environ.get("RATELIMIT_LOGIN_PER_IP", "30/5 minutes")
+    RATELIMIT_LOGIN_PER_EMAIL = os.environ.get("RATELIMIT_LOGIN_PER_EMAIL", "10/5 minutes")
+    RATELIMIT_KEY_CHECKS = os.environ.get("RATELIMIT_KEY_CHECKS", "20/10 minutes")
+    RATELIMIT_PUBLIC_API = os.environ.get("RATELIMIT_PUBLIC_API", "300/minute")
+
+    # ==========================
+    # Home page
+    # ==========================
+    # Days of meetings rendered server-side; later weeks load on scroll.
+    HOME_INITIAL_DAYS = int(os.environ.get("HOME_INITIAL_DAYS", "14"))
+    HOME_INITIAL_MAX_MEETINGS = int(os.environ.get("HOME_INITIAL_MAX_MEETINGS", "200"))
+
     # ==========================
     # Session Cookie Configuration (Safari Compatibility)
     # ==========================
@@ -8,6 +8,7 @@ from datetime import datetime
 from app import app
 from app import send_open_slot_reminder, import_meetings_from_ics, SOURCE_MEETINGS_ICS_URL
 from app import import_meetings_from_webpage, SOURCE_MEETINGS_WEB_URL
+from app import drain_email_outbox
 
 def main():
     with app.app_context():
@@ -29,6 +30,15 @@ def main():
                 print(f"Cron: Imported {count} meetings from Website.")
             except Exception as e:
                 print(f"Cron Website import failed: {e}")
+        # Deliver queued email; for prompt delivery also schedule
+        # `flask --app app.py send-email-outbox` every minute
+        if app.config.get("EMAIL_OUTBOX_ENABLED", True):
+            try:
+                result = drain_email_outbox()
+                if result["sent"] or result["failed"] or result["dead"]:
+                    print(f"Cron: Outbox sent {result['sent']}, {result['failed']} to retry, {result['dead']} dead-lettered.")
+            except Exception as e:
+                print(f"Cron outbox drain failed: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
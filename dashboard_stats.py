@@ -0,0 +1,179 @@
+"""
+Aggregate queries behind the admin dashboard statistics and charts.
+
+The dashboard used to issue one COUNT per coverage figure, per week and per
+chairperson. Everything here is answered with four GROUP BY/aggregate
+queries regardless of how many users or meetings exist:
+
+  1. upcoming meetings and how many have a chair
+  2. last 30 days grouped by (week bucket, gender restriction)
+  3. non-admin host count
+  4. top chairpersons grouped by user id
+
+When the meeting_daily_stats rollup model is passed, queries 1 and 2 read
+its per-day rows instead of joining meetings to chair signups.
+
+The models are passed in so the module stays free of app imports and can be
+benchmarked against a throwaway database (see tools/benchmark_dashboard_stats.py).
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import case, func
+
+COVERAGE_DAYS = 30
+TREND_WEEKS = 4
+TOP_PARTICIPANTS = 10
+
+# Meetings store 'male'/'female'; older rows and imports used 'men'/'women'.
+GENDER_BUCKETS = {
+    "male": "mens",
+    "men": "mens",
+    "female": "womens",
+    "women": "womens",
+}
+
+
+def _percent(part, whole):
+    return round((part / whole * 100) if whole > 0 else 0, 1)
+
+
+def _coverage(filled, total):
+    return {
+        "filled": filled,
+        "unfilled": total - filled,
+        "percent": _percent(filled, total),
+    }
+
+
+def week_bucket(event_date_column, today, weeks=TREND_WEEKS):
+    """SQL CASE mapping a date to its trend week (0 = the 7 days before today).
+
+    Today and anything older than ``weeks`` full weeks map to -1.
+    """
+    whens = [(event_date_column >= today, -1)]
+    for week in range(weeks):
+        whens.append((event_date_column >= today - timedelta(days=(week + 1) * 7), week))
+    return case(*whens, else_=-1)
+
+
+def _coverage_from_meetings(session, Meeting, ChairSignup, today):
+    filled = func.count(ChairSignup.id)
+    # chair_signups.meeting_id is unique, so the outer join never fans out
+    future = (
+        session.query(func.count(Meeting.id), filled)
+        .select_from(Meeting)
+        .outerjoin(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+        .filter(Meeting.event_date >= today)
+        .one()
+    )
+    bucket = week_bucket(Meeting.event_date, today).label("bucket")
+    recent = (
+        session.query(bucket, Meeting.gender_restriction, func.count(Meeting.id), filled)
+        .select_from(Meeting)
+        .outerjoin(ChairSignup, ChairSignup.meeting_id == Meeting.id)
+        .filter(
+            Meeting.event_date >= today - timedelta(days=COVERAGE_DAYS),
+            Meeting.event_date <= today,
+        )
+        .group_by(bucket, Meeting.gender_restriction)
+        .all()
+    )
+    return future, recent
+
+
+def _coverage_from_rollup(session, DailyStat, today):
+    total = func.coalesce(func.sum(DailyStat.total_meetings), 0)
+    filled = func.coalesce(func.sum(DailyStat.filled_meetings), 0)
+    future = session.query(total, filled).filter(DailyStat.stat_date >= today).one()
+    bucket = week_bucket(DailyStat.stat_date, today).label("bucket")
+    recent = (
+        session.query(bucket, DailyStat.gender, total, filled)
+        .filter(
+            DailyStat.stat_date >= today - timedelta(days=COVERAGE_DAYS),
+            DailyStat.stat_date <= today,
+        )
+        .group_by(bucket, DailyStat.gender)
+        .all()
+    )
+    return future, recent
+
+
+def compute_admin_dashboard(session, Meeting, ChairSignup, User, today, DailyStat=None):
+    """Return ``(admin_stats, admin_charts)`` for the admin dashboard."""
+    # 1. Upcoming coverage and 2. recent coverage by week bucket and gender
+    if DailyStat is not None:
+        (future_total, current_chairs), recent = _coverage_from_rollup(session, DailyStat, today)
+    else:
+        (future_total, current_chairs), recent = _coverage_from_meetings(session, Meeting, ChairSignup, today)
+    future_total, current_chairs = int(future_total), int(current_chairs)
+
+    totals = {"mens": [0, 0], "womens": [0, 0], "overall": [0, 0]}
+    weeks = [[0, 0] for _ in range(TREND_WEEKS)]
+    for week, gender, total, chaired in recent:
+        total, chaired = int(total), int(chaired)
+        for key in ("overall", GENDER_BUCKETS.get((gender or "").lower())):
+            if key:
+                totals[key][0] += total
+                totals[key][1] += chaired
+        if week is not None and 0 <= week < TREND_WEEKS:
+            weeks[week][0] += total
+            weeks[week][1] += chaired
+
+    # 3. Registered hosts
+    total_hosts = (
+        session.query(func.count(User.id))
+        .filter(User.is_admin == False)  # noqa: E712
+        .scalar()
+    )
+
+    # 4. Most active chairpersons
+    meeting_count = func.count(ChairSignup.id).label("meeting_count")
+    top = (
+        session.query(User.id, User.display_name, meeting_count)
+        .select_from(ChairSignup)
+        .join(Meeting, Meeting.id == ChairSignup.meeting_id)
+        .join(User, User.id == ChairSignup.user_id)
+        .filter(User.is_admin == False)  # noqa: E712
+        .group_by(User.id, User.display_name)
+        .order_by(meeting_count.desc(), User.id.asc())
+        .limit(TOP_PARTICIPANTS)
+        .all()
+    )
+
+    all_total = totals["overall"][0]
+    admin_stats = {
+        "total_hosts": total_hosts or 0,
+        "current_chairs": current_chairs,
+        "future_chairs_needed": future_total,
+        "chair_completion_percent": _percent(current_chairs, future_total),
+        "unfilled_chairs": future_total - current_chairs,
+    }
+    admin_charts = {
+        "mens_coverage": _coverage(totals["mens"][1], totals["mens"][0]),
+        "womens_coverage": _coverage(totals["womens"][1], totals["womens"][0]),
+        "overall_coverage": _coverage(totals["overall"][1], all_total),
+        # Oldest week first, labelled Week 1..N like the chart expects
+        "weekly_trend": [
+            {
+                "week": f"Week {TREND_WEEKS - week}",
+                "total": weeks[week][0],
+                "filled": weeks[week][1],
+                "percent": _percent(weeks[week][1], weeks[week][0]),
+            }
+            for week in reversed(range(TREND_WEEKS))
+        ],
+        "user_participation": [
+            {"name": name, "count": count, "percent": _percent(count, all_total)}
+            for _, name, count in top
+        ],
+    }
+    # Flat series read by the Chart.js scripts in dashboard.html
+    admin_charts.update(
+        weekly_labels=[w["week"] for w in admin_charts["weekly_trend"]],
+        weekly_filled=[w["filled"] for w in admin_charts["weekly_trend"]],
+        weekly_unfilled=[w["total"] - w["filled"] for w in admin_charts["weekly_trend"]],
+        top_users_names=[u["name"] for u in admin_charts["user_participation"]],
+        top_users_counts=[u["count"] for u in admin_charts["user_participation"]],
+    )
+    return admin_stats, admin_charts
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Local SMTP stand-in for exercising the email outbox without DreamHost.
+
+Speaks just enough SMTP for smtplib/Flask-Mail (EHLO, AUTH, MAIL, RCPT, DATA,
+RSET, NOOP, QUIT), accepts any login and keeps the messages it receives.
+It can also refuse recipients or fail the next few messages with a temporary
+error, to exercise retries and dead-lettering.
+
+Usage:
+    python debug_smtp.py [port]      # prints each message; default port 1025
+
+then run the app / worker with:
+    MAIL_SERVER=localhost MAIL_PORT=1025 MAIL_USE_SSL=False MAIL_USERNAME=dev MAIL_PASSWORD=dev
+"""
+
+import socketserver
+import sys
+import threading
+from email import message_from_bytes, policy
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        server = self.server.debug_server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 debug-smtp ready")
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, arg = line.decode("utf-8", "replace").strip().partition(" ")
+            command = command.upper()
+            if command == "EHLO":
+                self.wfile.write(b"250-debug-smtp\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME\r\n")
+            elif command == "HELO":
+                self.reply("250 debug-smtp")
+            elif command == "AUTH":
+                if arg.upper().startswith("LOGIN"):
+                    prompts = ["VXNlcm5hbWU6", "UGFzc3dvcmQ6"]  # "Username:", "Password:"
+                    if len(arg.split()) > 1:
+                        prompts = prompts[1:]  # username sent with the command
+                    for prompt in prompts:
+                        self.reply(f"334 {prompt}")
+                        self.rfile.readline()
+                elif arg.upper() == "PLAIN":
+                    self.reply("334 ")
+                    self.rfile.readline()
+                self.reply("235 Authentication successful")
+            elif command == "MAIL":
+                sender, recipients = arg.partition(":")[2].strip().strip("<>"), []
+                self.reply("250 OK")
+            elif command == "RCPT":
+                recipient = arg.partition(":")[2].strip().strip("<>")
+                if recipient in server.refuse:
+                    self.reply("550 No such user here")
+                else:
+                    recipients.append(recipient)
+                    self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data = self.rfile.readline()
+                    if not data or data in (b".\r\n", b".\n"):
+                        break
+                    lines.append(data[1:] if data.startswith(b"..") else data)
+                with server.lock:
+                    fail = server.fail_next > 0
+                    if fail:
+                        server.fail_next -= 1
+                    else:
+                        server.messages.append((sender, recipients, message_from_bytes(b"".join(lines), policy=policy.default)))
+                self.reply("451 Temporary failure, try again later" if fail else "250 OK: queued")
+                if not fail and server.echo:
+                    print(f"--- {sender} -> {', '.join(recipients)}\n{b''.join(lines).decode('utf-8', 'replace')}")
+            elif command == "RSET":
+                sender, recipients = None, []
+                self.reply("250 OK")
+            elif command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class DebugSMTPServer:
+    """Threaded SMTP stand-in; ``messages`` holds ``(sender, recipients, EmailMessage)``."""
+
+    def __init__(self, host="127.0.0.1", port=0, echo=False):
+        self.lock = threading.Lock()
+        self.messages = []
+        self.connections = 0
+        self.refuse = set()
+        self.fail_next = 0
+        self.echo = echo
+        self._server = _ThreadingServer((host, port), _SMTPHandler)
+        self._server.debug_server = self
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = None
+
+    def mail_config(self):
+        """Flask-Mail settings pointing at this server."""
+        return {
+            "MAIL_SERVER": self.host,
+            "MAIL_PORT": self.port,
+            "MAIL_USE_SSL": False,
+            "MAIL_USE_TLS": False,
+            "MAIL_USERNAME": "debug",
+            "MAIL_PASSWORD": "debug",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="debug-smtp", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 1025
+    server = DebugSMTPServer("127.0.0.1", port, echo=True)
+    print(f"📬 Debug SMTP server listening on {server.host}:{server.port} (Ctrl+C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server._server.server_close()
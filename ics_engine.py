@@ -0,0 +1,211 @@
+"""
+Lightweight iCalendar (RFC 5545) serializer for the calendar feeds.
+
+Each event is rendered once to a pre-folded VEVENT byte fragment and kept in a
+small in-process LRU, so building a feed is mostly joining cached bytes instead
+of constructing icalendar.Event objects and calling to_ical() on every poll.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+import threading
+
+CRLF = b"\r\n"
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value) -> str:
+    """Escape a TEXT property value (backslash, semicolon, comma, newline)."""
+    text = "" if value is None else str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def _param_value(value) -> str:
+    value = str(value).replace('"', "'")
+    if any(ch in value for ch in ':;,'):
+        return f'"{value}"'
+    return value
+
+
+def fold(line: str) -> bytes:
+    """Encode one content line and fold it at 75 octets without splitting UTF-8 sequences."""
+    raw = line.encode("utf-8")
+    if len(raw) <= MAX_LINE_OCTETS:
+        return raw + CRLF
+
+    chunks = []
+    start = 0
+    limit = MAX_LINE_OCTETS
+    while start < len(raw):
+        end = min(start + limit, len(raw))
+        # Back off so we never cut inside a multi-byte character
+        while end < len(raw) and (raw[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(raw[start:end])
+        start = end
+        limit = MAX_LINE_OCTETS - 1  # continuation lines carry a leading space
+    return b"\r\n ".join(chunks) + CRLF
+
+
+def format_datetime(value) -> str:
+    """Format a DATE-TIME value. Naive datetimes stay floating; aware ones become UTC."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return value.strftime("%Y%m%dT%H%M%S")
+    if isinstance(value, date):
+        return value.strftime("%Y%m%d")
+    raise TypeError(f"Unsupported date value: {value!r}")
+
+
+def format_duration(value: timedelta) -> str:
+    """Format a DURATION value the way icalendar does (e.g. -P1D, -PT1H)."""
+    sign = "-" if value < timedelta(0) else ""
+    value = abs(value)
+    days = value.days
+    hours, remainder = divmod(value.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    out = f"{sign}P"
+    if days:
+        out += f"{days}D"
+    if hours or minutes or seconds or not days:
+        out += "T"
+        if hours:
+            out += f"{hours}H"
+        if minutes:
+            out += f"{minutes}M"
+        if seconds or not (hours or minutes):
+            out += f"{seconds}S"
+    return out
+
+
+def content_line(name: str, value: str, params: dict | None = None) -> bytes:
+    """Render a single folded content line; value must already be escaped/formatted."""
+    if params:
+        name = name + "".join(f";{k}={_param_value(v)}" for k, v in params.items())
+    return fold(f"{name}:{value}")
+
+
+def render_event(
+    uid: str,
+    summary: str,
+    dtstart,
+    dtend=None,
+    dtstamp=None,
+    location=None,
+    description=None,
+    url=None,
+    organizer=None,
+    alarms=(),
+) -> bytes:
+    """Render one VEVENT block as folded bytes.
+
+    ``organizer`` is a (common_name, mailto_address) tuple. ``alarms`` is an
+    iterable of (trigger_timedelta, description) pairs rendered as DISPLAY
+    alarms.
+    """
+    dtstamp = dtstamp or datetime.now(timezone.utc)
+
+    parts = [
+        b"BEGIN:VEVENT\r\n",
+        content_line("UID", uid),
+        content_line("DTSTAMP", format_datetime(dtstamp)),
+        content_line("DTSTART", format_datetime(dtstart)),
+    ]
+    if dtend is not None:
+        parts.append(content_line("DTEND", format_datetime(dtend)))
+    parts.append(content_line("SUMMARY", escape_text(summary)))
+    if location is not None:
+        parts.append(content_line("LOCATION", escape_text(location)))
+    if description is not None:
+        parts.append(content_line("DESCRIPTION", escape_text(description)))
+    if url:
+        parts.append(content_line("URL", url))
+    if organizer:
+        common_name, address = organizer
+        parts.append(content_line("ORGANIZER", f"mailto:{address}", {"CN": common_name}))
+    for trigger, alarm_description in alarms:
+        parts.append(b"BEGIN:VALARM\r\n")
+        parts.append(content_line("ACTION", "DISPLAY"))
+        parts.append(content_line("DESCRIPTION", escape_text(alarm_description)))
+        parts.append(content_line("TRIGGER", format_duration(trigger)))
+        parts.append(b"END:VALARM\r\n")
+    parts.append(b"END:VEVENT\r\n")
+    return b"".join(parts)
+
+
+def calendar_header(prodid: str, calname: str | None = None, method: str | None = None) -> bytes:
+    """Render the VCALENDAR preamble up to (not including) the first component."""
+    parts = [
+        b"BEGIN:VCALENDAR\r\n",
+        content_line("VERSION", "2.0"),
+        content_line("PRODID", prodid),
+    ]
+    if method:
+        parts.append(content_line("METHOD", method))
+    if calname:
+        parts.append(content_line("X-WR-CALNAME", escape_text(calname)))
+    return b"".join(parts)
+
+
+CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+
+def iter_calendar(header: bytes, fragments):
+    """Yield a complete VCALENDAR as byte chunks (header, each fragment, footer)."""
+    yield header
+    for fragment in fragments:
+        yield fragment
+    yield CALENDAR_FOOTER
+
+
+def render_calendar(header: bytes, fragments) -> bytes:
+    """Join a header, VEVENT fragments and the footer into one VCALENDAR."""
+    return b"".join(iter_calendar(header, fragments))
+
+
+class FragmentCache:
+    """Thread-safe bounded LRU of rendered VEVENT fragments.
+
+    Keys identify what a fragment was rendered from (e.g. meeting id, row
+    revision, variant); once a meeting changes its older fragments become
+    unreachable and fall off the end of the LRU.
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key, render):
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fragment
+        fragment = render()
+        with self._lock:
+            self.misses += 1
+            if self.max_entries > 0:
+                self._entries[key] = fragment
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,132 @@
+"""
+Resize uploaded profile/sponsor photos into small, metadata-free variants.
+
+Each upload is decoded once, rotated according to its EXIF orientation and
+re-encoded at a few fixed sizes in WebP and JPEG. Re-encoding drops EXIF/GPS
+and other metadata. Avatars on the calendar then download a few KB instead of
+the multi-megabyte original.
+
+Pillow is optional: without it (or for files it can't decode) no variants are
+produced and callers keep serving the original upload.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except Exception:
+    Image = None
+    ImageOps = None
+    PIL_AVAILABLE = False
+
+DEFAULT_SIZES = (48, 128, 512)
+FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+# Refuse absurd pixel counts before decoding (decompression bombs)
+MAX_PIXELS = 40_000_000
+
+
+def _flatten(img):
+    """RGB copy for JPEG output; transparent areas become white."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def render_variants(image_data, sizes=DEFAULT_SIZES, quality=82):
+    """Return {(size, fmt): bytes} for every size/format, or {} if the image can't be processed.
+
+    ``size`` is the longest edge in pixels; aspect ratio is kept and images are
+    never scaled up.
+    """
+    if not PIL_AVAILABLE or not image_data:
+        return {}
+    try:
+        with Image.open(BytesIO(image_data)) as src:
+            if src.width * src.height > MAX_PIXELS:
+                return {}
+            src.seek(0)  # first frame of animated GIF/WebP
+            img = ImageOps.exif_transpose(src)
+            img.load()
+    except Exception:
+        return {}
+
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    base_webp = img.convert("RGBA" if has_alpha else "RGB")
+    base_jpeg = _flatten(img)
+
+    variants = {}
+    for size in sorted(set(sizes)):
+        for fmt, (pil_format, _) in FORMATS.items():
+            frame = (base_webp if fmt == "webp" else base_jpeg).copy()
+            frame.thumbnail((size, size), Image.LANCZOS)
+            out = BytesIO()
+            options = {"quality": quality}
+            if fmt == "jpeg":
+                options.update(optimize=True, progressive=True)
+            else:
+                options["method"] = 4
+            frame.save(out, pil_format, **options)
+            variants[(size, fmt)] = out.getvalue()
+    return variants
+
+
+def pick_variant_size(requested, sizes=DEFAULT_SIZES):
+    """Smallest configured size that covers ``requested`` pixels (largest if none does)."""
+    sizes = sorted(sizes)
+    for size in sizes:
+        if size >= requested:
+            return size
+    return sizes[-1]
+
+
+def preferred_format(accept_header):
+    """WebP when the client advertises it, JPEG otherwise."""
+    return "webp" if "image/webp" in (accept_header or "") else "jpeg"
+
+
+class ImagePipeline:
+    """Runs render_variants on a small thread pool and hands results to ``on_done``.
+
+    Pillow releases the GIL while decoding, resizing and encoding, so threads
+    keep the work off request threads without the cost of a process pool.
+    """
+
+    def __init__(self, on_done, sizes=DEFAULT_SIZES, workers=2):
+        self.on_done = on_done
+        self.sizes = tuple(sizes)
+        self.workers = max(1, workers)
+        self._executor = None
+
+    def process(self, key, image_data):
+        """Render variants on the calling thread; ``on_done(key, variants)`` runs if any were produced."""
+        variants = render_variants(image_data, self.sizes)
+        if variants:
+            self.on_done(key, variants)
+        return variants
+
+    def submit(self, key, image_data):
+        """Queue ``process`` on the worker pool and return its Future."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="image-pipeline")
+        future = self._executor.submit(self.process, key, image_data)
+        future.add_done_callback(_log_failure)
+        return future
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+def _log_failure(future):
+    exc = future.exception()
+    if exc is not None:
+        print(f"Image processing failed: {exc}")
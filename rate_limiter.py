@@ -0,0 +1,251 @@
+"""
+Rate limiting for logins, key checks and the public JSON APIs.
+
+Limits are written as "<count>/<period>" (e.g. "10/minute", "300/hour") and
+checked against a small backend instead of counting rows in audit_logs:
+
+* MemoryBackend keeps per-key state in the worker process.
+* RedisBackend shares state across workers via REDIS_URL using Lua scripts so
+  each check is one atomic round trip.
+
+Two algorithms are available on both backends. "sliding_window" is a sliding
+window counter (current fixed window plus the weighted tail of the previous
+one) and "token_bucket" refills ``count`` tokens evenly over ``period``, which
+allows short bursts up to ``count`` while holding the long-run rate.
+"""
+
+from collections import OrderedDict
+import math
+import re
+import threading
+import time
+
+SLIDING_WINDOW = "sliding_window"
+TOKEN_BUCKET = "token_bucket"
+ALGORITHMS = frozenset({SLIDING_WINDOW, TOKEN_BUCKET})
+
+_PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+class Limit:
+    """``count`` hits per ``period`` seconds."""
+
+    __slots__ = ("count", "period")
+
+    def __init__(self, count, period):
+        self.count = count
+        self.period = period
+
+    def __repr__(self):
+        return f"Limit({self.count}/{self.period}s)"
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.period
+
+
+def parse_limit(spec):
+    """Parse "10/minute", "5 per hour", "10/15 minutes" or "100/300" (seconds).
+
+    Returns None when the limit is disabled ("", "0", "off").
+    """
+    if spec is None or isinstance(spec, Limit):
+        return spec
+    text = str(spec).strip().lower().replace(" per ", "/")
+    if not text or text in ("0", "none", "off"):
+        return None
+    count, _, period = text.partition("/")
+    match = re.fullmatch(r"(\d*)\s*([a-z]*)", period.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        raise ValueError(f"Invalid rate limit: {spec!r}")
+    multiplier = int(match.group(1) or 1)
+    unit = match.group(2)
+    if unit:
+        seconds = _PERIODS.get(unit.rstrip("s"))
+        if seconds is None:
+            raise ValueError(f"Unknown rate limit period: {spec!r}")
+        seconds *= multiplier
+    else:
+        seconds = multiplier
+    count = int(count.strip())
+    if count <= 0 or seconds <= 0:
+        return None
+    return Limit(count, seconds)
+
+
+class MemoryBackend:
+    """Per-process limiter state, bounded to ``max_keys`` entries (least recently used evicted)."""
+
+    def __init__(self, max_keys=100_000, clock=time.time):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._state = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _touch(self, key, default):
+        state = self._state.get(key)
+        if state is None:
+            state = default
+            self._state[key] = state
+            if len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+        else:
+            self._state.move_to_end(key)
+        return state
+
+    def sliding_window(self, key, limit):
+        now = self.clock()
+        window = int(now // limit.period)
+        with self._lock:
+            state = self._touch(key, [window, 0, 0])
+            if state[0] != window:
+                # Roll forward; anything older than one window no longer counts.
+                state[2] = state[1] if state[0] == window - 1 else 0
+                state[0], state[1] = window, 0
+            elapsed = now - window * limit.period
+            weight = 1 - elapsed / limit.period
+            if state[1] + state[2] * weight + 1 > limit.count:
+                return False, _window_retry_after(state[1], state[2], limit, elapsed)
+            state[1] += 1
+            return True, 0
+
+    def token_bucket(self, key, limit):
+        now = self.clock()
+        with self._lock:
+            state = self._touch(key, [float(limit.count), now])
+            tokens = min(limit.count, state[0] + (now - state[1]) * limit.rate)
+            state[1] = now
+            if tokens < 1:
+                state[0] = tokens
+                return False, max(1, math.ceil((1 - tokens) / limit.rate))
+            state[0] = tokens - 1
+            return True, 0
+
+    def reset(self):
+        with self._lock:
+            self._state.clear()
+
+
+def _window_retry_after(current, previous, limit, elapsed):
+    """Seconds until the weighted previous window has decayed enough for one more hit."""
+    if current + 1 > limit.count or previous <= 0:
+        return max(1, math.ceil(limit.period - elapsed))
+    # previous * (1 - (elapsed + t) / period) <= count - current - 1
+    needed = limit.period * (1 - (limit.count - current - 1) / previous) - elapsed
+    return max(1, math.ceil(needed))
+
+
+_SLIDING_WINDOW_LUA = """
+local count = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local window = math.floor(now / period)
+local elapsed = now - window * period
+local current = tonumber(redis.call('GET', KEYS[1] .. ':' .. window) or '0')
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (window - 1)) or '0')
+if current + previous * (1 - elapsed / period) + 1 > count then
+  return {0, current, previous, tostring(elapsed)}
+end
+redis.call('INCR', KEYS[1] .. ':' .. window)
+redis.call('EXPIRE', KEYS[1] .. ':' .. window, period * 2)
+return {1, current + 1, previous, tostring(elapsed)}
+"""
+
+_TOKEN_BUCKET_LUA = """
+local count = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or count
+local ts = tonumber(state[2]) or now
+tokens = math.min(count, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(count / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBackend:
+    """Limiter state in Redis, shared by every worker."""
+
+    def __init__(self, client, prefix="ratelimit:", clock=time.time):
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+        self._sliding_window = client.register_script(_SLIDING_WINDOW_LUA)
+        self._token_bucket = client.register_script(_TOKEN_BUCKET_LUA)
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5), **kwargs)
+
+    def sliding_window(self, key, limit):
+        allowed, current, previous, elapsed = self._sliding_window(
+            keys=[self.prefix + key], args=[limit.count, limit.period, self.clock()]
+        )
+        if int(allowed):
+            return True, 0
+        return False, _window_retry_after(int(current), int(previous), limit, float(elapsed))
+
+    def token_bucket(self, key, limit):
+        allowed, tokens = self._token_bucket(keys=[self.prefix + key], args=[limit.count, limit.rate, self.clock()])
+        if int(allowed):
+            return True, 0
+        return False, max(1, math.ceil((1 - float(tokens)) / limit.rate))
+
+    def reset(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+class RateLimiter:
+    """Checks named limits against a backend.
+
+    If the primary backend errors (e.g. Redis is unreachable) the check falls
+    back to a per-process MemoryBackend rather than failing the request.
+    """
+
+    def __init__(self, backend=None, algorithm=SLIDING_WINDOW):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm!r} (expected one of {sorted(ALGORITHMS)})")
+        self.fallback = MemoryBackend()
+        self.backend = backend or self.fallback
+        self.algorithm = algorithm
+        self.enabled = True
+        self.backend_errors = 0
+
+    def hit(self, name, key, limit, algorithm=None):
+        """Record one hit for ``key`` under ``name``.
+
+        Returns ``(allowed, retry_after_seconds)``; ``retry_after`` is 0 when allowed.
+        """
+        limit = parse_limit(limit)
+        if not self.enabled or limit is None or key is None:
+            return True, 0
+        algorithm = algorithm or self.algorithm
+        full_key = f"{name}:{algorithm}:{limit.count}/{limit.period}:{key}"
+        try:
+            return getattr(self.backend, algorithm)(full_key, limit)
+        except Exception as e:
+            if self.backend is self.fallback:
+                raise
+            self.backend_errors += 1
+            print(f"Rate limiter backend error, using in-process fallback: {e}")
+            return getattr(self.fallback, algorithm)(full_key, limit)
+
+    def reset(self):
+        self.fallback.reset()
+        if self.backend is not self.fallback:
+            self.backend.reset()
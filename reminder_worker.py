@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
 Enhanced background worker for chairperson reminder emails and other scheduled tasks.
-This script should be run periodically (every hour) via cron or similar scheduler.
+This script should be run periodically via cron or similar scheduler. Sent
+reminders and confirmations are recorded in notification_ledger, so it is safe
+to run as often as every 5 minutes.
 """
 import os
 import sys
@@ -12,7 +14,7 @@ import time
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from app import app, db, check_and_send_reminders, send_meeting_confirmations
+    from app import app, db, check_and_send_reminders, send_meeting_confirmations, drain_email_outbox
 except ImportError as e:
     print(f"❌ Failed to import app components: {e}")
     sys.exit(1)
@@ -37,6 +39,10 @@ def run_scheduled_tasks():
                 print(f"✅ Completed: {total_emails} total emails sent")
             else:
                 print("ℹ️  No emails needed at this time")
+
+            # Deliver whatever is queued in the email outbox
+            outbox = drain_email_outbox()
+            print(f"📬 Outbox: {outbox['sent']} sent, {outbox['failed']} to retry, {outbox['dead']} dead-lettered")
                 
         except Exception as e:
             print(f"❌ Error in scheduled tasks: {e}")
@@ -0,0 +1,169 @@
+"""
+Portable SQL expressions for date/time bucketing and date arithmetic.
+
+SQLite, MySQL and PostgreSQL disagree on how to pull an hour out of a TIME,
+which weekday number Sunday gets, and how to subtract dates. The constructs
+below render the right SQL for whichever dialect the query is compiled for,
+so analytics can GROUP BY them instead of loading rows into Python:
+
+    hour_of(col)                 0-23
+    weekday_of(col)              0 = Sunday .. 6 = Saturday
+    days_between(start, end)     whole days from one DATE to another
+    at_time(date_col, time_col)  DATE + TIME as a timestamp
+    whole_days_between(a, b)     whole days between two timestamps (truncated)
+
+Any other dialect gets the ANSI spelling (EXTRACT / date subtraction).
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Integer, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+def _coerce(value, type_):
+    """Wrap Python date/datetime values so they bind with a proper type."""
+    if isinstance(value, (date, datetime)):
+        return literal(value, type_)
+    return value
+
+
+class hour_of(FunctionElement):
+    """Hour (0-23) of a TIME or TIMESTAMP expression."""
+    type = Integer()
+    name = "hour_of"
+    inherit_cache = True
+
+
+class weekday_of(FunctionElement):
+    """Day of week of a DATE expression, 0 = Sunday .. 6 = Saturday."""
+    type = Integer()
+    name = "weekday_of"
+    inherit_cache = True
+
+
+class days_between(FunctionElement):
+    """Whole days from the first DATE to the second (end - start)."""
+    type = Integer()
+    name = "days_between"
+    inherit_cache = True
+
+    def __init__(self, start, end, **kw):
+        super().__init__(_coerce(start, Date()), _coerce(end, Date()), **kw)
+
+
+class at_time(FunctionElement):
+    """Combine a DATE and a TIME expression into a timestamp."""
+    type = DateTime()
+    name = "at_time"
+    inherit_cache = True
+
+
+class whole_days_between(FunctionElement):
+    """Whole days from the first timestamp to the second, truncated toward zero."""
+    type = Integer()
+    name = "whole_days_between"
+    inherit_cache = True
+
+    def __init__(self, start, end, **kw):
+        super().__init__(_coerce(start, DateTime()), _coerce(end, DateTime()), **kw)
+
+
+def _args(compiler, element, **kw):
+    return [compiler.process(arg, **kw) for arg in element.clauses]
+
+
+# --- hour_of ---
+
+@compiles(hour_of)
+def _hour_of_default(element, compiler, **kw):
+    return "CAST(EXTRACT(HOUR FROM %s) AS INTEGER)" % tuple(_args(compiler, element, **kw))
+
+
+@compiles(hour_of, "sqlite")
+def _hour_of_sqlite(element, compiler, **kw):
+    return "CAST(strftime('%%H', %s) AS INTEGER)" % tuple(_args(compiler, element, **kw))
+
+
+@compiles(hour_of, "mysql")
+def _hour_of_mysql(element, compiler, **kw):
+    return "HOUR(%s)" % tuple(_args(compiler, element, **kw))
+
+
+# --- weekday_of ---
+
+@compiles(weekday_of)
+def _weekday_of_default(element, compiler, **kw):
+    return "CAST(EXTRACT(DOW FROM %s) AS INTEGER)" % tuple(_args(compiler, element, **kw))
+
+
+@compiles(weekday_of, "sqlite")
+def _weekday_of_sqlite(element, compiler, **kw):
+    return "CAST(strftime('%%w', %s) AS INTEGER)" % tuple(_args(compiler, element, **kw))
+
+
+@compiles(weekday_of, "mysql")
+def _weekday_of_mysql(element, compiler, **kw):
+    # DAYOFWEEK() is 1 = Sunday .. 7 = Saturday
+    return "(DAYOFWEEK(%s) - 1)" % tuple(_args(compiler, element, **kw))
+
+
+# --- days_between ---
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    start, end = _args(compiler, element, **kw)
+    return f"(CAST({end} AS DATE) - CAST({start} AS DATE))"
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):
+    start, end = _args(compiler, element, **kw)
+    return f"CAST(julianday({end}) - julianday({start}) AS INTEGER)"
+
+
+@compiles(days_between, "mysql")
+def _days_between_mysql(element, compiler, **kw):
+    start, end = _args(compiler, element, **kw)
+    return f"DATEDIFF({end}, {start})"
+
+
+# --- at_time ---
+
+@compiles(at_time)
+def _at_time_default(element, compiler, **kw):
+    day, clock = _args(compiler, element, **kw)
+    return f"(CAST({day} AS DATE) + CAST({clock} AS TIME))"
+
+
+@compiles(at_time, "sqlite")
+def _at_time_sqlite(element, compiler, **kw):
+    day, clock = _args(compiler, element, **kw)
+    return f"({day} || ' ' || {clock})"
+
+
+@compiles(at_time, "mysql")
+def _at_time_mysql(element, compiler, **kw):
+    day, clock = _args(compiler, element, **kw)
+    return f"TIMESTAMP({day}, {clock})"
+
+
+# --- whole_days_between ---
+
+@compiles(whole_days_between)
+def _whole_days_between_default(element, compiler, **kw):
+    start, end = _args(compiler, element, **kw)
+    return f"CAST(TRUNC(EXTRACT(EPOCH FROM ({end} - {start})) / 86400) AS INTEGER)"
+
+
+@compiles(whole_days_between, "sqlite")
+def _whole_days_between_sqlite(element, compiler, **kw):
+    start, end = _args(compiler, element, **kw)
+    return f"CAST(julianday({end}) - julianday({start}) AS INTEGER)"
+
+
+@compiles(whole_days_between, "mysql")
+def _whole_days_between_mysql(element, compiler, **kw):
+    start, end = _args(compiler, element, **kw)
+    return f"TIMESTAMPDIFF(DAY, {start}, {end})"
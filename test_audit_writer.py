@@ -0,0 +1,155 @@
+"""
+Test the write-behind audit log pipeline
+"""
+
+import os
+import sys
+import threading
+from datetime import date, time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from audit_writer import AuditWriter
+from app import app, db, User, Meeting, ChairSignup, AuditLog, audit_writer, log_audit_event
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        AuditLog.query.delete()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter_by(email="audit.admin@example.com").delete()
+        admin = User(display_name="Audit Admin", email="audit.admin@example.com", is_admin=True)
+        admin.set_password("correct-horse-battery")
+        db.session.add(admin)
+        meetings = [Meeting(title=f"Audit Meeting {i}", event_date=date(2030, 5, 1 + i), start_time=time(12, 0)) for i in range(5)]
+        db.session.add_all(meetings)
+        db.session.commit()
+        return admin.id, [m.id for m in meetings]
+
+
+def test_writer_batches_and_backpressure():
+    """Rows are written in batches and a full queue never drops events."""
+    print("\n🧪 Testing audit writer batching...")
+    batches = []
+    gate = threading.Event()
+
+    def slow_flush(rows):
+        gate.wait(timeout=2)
+        batches.append(list(rows))
+
+    writer = AuditWriter(slow_flush, max_queue=5, batch_size=4, flush_interval=0.05, block_timeout=0.01)
+    # Hold the first batch long enough for the bounded queue to fill up.
+    threading.Timer(0.2, gate.set).start()
+    for i in range(40):
+        writer.enqueue({"action": f"event-{i}"})
+    writer.flush()
+    written = [row["action"] for batch in batches for row in batch]
+    assert sorted(written) == sorted(f"event-{i}" for i in range(40))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert writer.backpressure_flushes > 0
+    print(f"✅ {len(written)} rows in {len(batches)} batches, {writer.backpressure_flushes} backpressure flushes")
+
+
+def test_async_login_and_bulk_delete():
+    """Async mode queues events; admin_security still shows them."""
+    print("\n🧪 Testing async audit events...")
+    admin_id, meeting_ids = _setup()
+    client = app.test_client()
+    # The in-memory SQLite test database is one shared connection, so keep the
+    # writer thread off it: collect batches and insert them from this thread.
+    queued = []
+    flush_batch = audit_writer.flush_batch
+    audit_writer.flush_batch = queued.extend
+    app.config['TESTING'] = False
+    try:
+        resp = client.post('/login', data={'email': 'audit.admin@example.com', 'password': 'wrong'})
+        assert resp.status_code == 200
+        resp = client.post('/login', data={'email': 'audit.admin@example.com', 'password': 'correct-horse-battery'})
+        assert resp.status_code == 302
+        resp = client.post('/admin/meetings/bulk-delete', json={'meeting_ids': meeting_ids})
+        assert resp.get_json()['deleted_count'] == len(meeting_ids)
+        resp = client.get('/admin/security')
+        assert resp.status_code == 200
+    finally:
+        app.config['TESTING'] = True
+        audit_writer.flush()
+        audit_writer.flush_batch = flush_batch
+    assert queued
+    flush_batch(queued)
+    with app.app_context():
+        actions = [a for (a,) in db.session.query(AuditLog.action).all()]
+    assert actions.count('login_failure') == 1
+    assert actions.count('login_success') == 1
+    assert actions.count('meeting_delete') == len(meeting_ids)
+    assert actions.count('bulk_delete_meetings') == 1
+    print("✅ Queued audit events written")
+
+
+def test_async_rows_wait_for_commit():
+    """Async rows logged inside a transaction are queued on commit and dropped on rollback."""
+    _setup()
+    queued = []
+    flush_batch = audit_writer.flush_batch
+    audit_writer.flush_batch = queued.extend
+    app.config['TESTING'] = False
+    try:
+        with app.test_request_context():
+            log_audit_event('rolled_back_action', commit=False)
+            audit_writer.flush()
+            assert queued == []
+            db.session.rollback()
+
+            log_audit_event('committed_action', commit=False)
+            db.session.commit()
+            log_audit_event('standalone_action')
+    finally:
+        app.config['TESTING'] = True
+        audit_writer.flush()
+        audit_writer.flush_batch = flush_batch
+    assert [row['action'] for row in queued] == ['committed_action', 'standalone_action']
+    flush_batch(queued)
+    with app.app_context():
+        assert AuditLog.query.filter_by(action='rolled_back_action').count() == 0
+    print("✅ Rolled-back actions leave no audit row")
+
+
+def test_sync_bulk_delete_commits_once():
+    """Synchronous fallback: bulk delete and its audit rows share one commit."""
+    print("\n🧪 Testing synchronous audit fallback...")
+    admin_id, meeting_ids = _setup()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    commits = []
+
+    def count_commit(session):
+        commits.append(session)
+
+    with app.app_context():
+        event.listen(db.session, "after_commit", count_commit)
+        try:
+            resp = client.post('/admin/meetings/bulk-delete', json={'meeting_ids': meeting_ids})
+        finally:
+            event.remove(db.session, "after_commit", count_commit)
+        assert resp.get_json()['deleted_count'] == len(meeting_ids)
+        assert AuditLog.query.filter_by(action='meeting_delete').count() == len(meeting_ids)
+    assert len(commits) == 1, len(commits)
+    print("✅ One commit for the whole bulk delete")
+
+
+if __name__ == "__main__":
+    test_writer_batches_and_backpressure()
+    test_async_login_and_bulk_delete()
+    test_async_rows_wait_for_commit()
+    test_sync_bulk_delete_commits_once()
+    print("\n🎉 All audit writer tests passed!")
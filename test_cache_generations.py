@@ -0,0 +1,186 @@
+"""
+Test namespaced cache generations: writes invalidate only what they touch
+"""
+
+import os
+import sys
+from datetime import date, time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import (
+    app, db, cache, CacheGeneration, User, Meeting, ChairSignup, Sponsor,
+    cache_generation, cached_value, clear_dashboard_cache, user_cache_namespace,
+)
+
+NAMESPACES = ("meetings", "users", "sponsors", "analytics")
+
+
+def _generations(*extra):
+    return {ns: cache_generation(ns) for ns in NAMESPACES + extra}
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        Sponsor.query.delete()
+        User.query.filter(User.email.like('%@gen.test')).delete(synchronize_session=False)
+        chair = User(display_name="Gen Chair", email="chair@gen.test", password_hash="x")
+        other = User(display_name="Gen Other", email="other@gen.test", password_hash="x")
+        db.session.add_all([chair, other])
+        db.session.commit()
+        return chair.id, other.id
+
+
+def test_writes_bump_their_namespaces():
+    """Committed writes bump only the namespaces they touch; rollbacks bump nothing."""
+    print("\n🧪 Testing cache generation hooks...")
+    chair_id, other_id = _setup()
+    chair_ns, other_ns = user_cache_namespace(chair_id), user_cache_namespace(other_id)
+    with app.app_context():
+        before = _generations(chair_ns, other_ns)
+        meeting = Meeting(title="Gen", event_date=date(2030, 6, 1), start_time=time(19, 0))
+        db.session.add(meeting)
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=meeting.id, user_id=chair_id, display_name_snapshot="Gen Chair"))
+        db.session.commit()
+        after = _generations(chair_ns, other_ns)
+        changed = {ns for ns in after if after[ns] != before[ns]}
+        assert changed == {"meetings", chair_ns}, changed
+
+        before = after
+        db.session.get(User, other_id).display_name = "Renamed"
+        db.session.commit()
+        after = _generations(chair_ns, other_ns)
+        assert {ns for ns in after if after[ns] != before[ns]} == {other_ns}
+
+        before = after
+        db.session.add(Sponsor(display_name="Gen Sponsor"))
+        db.session.rollback()
+        assert _generations(chair_ns, other_ns) == before
+        db.session.add(Sponsor(display_name="Gen Sponsor"))
+        db.session.commit()
+        after = _generations(chair_ns, other_ns)
+        assert {ns for ns in after if after[ns] != before[ns]} == {"sponsors"}
+    print("✅ Writes bump only their namespaces")
+
+
+def test_cached_value_follows_generations():
+    """Entries are rebuilt after a bump of any namespace they depend on."""
+    chair_id, _ = _setup()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    with app.app_context():
+        namespaces = ("meetings", user_cache_namespace(chair_id))
+        assert cached_value(namespaces, "gen_test", build, timeout=60) == 1
+        assert cached_value(namespaces, "gen_test", build, timeout=60) == 1
+        Sponsor.query.delete()
+        db.session.commit()
+        assert cached_value(namespaces, "gen_test", build, timeout=60) == 1
+        db.session.get(User, chair_id).display_name = "Renamed Again"
+        db.session.commit()
+        assert cached_value(namespaces, "gen_test", build, timeout=60) == 2
+
+
+def test_bulk_writes_reach_user_scoped_entries():
+    """Bulk signup deletes and clear_dashboard_cache() invalidate every user's entries."""
+    chair_id, _ = _setup()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    with app.app_context():
+        meeting = Meeting(title="Bulk", event_date=date(2030, 6, 2), start_time=time(19, 0))
+        db.session.add(meeting)
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=meeting.id, user_id=chair_id, display_name_snapshot="Gen Chair"))
+        db.session.commit()
+
+        namespaces = (user_cache_namespace(chair_id),)
+        assert cached_value(namespaces, "bulk_test", build, timeout=60) == 1
+        ChairSignup.query.filter(ChairSignup.user_id == chair_id).delete(synchronize_session=False)
+        db.session.commit()
+        assert cached_value(namespaces, "bulk_test", build, timeout=60) == 2
+        assert cached_value(namespaces, "bulk_test", build, timeout=60) == 2
+
+        clear_dashboard_cache()
+        assert cached_value(namespaces, "bulk_test", build, timeout=60) == 3
+
+
+def test_generations_are_shared_through_the_database():
+    """A bump made by another process (its own local cache) still reaches this one."""
+    _setup()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    with app.app_context():
+        assert cached_value(("meetings",), "shared_test", build, timeout=60) == 1
+        generation = cache_generation("meetings")
+        cache.clear()  # generations don't live in the cache
+        assert cache_generation("meetings") == generation
+
+        assert cached_value(("meetings",), "shared_test", build, timeout=60) == 2
+        # Another worker's commit: only the cache_generations row changes
+        with db.engine.begin() as conn:
+            conn.execute(CacheGeneration.__table__.update()
+                         .where(CacheGeneration.namespace == "meetings")
+                         .values(generation=generation + 5))
+        assert cache_generation("meetings") == generation + 5
+        assert cached_value(("meetings",), "shared_test", build, timeout=60) == 3
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        with app.test_request_context("/"):
+            event.listen(db.engine, "before_cursor_execute", listener)
+            try:
+                cached_value(("meetings", "users"), "shared_test_2", build, timeout=60)
+                cached_value(("meetings", "users"), "shared_test_2", build, timeout=60)
+            finally:
+                event.remove(db.engine, "before_cursor_execute", listener)
+        assert len(statements) == 1  # one batched read per request
+    print("✅ Generations are shared across processes")
+
+
+def test_refresh_routes_keep_other_entries():
+    """Dashboard and profile refreshes no longer wipe the whole cache."""
+    chair_id, other_id = _setup()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = chair_id
+    with app.app_context():
+        cache.set("unrelated_entry", "kept", timeout=60)
+        other_gen = cache_generation(user_cache_namespace(other_id))
+        chair_gen = cache_generation(user_cache_namespace(chair_id))
+        assert client.get('/dashboard/refresh').status_code == 302
+        assert client.get('/profile/refresh').status_code == 302
+        assert cache.get("unrelated_entry") == "kept"
+        assert cache_generation(user_cache_namespace(other_id)) == other_gen
+        assert cache_generation(user_cache_namespace(chair_id)) != chair_gen
+    print("✅ Refresh routes only invalidate the current user")
+
+
+if __name__ == "__main__":
+    test_writes_bump_their_namespaces()
+    test_cached_value_follows_generations()
+    test_bulk_writes_reach_user_scoped_entries()
+    test_generations_are_shared_through_the_database()
+    test_refresh_routes_keep_other_entries()
+    print("\n🎉 All cache generation tests passed!")
@@ -0,0 +1,104 @@
+"""
+Test the projection-only read path behind /api/day-meetings and /api/week-meetings
+"""
+
+import os
+import sys
+from datetime import date, time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import app, db, User, Meeting, ChairSignup, invalidate_meeting_caches
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter(User.email.like("%@projection.test")).delete(synchronize_session=False)
+        with_photo = User(display_name="Photo Chair", email="photo@projection.test", password_hash="x", profile_image="aGVsbG8=")
+        no_photo = User(display_name="Plain Chair", email="plain@projection.test", password_hash="x")
+        db.session.add_all([with_photo, no_photo])
+        m1 = Meeting(title="Morning", event_date=date(2030, 3, 12), start_time=time(8, 0), is_open=True)
+        m2 = Meeting(title="Noon", event_date=date(2030, 3, 12), start_time=time(12, 0), is_open=True)
+        m3 = Meeting(title="Evening", event_date=date(2030, 3, 12), start_time=time(19, 0), is_open=True)
+        db.session.add_all([m1, m2, m3])
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=m1.id, user_id=with_photo.id, display_name_snapshot="Photo Chair"))
+        db.session.add(ChairSignup(meeting_id=m2.id, user_id=no_photo.id, display_name_snapshot="Plain Chair"))
+        db.session.commit()
+        invalidate_meeting_caches()
+        return with_photo.id
+
+
+class StatementRecorder:
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+def test_day_meetings_payload_and_projection():
+    """Day API returns the same fields without selecting the image column."""
+    print("\n🧪 Testing /api/day-meetings projection...")
+    photo_user_id = _setup()
+    client = app.test_client()
+    recorder = StatementRecorder()
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", recorder)
+    try:
+        resp = client.get('/api/day-meetings?date=2030-03-12')
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder)
+
+    assert resp.status_code == 200
+    assert resp.headers['Cache-Control'].startswith('public, max-age=')
+    meetings = resp.get_json()["meetings"]
+    assert [m["title"] for m in meetings] == ["Morning", "Noon", "Evening"]
+    assert meetings[0]["chair_profile_url"] == f"/profile/image/{photo_user_id}?size=48"
+    assert meetings[1]["chair_name"] == "Plain Chair" and meetings[1]["chair_profile_url"] is None
+    assert meetings[2]["has_chair"] is False and meetings[2]["is_open"] is True
+
+    selects = [s for s in recorder.statements if s.lstrip().upper().startswith("SELECT") and "meetings" in s]
+    assert selects, "expected a meetings query"
+    for statement in selects:
+        select_list = statement.upper().split(" FROM ", 1)[0]
+        assert "USERS.PROFILE_IMAGE AS" not in select_list
+    print("✅ Image column reduced to a SQL-side flag")
+
+
+def test_week_meetings_served_from_row_cache():
+    """Repeated range requests are answered from the row cache."""
+    print("\n🧪 Testing /api/week-meetings row cache...")
+    _setup()
+    client = app.test_client()
+    first = client.get('/api/week-meetings?start=2030-03-10&end=2030-03-16')
+    assert first.status_code == 200
+    recorder = StatementRecorder()
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", recorder)
+    try:
+        second = client.get('/api/week-meetings?start=2030-03-10&end=2030-03-16')
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder)
+    assert second.get_json() == first.get_json()
+    assert not [s for s in recorder.statements if "meetings" in s]
+    print("✅ Second request issued no meeting queries")
+
+
+if __name__ == "__main__":
+    test_day_meetings_payload_and_projection()
+    test_week_meetings_served_from_row_cache()
+    print("\n🎉 All calendar API projection tests passed!")
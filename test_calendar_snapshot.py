@@ -0,0 +1,110 @@
+"""
+Test the month-snapshot cache behind /calendar and /calendar/display
+"""
+
+import os
+import sys
+from datetime import date, time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import (
+    app, db, User, Meeting, ChairSignup, CacheGeneration,
+    get_calendar_month_snapshot, get_meetings_data_version, invalidate_meeting_caches,
+)
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        db.session.commit()
+        m = Meeting(title="Snapshot Meeting", event_date=date(2030, 3, 12), start_time=time(19, 0), is_open=True)
+        db.session.add(m)
+        db.session.commit()
+        invalidate_meeting_caches()
+        return m.id
+
+
+def test_snapshot_served_from_cache():
+    """Second render of the same month must not re-query meetings."""
+    print("\n🧪 Testing calendar snapshot reuse...")
+    _setup()
+    with app.app_context():
+        weeks = get_calendar_month_snapshot(2030, 3)
+        titles = [m["title"] for w in weeks for c in w for m in c["meetings"]]
+        assert titles == ["Snapshot Meeting"]
+
+        # Change the row behind the cache's back (outside the session, so no
+        # generation bump): snapshot should still be served
+        db.session.rollback()
+        with db.engine.begin() as conn:
+            conn.execute(Meeting.__table__.update().values(title="Renamed"))
+        weeks = get_calendar_month_snapshot(2030, 3)
+        titles = [m["title"] for w in weeks for c in w for m in c["meetings"]]
+        assert titles == ["Snapshot Meeting"]
+    print("✅ Snapshot reused until the data version changes")
+
+
+def test_version_bump_invalidates_snapshot():
+    """Bumping the meetings data version makes the next render rebuild."""
+    print("\n🧪 Testing calendar snapshot invalidation...")
+    _setup()
+    with app.app_context():
+        get_calendar_month_snapshot(2030, 3)
+        before = get_meetings_data_version()
+        Meeting.query.update({Meeting.title: "Renamed"})
+        db.session.commit()
+        invalidate_meeting_caches()
+        assert get_meetings_data_version() != before
+        weeks = get_calendar_month_snapshot(2030, 3)
+        titles = [m["title"] for w in weeks for c in w for m in c["meetings"]]
+        assert titles == ["Renamed"]
+    print("✅ Snapshot rebuilt after version bump")
+
+
+def test_other_process_write_reaches_snapshot():
+    """A meeting edit committed by another worker (or worker.py) shows up on the next page view."""
+    _setup()
+    client = app.test_client()
+    assert b"Snapshot Meeting" in client.get('/calendar?year=2030&month=3').data
+    with app.app_context():
+        # What another process's commit leaves behind: the row and the shared generation
+        with db.engine.begin() as conn:
+            conn.execute(Meeting.__table__.update().values(title="Edited Elsewhere"))
+            conn.execute(CacheGeneration.__table__.update()
+                         .where(CacheGeneration.namespace == "meetings")
+                         .values(generation=CacheGeneration.generation + 1))
+    page = client.get('/calendar?year=2030&month=3').data
+    assert b"Edited Elsewhere" in page and b"Snapshot Meeting" not in page
+
+
+def test_calendar_pages_render_from_snapshot():
+    """Calendar and display pages render with snapshot data."""
+    print("\n🧪 Testing calendar pages...")
+    _setup()
+    client = app.test_client()
+    resp = client.get('/calendar?year=2030&month=3')
+    assert resp.status_code == 200
+    assert b"Snapshot Meeting" in resp.data
+    resp = client.get('/calendar?year=2030&month=3&q=nomatch')
+    assert resp.status_code == 200
+    assert b"Snapshot Meeting" not in resp.data
+    resp = client.get('/calendar/display')
+    assert resp.status_code == 200
+    print("✅ Calendar pages render")
+
+
+if __name__ == "__main__":
+    test_snapshot_served_from_cache()
+    test_version_bump_invalidates_snapshot()
+    test_other_process_write_reaches_snapshot()
+    test_calendar_pages_render_from_snapshot()
+    print("\n🎉 All calendar snapshot tests passed!")
@@ -0,0 +1,123 @@
+"""
+Test the bulk certificate export: process pool rendering, ZIP streaming and progress
+"""
+
+import os
+import sys
+import tempfile
+import zipfile
+from datetime import datetime
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from PIL import Image
+
+from app import (
+    app, db, cache, User, QuizAttempt, RenderedCertificate,
+    certificate_export_pool, certificate_renderer, iter_zip_chunks,
+)
+from certificate_renderer import CertificateExportPool, CertificateRenderer
+
+RECIPIENTS = 6
+
+
+def _template(path):
+    Image.new("RGB", (850, 1100), "white").save(path, "PNG")
+
+
+def test_pool_renders_in_parallel():
+    """Jobs fan out over worker processes and every key comes back once."""
+    print("\n🧪 Testing certificate export pool...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "template.png")
+        _template(path)
+        pool = CertificateExportPool(CertificateRenderer(path), workers=2)
+        try:
+            jobs = [(f"key{i}", f"Chair {i}", datetime(2030, 1, i + 1)) for i in range(7)]
+            results = dict(pool.render_many(jobs))
+        finally:
+            pool.shutdown()
+    assert sorted(results) == sorted(key for key, _, _ in jobs)
+    assert all(pdf.startswith(b"%PDF") for pdf in results.values())
+    print("✅ Pool rendered every job")
+
+
+def test_zip_chunks_stream_per_file():
+    """The archive is produced one entry at a time and is a valid ZIP."""
+    chunks = list(iter_zip_chunks((f"{i}.pdf", b"%PDF" + bytes([i]) * 1000) for i in range(3)))
+    assert len(chunks) == 4
+    with zipfile.ZipFile(BytesIO(b"".join(chunks))) as archive:
+        assert archive.namelist() == ["0.pdf", "1.pdf", "2.pdf"]
+        assert archive.read("2.pdf") == b"%PDF" + bytes([2]) * 1000
+
+
+def _setup(template_path):
+    app.config['TESTING'] = True
+    certificate_renderer.template_path = template_path
+    with app.app_context():
+        db.create_all()
+        RenderedCertificate.query.delete()
+        QuizAttempt.query.delete()
+        User.query.filter(User.email.like('%@export.test')).delete(synchronize_session=False)
+        admin = User(display_name="Exporter", email="admin@export.test", password_hash="x", is_admin=True)
+        chairs = [User(display_name=f"Chair {i}", email=f"chair{i}@export.test", password_hash="x")
+                  for i in range(RECIPIENTS)]
+        db.session.add_all([admin] + chairs)
+        db.session.flush()
+        for i, chair in enumerate(chairs):
+            for quiz_id in ("registration", "hosting"):
+                db.session.add(QuizAttempt(user_id=chair.id, quiz_id=quiz_id, score=90, total_questions=10,
+                                           correct_answers=9, passed=True, points_awarded=50,
+                                           completed_at=datetime(2030, 1, i + 1, 12, 0)))
+        db.session.commit()
+        return admin.id, [c.id for c in chairs]
+
+
+def test_export_all_and_selected():
+    """Admins download a ZIP of all or selected certificates; renders are stored for reuse."""
+    print("\n🧪 Testing /admin/certificates/export...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "template.png")
+        _template(path)
+        admin_id, chair_ids = _setup(path)
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = admin_id
+
+        resp = client.post('/admin/certificates/export', data={'scope': 'all', 'job_id': 'job-1'})
+        assert resp.status_code == 200 and resp.mimetype == 'application/zip'
+        with zipfile.ZipFile(BytesIO(resp.data)) as archive:
+            names = archive.namelist()
+            assert len(names) == RECIPIENTS
+            assert f"BP_Certificate_BP-{1000 + chair_ids[0]}_Chair_0.pdf" in names
+            assert all(archive.read(name).startswith(b"%PDF") for name in names)
+        progress = client.get('/admin/certificates/export/job-1').get_json()
+        assert progress == {"status": "done", "total": RECIPIENTS, "done": RECIPIENTS, "rendered": RECIPIENTS}
+        with app.app_context():
+            assert RenderedCertificate.query.count() == RECIPIENTS
+
+        # A second export reuses the stored PDFs
+        resp = client.post('/admin/certificates/export', data={
+            'scope': 'selected', 'user_ids': [str(chair_ids[1]), str(chair_ids[2]), str(admin_id)], 'job_id': 'job-2',
+        })
+        with zipfile.ZipFile(BytesIO(resp.data)) as archive:
+            assert len(archive.namelist()) == 2
+        assert client.get('/admin/certificates/export/job-2').get_json()["rendered"] == 0
+
+        assert client.post('/admin/certificates/export', data={'scope': 'selected'}).status_code == 302
+        assert client.get('/admin/certificates/export/bad$id').get_json() == {"status": "unknown"}
+    certificate_export_pool.shutdown()
+    cache.clear()
+    print("✅ Export streams a ZIP and records progress")
+
+
+if __name__ == "__main__":
+    test_pool_renders_in_parallel()
+    test_zip_chunks_stream_per_file()
+    test_export_all_and_selected()
+    print("\n🎉 All certificate export tests passed!")
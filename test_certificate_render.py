@@ -0,0 +1,117 @@
+"""
+Test the certificate renderer's template/font caching and the stored certificate PDFs
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from PIL import Image
+
+import app as app_module
+from app import app, db, User, QuizAttempt, RenderedCertificate, certificate_renderer
+from certificate_renderer import CertificateRenderer, load_font
+
+
+def _template(path, color="white"):
+    Image.new("RGB", (850, 1100), color).save(path, "PNG")
+
+
+def test_renderer_reuses_template_and_fonts():
+    """The template is decoded once per file version and fonts are loaded once."""
+    print("\n🧪 Testing certificate renderer...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "template.png")
+        renderer = CertificateRenderer(path)
+        assert renderer.render("Nobody", datetime(2030, 1, 1)) is None
+        assert renderer.template_hash is None
+
+        _template(path)
+        first = renderer.render("Pat Chair", datetime(2030, 1, 1))
+        decoded, digest = renderer._template, renderer.template_hash
+        hits = load_font.cache_info().hits
+        second = renderer.render("Sam Chair", datetime(2030, 1, 2))
+        assert first.startswith(b"%PDF") and second.startswith(b"%PDF")
+        assert renderer._template is decoded
+        assert load_font.cache_info().hits >= hits + 2
+
+        # A replaced template changes the hash, and with it every cache key
+        key = renderer.cache_key(1, 10, "Pat Chair")
+        os.utime(path, ns=(0, 0))
+        _template(path, "ivory")
+        assert renderer.template_hash != digest
+        assert renderer.cache_key(1, 10, "Pat Chair") != key
+    print("✅ Template and fonts cached")
+
+
+def _setup(template_path):
+    app.config['TESTING'] = True
+    certificate_renderer.template_path = template_path
+    with app.app_context():
+        db.create_all()
+        RenderedCertificate.query.delete()
+        QuizAttempt.query.delete()
+        User.query.filter(User.email.like('%@render.test')).delete(synchronize_session=False)
+        chair = User(display_name="Pat Chair", email="pat@render.test", password_hash="x")
+        db.session.add(chair)
+        db.session.flush()
+        for quiz_id, day in (("registration", 1), ("hosting", 2)):
+            db.session.add(QuizAttempt(user_id=chair.id, quiz_id=quiz_id, score=90, total_questions=10,
+                                       correct_answers=9, passed=True, points_awarded=50,
+                                       completed_at=datetime(2030, 1, day, 12, 0)))
+        db.session.commit()
+        return chair.id
+
+
+def test_certificate_rendered_once_and_stored():
+    """Later downloads are served from the stored PDF; renames render again."""
+    print("\n🧪 Testing /certificate storage...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "template.png")
+        _template(path)
+        chair_id = _setup(path)
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = chair_id
+
+        renders = []
+        original = app_module.render_certificate_pdf
+
+        def counting(user, attempt):
+            renders.append(user.display_name)
+            return original(user, attempt)
+
+        app_module.render_certificate_pdf = counting
+        try:
+            first = client.get('/certificate')
+            assert first.status_code == 200 and first.mimetype == 'application/pdf'
+            assert first.data.startswith(b"%PDF")
+            second = client.get('/certificate')
+            assert second.data == first.data and renders == ["Pat Chair"]
+
+            cached = client.get('/certificate', headers={'If-None-Match': first.headers['ETag']})
+            assert cached.status_code == 304
+
+            with app.app_context():
+                db.session.get(User, chair_id).display_name = "Pat Renamed"
+                db.session.commit()
+            assert client.get('/certificate').status_code == 200
+            assert renders == ["Pat Chair", "Pat Renamed"]
+            with app.app_context():
+                assert RenderedCertificate.query.filter_by(user_id=chair_id).count() == 1
+        finally:
+            app_module.render_certificate_pdf = original
+    print("✅ Certificates rendered once per user, attempt and template")
+
+
+if __name__ == "__main__":
+    test_renderer_reuses_template_and_fonts()
+    test_certificate_rendered_once_and_stored()
+    print("\n🎉 All certificate render tests passed!")
@@ -0,0 +1,132 @@
+"""
+Test the meeting_daily_stats rollup: kept current by ORM writes, rebuilt by the reconcile job
+"""
+
+import os
+import sys
+from datetime import date, time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import (
+    app, db, User, Meeting, ChairSignup, MeetingDailyStat,
+    rebuild_meeting_daily_stats, reconcile_meeting_daily_stats,
+)
+
+DAY1 = date(2031, 3, 3)
+DAY2 = date(2031, 3, 4)
+
+
+def _rollup():
+    return {
+        (r.stat_date, r.gender, r.meeting_type): (r.total_meetings, r.filled_meetings, r.open_meetings, r.signups)
+        for r in MeetingDailyStat.query.order_by(MeetingDailyStat.stat_date).all()
+    }
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter(User.email.like('%@rollup.test')).delete(synchronize_session=False)
+        db.session.commit()
+        chair = User(display_name="Rollup Chair", email="chair@rollup.test", password_hash="x")
+        db.session.add(chair)
+        db.session.add_all([
+            Meeting(title="A", event_date=DAY1, start_time=time(8, 0), gender_restriction='male'),
+            Meeting(title="B", event_date=DAY1, start_time=time(12, 0), gender_restriction='men'),
+            Meeting(title="C", event_date=DAY1, start_time=time(19, 0), meeting_type='Special', is_open=False),
+        ])
+        db.session.commit()
+        return chair.id
+
+
+def test_rollup_follows_writes():
+    """Inserts, signups, cancellations, edits and bulk deletes update the affected days."""
+    print("\n🧪 Testing meeting_daily_stats maintenance...")
+    chair_id = _setup()
+    with app.app_context():
+        assert _rollup() == {
+            (DAY1, 'male', 'Regular'): (2, 0, 2, 0),
+            (DAY1, '', 'Special'): (1, 0, 0, 0),
+        }
+
+        meeting = Meeting.query.filter_by(title="A").one()
+        db.session.add(ChairSignup(meeting_id=meeting.id, user_id=chair_id, display_name_snapshot="Rollup Chair"))
+        db.session.commit()
+        assert _rollup()[(DAY1, 'male', 'Regular')] == (2, 1, 1, 1)
+
+        # Move the chaired meeting to the next day: both days are recounted
+        meeting.event_date = DAY2
+        db.session.commit()
+        assert _rollup() == {
+            (DAY1, 'male', 'Regular'): (1, 0, 1, 0),
+            (DAY1, '', 'Special'): (1, 0, 0, 0),
+            (DAY2, 'male', 'Regular'): (1, 1, 0, 1),
+        }
+
+        # Cancel the signup
+        db.session.delete(ChairSignup.query.filter_by(meeting_id=meeting.id).one())
+        db.session.commit()
+        assert _rollup()[(DAY2, 'male', 'Regular')] == (1, 0, 1, 0)
+
+        # Bulk delete bypasses the flush but is still tracked
+        Meeting.query.filter(Meeting.event_date == DAY1).delete()
+        db.session.commit()
+        assert _rollup() == {(DAY2, 'male', 'Regular'): (1, 0, 1, 0)}
+
+        # Rolled-back changes leave the rollup alone
+        db.session.add(Meeting(title="D", event_date=DAY1, start_time=time(9, 0)))
+        db.session.flush()
+        db.session.rollback()
+        assert _rollup() == {(DAY2, 'male', 'Regular'): (1, 0, 1, 0)}
+    print("✅ Rollup follows writes")
+
+
+def test_reconcile_repairs_drift():
+    """The nightly reconcile rebuilds rows from the meetings table."""
+    _setup()
+    with app.app_context():
+        expected = _rollup()
+        db.session.execute(MeetingDailyStat.__table__.delete())
+        db.session.execute(MeetingDailyStat.__table__.insert().values(
+            stat_date=date(2020, 1, 1), gender='', meeting_type='', total_meetings=9,
+            filled_meetings=0, open_meetings=0, signups=0))
+        db.session.commit()
+        assert _rollup() != expected
+        assert reconcile_meeting_daily_stats() == len(expected)
+        assert _rollup() == expected
+        assert rebuild_meeting_daily_stats(window_days=1) == len(expected)
+        assert _rollup() == expected
+    print("✅ Reconcile repairs drift")
+
+
+def test_monthly_report_reads_rollup():
+    """The monthly report's unfilled count comes from the rollup."""
+    _setup()
+    client = app.test_client()
+    with app.app_context():
+        admin = User.query.filter_by(email="admin@rollup.test").first()
+        if admin is None:
+            admin = User(display_name="Rollup Admin", email="admin@rollup.test", password_hash="x", is_admin=True)
+            db.session.add(admin)
+            db.session.commit()
+        admin_id = admin.id
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    resp = client.get('/admin/reports/monthly')
+    assert resp.status_code == 200
+    assert '<h3>3</h3>' in resp.get_data(as_text=True).replace(' ', '').replace('\n', '')
+
+
+if __name__ == "__main__":
+    test_rollup_follows_writes()
+    test_reconcile_repairs_drift()
+    test_monthly_report_reads_rollup()
+    print("\n🎉 All daily stats tests passed!")
@@ -0,0 +1,145 @@
+"""
+Test the aggregate admin dashboard statistics and their memoization
+"""
+
+import os
+import sys
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import app, db, User, Meeting, ChairSignup, get_admin_dashboard_stats, invalidate_meeting_caches
+from dashboard_stats import compute_admin_dashboard
+
+TODAY = date(2030, 5, 15)
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter(User.email.like('%@stats.test')).delete(synchronize_session=False)
+        alice = User(display_name="Alice", email="alice@stats.test", password_hash="x")
+        bob = User(display_name="Bob", email="bob@stats.test", password_hash="x")
+        admin = User(display_name="Admin", email="admin@stats.test", password_hash="x", is_admin=True)
+        db.session.add_all([alice, bob, admin])
+        db.session.flush()
+
+        def meeting(days_ago, gender=None, chair=None):
+            m = Meeting(title="M", event_date=TODAY - timedelta(days=days_ago), start_time=time(12, 0),
+                        gender_restriction=gender)
+            db.session.add(m)
+            db.session.flush()
+            if chair:
+                db.session.add(ChairSignup(meeting_id=m.id, user_id=chair.id, display_name_snapshot=chair.display_name))
+
+        meeting(-3, chair=alice)          # upcoming, chaired
+        meeting(-1)                       # upcoming, open
+        meeting(0, 'male', chair=bob)     # today: coverage but no trend week
+        meeting(2, 'male')                # week 4
+        meeting(9, 'female', chair=alice) # week 3
+        meeting(20, chair=alice)          # week 2
+        meeting(29, 'women', chair=admin) # legacy gender value, outside the trend weeks
+        meeting(45, chair=bob)            # outside the 30-day window
+        db.session.commit()
+        invalidate_meeting_caches()
+
+
+def test_aggregate_payload():
+    """Coverage, weekly trend and participation come out of a few grouped queries."""
+    print("\n🧪 Testing admin dashboard aggregates...")
+    _setup()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            stats, charts = compute_admin_dashboard(db.session, Meeting, ChairSignup, User, TODAY)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        hosts = User.query.filter_by(is_admin=False).count()
+
+    assert len(statements) == 4, statements
+    assert stats == {
+        'total_hosts': hosts,
+        'current_chairs': 2,
+        'future_chairs_needed': 3,
+        'chair_completion_percent': 66.7,
+        'unfilled_chairs': 1,
+    }
+    assert charts['mens_coverage'] == {'filled': 1, 'unfilled': 1, 'percent': 50.0}
+    assert charts['womens_coverage'] == {'filled': 2, 'unfilled': 0, 'percent': 100.0}
+    assert charts['overall_coverage'] == {'filled': 4, 'unfilled': 1, 'percent': 80.0}
+    assert [(w['week'], w['total'], w['filled']) for w in charts['weekly_trend']] == [
+        ('Week 1', 0, 0), ('Week 2', 1, 1), ('Week 3', 1, 1), ('Week 4', 1, 0),
+    ]
+    assert charts['user_participation'] == [
+        {'name': 'Alice', 'count': 3, 'percent': 60.0},
+        {'name': 'Bob', 'count': 2, 'percent': 40.0},
+    ]
+    assert charts['weekly_labels'] == ['Week 1', 'Week 2', 'Week 3', 'Week 4']
+    assert charts['weekly_unfilled'] == [0, 0, 0, 1]
+    assert charts['top_users_names'] == ['Alice', 'Bob']
+    print("✅ Payload computed with 4 queries")
+
+
+def test_admin_dashboard_renders():
+    """The admin panel's chart scripts find every series they read."""
+    _setup()
+    with app.app_context():
+        admin_id = User.query.filter_by(email="admin@stats.test").one().id
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    resp = client.get('/dashboard')
+    assert resp.status_code == 200
+    assert 'labels: ["Week 1", "Week 2", "Week 3", "Week 4"]' in resp.get_data(as_text=True)
+    print("✅ Admin dashboard renders its charts")
+
+
+def test_memoized_per_data_version():
+    """A second call is served from cache until the meetings generation moves."""
+    _setup()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        first = get_admin_dashboard_stats(TODAY)
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert get_admin_dashboard_stats(TODAY) == first
+            assert all("cache_generations" in s for s in statements)  # only the generation read
+            statements.clear()
+            invalidate_meeting_caches()
+            assert get_admin_dashboard_stats(TODAY) == first
+            assert any("cache_generations" not in s for s in statements)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        # ORM writes, bulk ones included, bump the generation when they commit
+        Meeting.query.filter(Meeting.event_date > TODAY).delete()
+        db.session.commit()
+        stats, _ = get_admin_dashboard_stats(TODAY)
+        assert stats['future_chairs_needed'] == 1  # today's meeting only
+    print("✅ Stats memoized per data version")
+
+
+if __name__ == "__main__":
+    test_aggregate_payload()
+    test_memoized_per_data_version()
+    test_admin_dashboard_renders()
+    print("\n🎉 All dashboard stats tests passed!")
@@ -0,0 +1,157 @@
+"""
+Test the email outbox: enqueueing, batched sending over one SMTP session, retries and the send cap
+"""
+
+import os
+import socket
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import app, db, mail, rate_limiter, EmailOutbox, drain_email_outbox, send_email
+from debug_smtp import DebugSMTPServer
+
+
+@contextmanager
+def mail_pointed_at(mail_config, **overrides):
+    """Configure the app's mail settings (and Flask-Mail) for one test, then restore them."""
+    settings = dict(mail_config, MAIL_DEFAULT_SENDER="noreply@backporchmeetings.org", TESTING=False,
+                    EMAIL_OUTBOX_RATE="")
+    settings.update(overrides)
+    saved = {key: app.config.get(key) for key in settings}
+    saved_state = app.extensions['mail']
+    app.config.update(settings)
+    app.extensions['mail'] = mail.init_mail(app.config)
+    rate_limiter.reset()
+    try:
+        yield
+    finally:
+        app.config.update(saved)
+        app.extensions['mail'] = saved_state
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        EmailOutbox.query.delete()
+        db.session.commit()
+
+
+def _statuses():
+    return [(row.recipient, row.status, row.attempts) for row in EmailOutbox.query.order_by(EmailOutbox.id)]
+
+
+def test_send_email_enqueues_and_drain_reuses_session():
+    """send_email() only queues; the drain sends the batch over one SMTP connection."""
+    print("\n🧪 Testing email outbox delivery...")
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), EMAIL_OUTBOX_BATCH_SIZE=2):
+        with app.app_context():
+            for i in range(4):
+                assert send_email(f"chair{i}@outbox.test", f"Hello {i}", "Body")
+            assert send_email("invite@outbox.test", "Invite", "See attached", "BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n", "meeting.ics")
+            assert server.connections == 0
+            assert [status for _, status, _ in _statuses()] == ["pending"] * 5
+
+            result = drain_email_outbox()
+            assert result == {"sent": 5, "failed": 0, "dead": 0, "wait": 0}
+            assert server.connections == 1
+            assert [status for _, status, _ in _statuses()] == ["sent"] * 5
+            _, recipients, invite = server.messages[-1]
+            assert recipients == ["invite@outbox.test"]
+            assert [part.get_filename() for part in invite.iter_attachments()] == ["meeting.ics"]
+            assert drain_email_outbox()["sent"] == 0
+    print("✅ Five emails, three batches, one SMTP session")
+
+
+def test_retry_backoff_and_dead_letter():
+    """Temporary failures back off and retry; refused recipients and repeat failures are dead-lettered."""
+    print("\n🧪 Testing outbox retries...")
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), EMAIL_OUTBOX_MAX_ATTEMPTS=2):
+        with app.app_context():
+            server.refuse.add("nobody@outbox.test")
+            server.fail_next = 1
+            send_email("flaky@outbox.test", "Flaky", "Body")
+            send_email("nobody@outbox.test", "Refused", "Body")
+            send_email("fine@outbox.test", "Fine", "Body")
+
+            result = drain_email_outbox()
+            assert (result["sent"], result["failed"], result["dead"]) == (1, 1, 1)
+            assert _statuses() == [("flaky@outbox.test", "pending", 1), ("nobody@outbox.test", "dead", 1),
+                                   ("fine@outbox.test", "sent", 0)]
+            flaky = EmailOutbox.query.filter_by(recipient="flaky@outbox.test").one()
+            assert flaky.next_attempt_at > datetime.utcnow() + timedelta(seconds=50)
+            assert "451" in flaky.last_error
+            assert drain_email_outbox()["sent"] == 0  # not due yet
+
+            # Second failure reaches EMAIL_OUTBOX_MAX_ATTEMPTS
+            flaky.next_attempt_at = datetime.utcnow()
+            db.session.commit()
+            server.fail_next = 1
+            assert drain_email_outbox()["dead"] == 1
+            assert _statuses()[0] == ("flaky@outbox.test", "dead", 2)
+    print("✅ Retries back off and dead-letter")
+
+
+def test_send_cap_and_unreachable_server():
+    """The per-minute cap and a down server pause the drain without using up attempts."""
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), EMAIL_OUTBOX_RATE="2/minute"):
+        with app.app_context():
+            for i in range(3):
+                send_email(f"capped{i}@outbox.test", "Capped", "Body")
+            result = drain_email_outbox()
+            assert result["sent"] == 2 and result["wait"] > 0
+            assert _statuses()[2] == ("capped2@outbox.test", "pending", 0)
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        closed_port = probe.getsockname()[1]
+    config = {"MAIL_SERVER": "127.0.0.1", "MAIL_PORT": closed_port, "MAIL_USE_SSL": False,
+              "MAIL_USE_TLS": False, "MAIL_USERNAME": "debug", "MAIL_PASSWORD": "debug"}
+    with mail_pointed_at(config):
+        with app.app_context():
+            result = drain_email_outbox()
+            assert result["sent"] == 0 and result["wait"] > 0
+            assert _statuses()[2] == ("capped2@outbox.test", "pending", 0)
+
+
+def test_expired_lease_is_reclaimed():
+    """Rows left 'sending' by a crashed sender go out once their lease expires."""
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config()):
+        with app.app_context():
+            db.session.add_all([
+                EmailOutbox(recipient="stale@outbox.test", subject="Stale", body="Body", status="sending",
+                            claimed_by="dead-sender", lease_until=datetime.utcnow() - timedelta(seconds=1)),
+                EmailOutbox(recipient="held@outbox.test", subject="Held", body="Body", status="sending",
+                            claimed_by="live-sender", lease_until=datetime.utcnow() + timedelta(minutes=5)),
+            ])
+            db.session.commit()
+            assert drain_email_outbox()["sent"] == 1
+            assert [m[1] for m in server.messages] == [["stale@outbox.test"]]
+
+
+def test_inline_when_outbox_disabled():
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), EMAIL_OUTBOX_ENABLED=False):
+        with app.app_context():
+            assert send_email("inline@outbox.test", "Inline", "Body")
+            assert len(server.messages) == 1 and EmailOutbox.query.count() == 0
+
+
+if __name__ == "__main__":
+    test_send_email_enqueues_and_drain_reuses_session()
+    test_retry_backoff_and_dead_letter()
+    test_send_cap_and_unreachable_server()
+    test_expired_lease_is_reclaimed()
+    test_inline_when_outbox_disabled()
+    print("\n🎉 All email outbox tests passed!")
@@ -0,0 +1,80 @@
+"""
+Test the keyset-paginated home page and /api/meetings/upcoming
+"""
+
+import os
+import sys
+from datetime import time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import app, db, Meeting, ChairSignup, get_eastern_today, invalidate_meeting_caches
+
+
+def _setup(days=60):
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    app.config['HOME_INITIAL_DAYS'] = 14
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        today = get_eastern_today()
+        for i in range(days):
+            # Two meetings per day, same start time, so the id tie-breaker matters
+            for n in range(2):
+                db.session.add(Meeting(title=f"Day {i} Meeting {n}", event_date=today + timedelta(days=i), start_time=time(12, 0), is_open=True))
+        db.session.commit()
+        invalidate_meeting_caches()
+
+
+def test_home_renders_only_initial_window():
+    """Home page renders the first two weeks and a lazy-load sentinel."""
+    print("\n🧪 Testing home page initial window...")
+    _setup()
+    client = app.test_client()
+    resp = client.get('/')
+    assert resp.status_code == 200
+    html = resp.get_data(as_text=True)
+    assert "Day 13 Meeting 1" in html
+    assert "Day 14 Meeting 0" not in html
+    assert 'id="upcomingMeetingsMore"' in html
+    print("✅ Only the first 14 days rendered server-side")
+
+
+def test_upcoming_api_walks_every_meeting_once():
+    """Following next_cursor visits every remaining meeting exactly once, in order."""
+    print("\n🧪 Testing keyset pagination...")
+    _setup()
+    client = app.test_client()
+    html = client.get('/').get_data(as_text=True)
+    cursor = html.split('data-cursor="', 1)[1].split('"', 1)[0]
+
+    titles = []
+    while cursor:
+        data = client.get(f'/api/meetings/upcoming?limit=7&cursor={cursor}').get_json()
+        titles.extend(m["title"] for m in data["meetings"])
+        cursor = data["next_cursor"]
+    expected = [f"Day {i} Meeting {n}" for i in range(14, 60) for n in range(2)]
+    assert titles == expected
+    print(f"✅ Paged through {len(titles)} meetings without gaps or repeats")
+
+
+def test_upcoming_api_rejects_bad_cursor():
+    print("\n🧪 Testing malformed cursor...")
+    _setup(days=1)
+    client = app.test_client()
+    resp = client.get('/api/meetings/upcoming?cursor=garbage')
+    assert resp.status_code == 400
+    print("✅ Malformed cursor rejected")
+
+
+if __name__ == "__main__":
+    test_home_renders_only_initial_window()
+    test_upcoming_api_walks_every_meeting_once()
+    test_upcoming_api_rejects_bad_cursor()
+    print("\n🎉 All home pagination tests passed!")
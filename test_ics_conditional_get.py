@@ -0,0 +1,103 @@
+"""
+Test conditional GET (ETag / Last-Modified / 304) on the ICS feeds
+"""
+
+import os
+import sys
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import app, db, cache, CacheGeneration, Meeting, ChairSignup, invalidate_meeting_caches
+
+
+FEEDS = [
+    '/calendar.ics',
+    '/calendar/ics?year=2030&month=3',
+    '/calendar/day-ics?date=2030-03-12',
+]
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        db.session.add(Meeting(title="Feed Meeting", event_date=date(2030, 3, 12), start_time=time(19, 0), is_open=True))
+        db.session.add(Meeting(title="Tomorrow Meeting", event_date=date.today() + timedelta(days=1), start_time=time(9, 0), is_open=True))
+        db.session.commit()
+        invalidate_meeting_caches()
+
+
+def test_ics_feeds_return_304_when_unchanged():
+    """A poll with the previous ETag gets a header-only 304."""
+    print("\n🧪 Testing ICS conditional GET...")
+    _setup()
+    client = app.test_client()
+    for url in FEEDS:
+        first = client.get(url)
+        assert first.status_code == 200, url
+        assert first.headers.get('ETag'), url
+        assert first.headers.get('Last-Modified'), url
+
+        again = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+        assert again.status_code == 304, url
+        assert again.data == b'', url
+
+        since = client.get(url, headers={'If-Modified-Since': first.headers['Last-Modified']})
+        assert since.status_code == 304, url
+        print(f"✅ {url} answers 304 for an unchanged feed")
+
+
+def test_ics_etag_changes_after_meeting_write():
+    """Any meeting write invalidates the feed validators."""
+    print("\n🧪 Testing ICS ETag invalidation...")
+    _setup()
+    client = app.test_client()
+    first = client.get('/calendar/ics?year=2030&month=3')
+    with app.app_context():
+        Meeting.query.filter_by(title="Feed Meeting").update({Meeting.title: "Renamed Feed Meeting"})
+        db.session.commit()
+        invalidate_meeting_caches()
+    again = client.get('/calendar/ics?year=2030&month=3', headers={'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 200
+    assert b"Renamed Feed Meeting" in again.data
+    assert again.headers['ETag'] != first.headers['ETag']
+    print("✅ Feed regenerated after data version bump")
+
+
+def test_validators_agree_across_processes():
+    """Validators come from the shared generation row, not a worker's own cache."""
+    _setup()
+    client = app.test_client()
+    url = '/calendar/ics?year=2030&month=3'
+    first = client.get(url)
+    with app.app_context():
+        cache.clear()  # a worker that has never served this feed
+    cold = client.get(url)
+    assert (cold.headers['ETag'], cold.headers['Last-Modified']) == (first.headers['ETag'], first.headers['Last-Modified'])
+
+    with app.app_context():
+        # Another process commits an edit: the row and the shared generation change
+        with db.engine.begin() as conn:
+            conn.execute(Meeting.__table__.update().where(Meeting.title == "Feed Meeting")
+                         .values(title="Edited Elsewhere"))
+            conn.execute(CacheGeneration.__table__.update()
+                         .where(CacheGeneration.namespace == "meetings")
+                         .values(generation=CacheGeneration.generation + 1000))
+    again = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 200
+    assert b"Edited Elsewhere" in again.data
+
+
+if __name__ == "__main__":
+    test_ics_feeds_return_304_when_unchanged()
+    test_ics_etag_changes_after_meeting_write()
+    test_validators_agree_across_processes()
+    print("\n🎉 All ICS conditional GET tests passed!")
@@ -0,0 +1,151 @@
+"""
+Test the shared ICS serialization engine and the feeds built on it
+"""
+
+import os
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from icalendar import Calendar
+
+import ics_engine
+from app import (
+    app, db, User, Meeting, ChairSignup,
+    generate_meeting_ical, ics_fragment_cache, invalidate_meeting_caches,
+)
+
+
+def test_folding_and_escaping():
+    """Long lines fold at 75 octets without splitting multi-byte characters."""
+    print("\n🧪 Testing ICS line folding...")
+    line = "DESCRIPTION:" + ics_engine.escape_text("Señor, café; back\\slash\n" * 10)
+    folded = ics_engine.fold(line)
+    for physical in folded.split(b"\r\n"):
+        assert len(physical) <= 75
+        physical.decode("utf-8")  # every physical line is valid UTF-8
+    assert folded.replace(b"\r\n ", b"") == line.encode("utf-8") + b"\r\n"
+    assert ics_engine.format_duration(timedelta(hours=-24)) == "-P1D"
+    assert ics_engine.format_duration(timedelta(hours=-1)) == "-PT1H"
+    print("✅ Folding and escaping are RFC 5545 compliant")
+
+
+def test_engine_output_parses_with_icalendar():
+    """Engine output round-trips through the icalendar parser."""
+    print("\n🧪 Testing ICS engine round trip...")
+    fragment = ics_engine.render_event(
+        uid="meeting-1@backporchmeetings.org",
+        summary="Noon Meeting, Men's",
+        dtstart=datetime(2030, 3, 12, 12, 0),
+        dtend=datetime(2030, 3, 12, 13, 0),
+        location="https://zoom.us/j/123?pwd=a;b",
+        description="Line one\n\nChair: Jeff A. (BP-1002)",
+        url="https://example.org/meeting/1",
+        alarms=[(timedelta(hours=-24), "Reminder")],
+    )
+    payload = ics_engine.render_calendar(ics_engine.calendar_header("-//Test//", calname="Test"), [fragment])
+    cal = Calendar.from_ical(payload)
+    events = [c for c in cal.walk("VEVENT")]
+    assert len(events) == 1
+    event = events[0]
+    assert str(event["summary"]) == "Noon Meeting, Men's"
+    assert str(event["location"]) == "https://zoom.us/j/123?pwd=a;b"
+    assert str(event["description"]) == "Line one\n\nChair: Jeff A. (BP-1002)"
+    assert event.decoded("dtstart") == datetime(2030, 3, 12, 12, 0)
+    assert len(event.walk("VALARM")) == 1
+    print("✅ Engine output parses with icalendar")
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter_by(email="ics.chair@example.com").delete()
+        user = User(display_name="Ics Chair", email="ics.chair@example.com", password_hash="x")
+        db.session.add(user)
+        m1 = Meeting(title="Chaired Meeting", description="Format: open", event_date=date(2030, 3, 12), start_time=time(19, 0), is_open=True)
+        m2 = Meeting(title="Open Meeting", event_date=date(2030, 3, 13), start_time=time(12, 0), end_time=time(13, 30), is_open=True)
+        db.session.add_all([m1, m2])
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=m1.id, user_id=user.id, display_name_snapshot="Ics Chair"))
+        db.session.commit()
+        invalidate_meeting_caches()
+        ics_fragment_cache.clear()
+        return user.id, m1.id
+
+
+def test_month_feed_content_and_fragment_reuse():
+    """Month feed carries the same event data and reuses cached fragments."""
+    print("\n🧪 Testing month feed via ICS engine...")
+    user_id, meeting_id = _setup()
+    client = app.test_client()
+    resp = client.get('/calendar/ics?year=2030&month=3')
+    assert resp.status_code == 200
+    cal = Calendar.from_ical(resp.data)
+    events = {str(e["uid"]): e for e in cal.walk("VEVENT")}
+    chaired = events[f"meeting-{meeting_id}@backporchmeetings.org"]
+    assert str(chaired["description"]) == f"Format: open\n\nChair: Ics Chair (BP-{1000 + user_id})"
+    assert chaired.decoded("dtend") == datetime(2030, 3, 13, 0, 0, tzinfo=timezone.utc)  # 8 PM EDT
+    assert len(events) == 2
+
+    misses = ics_fragment_cache.misses
+    client.get('/calendar/ics?year=2030&month=3')
+    assert ics_fragment_cache.misses == misses
+    print("✅ Month feed rendered from cached fragments")
+
+
+def test_edit_rerenders_only_that_meeting():
+    """A meeting edit or chair change misses the cache for that meeting alone."""
+    user_id, meeting_id = _setup()
+    client = app.test_client()
+    url = '/calendar/ics?year=2030&month=3'
+    client.get(url)
+
+    with app.app_context():
+        Meeting.query.filter_by(title="Open Meeting").update({Meeting.description: "Now with a format"})
+        db.session.commit()
+    misses = ics_fragment_cache.misses
+    resp = client.get(url)
+    assert ics_fragment_cache.misses == misses + 1
+    assert b"Now with a format" in resp.data
+
+    with app.app_context():
+        ChairSignup.query.filter_by(meeting_id=meeting_id).one().display_name_snapshot = "Renamed Chair"
+        db.session.commit()
+    misses = ics_fragment_cache.misses
+    resp = client.get(url)
+    assert ics_fragment_cache.misses == misses + 1
+    assert f"Chair: Renamed Chair (BP-{1000 + user_id})".encode() in resp.data
+    print("✅ Only the edited meeting is re-rendered")
+
+
+def test_invite_attachment():
+    """Email invite keeps METHOD:REQUEST and both alarms."""
+    print("\n🧪 Testing chair invite attachment...")
+    _setup()
+    with app.test_request_context():
+        meeting = Meeting.query.filter_by(title="Chaired Meeting").first()
+        payload = generate_meeting_ical(meeting, "Ics Chair")
+    cal = Calendar.from_ical(payload)
+    assert str(cal["method"]) == "REQUEST"
+    event = cal.walk("VEVENT")[0]
+    assert str(event["summary"]) == "CHAIR: Chaired Meeting"
+    assert len(event.walk("VALARM")) == 2
+    print("✅ Invite attachment generated")
+
+
+if __name__ == "__main__":
+    test_folding_and_escaping()
+    test_engine_output_parses_with_icalendar()
+    test_month_feed_content_and_fragment_reuse()
+    test_edit_rerenders_only_that_meeting()
+    test_invite_attachment()
+    print("\n🎉 All ICS engine tests passed!")
@@ -0,0 +1,92 @@
+"""
+Test the request-scoped identity cache (user / sponsor / roles on flask.g)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import app, db, User, UserRole, get_current_user
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        User.query.filter_by(email="identity.admin@example.com").delete()
+        admin = User(
+            display_name="Identity Admin", email="identity.admin@example.com", password_hash="x",
+            is_admin=True, profile_image="data:image/png;base64," + "A" * 50000,
+        )
+        db.session.add(admin)
+        db.session.flush()
+        UserRole.query.filter_by(user_id=admin.id).delete()
+        db.session.add(UserRole(user_id=admin.id, role="moderator", is_active=True))
+        db.session.commit()
+        return admin.id
+
+
+class _UserQueryCounter:
+    """Counts SELECTs against the users table while active."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(db.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(db.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        lowered = statement.lower()
+        if lowered.lstrip().startswith("select") and "from users" in lowered:
+            self.statements.append(statement)
+
+
+def test_admin_page_loads_user_once():
+    """Decorator, view and base template share a single user lookup."""
+    print("\n🧪 Testing one user query per request...")
+    admin_id = _setup()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    with app.app_context():
+        with _UserQueryCounter() as counter:
+            resp = client.get('/admin/meetings')
+    assert resp.status_code == 200
+    assert len(counter.statements) == 1, counter.statements
+    assert "users.profile_image AS" not in counter.statements[0]  # blob stays deferred
+    print(f"✅ {len(counter.statements)} user query for an admin page")
+
+
+def test_roles_and_logout_within_request():
+    """Roles are cached per request; a session change is picked up."""
+    print("\n🧪 Testing cached roles and session changes...")
+    admin_id = _setup()
+    with app.test_request_context('/'):
+        from flask import session
+        session['user_id'] = admin_id
+        user = get_current_user()
+        assert user.has_profile_image
+        assert user.has_role("moderator")
+        assert not user.has_role("treasurer")
+        assert get_current_user() is user
+        session.pop('user_id')
+        assert get_current_user() is None
+    print("✅ Roles cached and logout honoured")
+
+
+if __name__ == "__main__":
+    test_admin_page_loads_user_once()
+    test_roles_and_logout_within_request()
+    print("\n🎉 All identity cache tests passed!")
@@ -0,0 +1,114 @@
+"""
+Test HTTP caching of profile and sponsor images (ETag, 304, immutable URLs)
+"""
+
+import os
+import sys
+from datetime import date, time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from PIL import Image
+from sqlalchemy import event
+
+from app import (
+    app, db, User, Sponsor, Meeting, ChairSignup, ImageBlob, ImageVariant,
+    set_profile_image, invalidate_meeting_caches,
+)
+
+
+def _png():
+    out = BytesIO()
+    Image.new("RGB", (300, 200), (10, 120, 200)).save(out, "PNG")
+    return out.getvalue()
+
+
+PNG = _png()
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter(User.email.like('%@cache.test')).delete(synchronize_session=False)
+        Sponsor.query.filter(Sponsor.email.like('%@cache.test')).delete(synchronize_session=False)
+        ImageVariant.query.delete()
+        ImageBlob.query.delete()
+        user = User(display_name="Cached Chair", email="chair@cache.test", password_hash="x")
+        sponsor = Sponsor(display_name="Cached Sponsor", email="sponsor@cache.test", is_active=True, max_sponsees=2)
+        db.session.add_all([user, sponsor])
+        set_profile_image(user, PNG)
+        set_profile_image(sponsor, PNG)
+        meeting = Meeting(title="Cached", event_date=date(2030, 6, 3), start_time=time(9, 0), is_open=False)
+        db.session.add(meeting)
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=meeting.id, user_id=user.id, display_name_snapshot="Cached Chair"))
+        db.session.commit()
+        invalidate_meeting_caches()
+        return user.id, sponsor.id, user.profile_image_hash
+
+
+def test_fingerprinted_url_is_immutable_and_revalidates():
+    """API URLs carry the content hash; If-None-Match gets a 304 without reading image data."""
+    print("\n🧪 Testing image HTTP caching...")
+    user_id, sponsor_id, digest = _setup()
+    client = app.test_client()
+
+    url = client.get('/api/day-meetings?date=2030-06-03').get_json()["meetings"][0]["chair_profile_url"]
+    assert f"v={digest[:16]}" in url and "size=48" in url
+
+    with client.session_transaction() as sess:
+        sess.permanent = True
+        sess['user_id'] = user_id
+    resp = client.get(url)
+    assert resp.status_code == 200
+    assert resp.headers['Cache-Control'] == "public, max-age=31536000, immutable"
+    assert 'Set-Cookie' not in resp.headers
+    etag = resp.headers['ETag']
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            resp = client.get(url, headers={'If-None-Match': etag})
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+    assert resp.status_code == 304
+    assert resp.headers['ETag'] == etag
+    assert not any('image_blobs' in s or 'image_variants' in s for s in statements), statements
+    print("✅ 304 answered from the row's content hash")
+
+
+def test_unfingerprinted_and_stale_urls_revalidate():
+    """Plain or outdated URLs still work but must revalidate."""
+    user_id, sponsor_id, digest = _setup()
+    client = app.test_client()
+
+    resp = client.get(f'/sponsor/image/{sponsor_id}')
+    assert resp.status_code == 200 and resp.data == PNG
+    assert resp.headers['Cache-Control'] == "public, no-cache"
+    assert client.get(f'/sponsor/image/{sponsor_id}', headers={'If-None-Match': resp.headers['ETag']}).status_code == 304
+
+    resp = client.get(f'/profile/image/{user_id}?v=0000000000000000')
+    assert resp.status_code == 200
+    assert resp.headers['Cache-Control'] == "public, no-cache"
+
+    resp = client.get(f'/sponsors')
+    assert f"/sponsor/image/{sponsor_id}?size=128&amp;v={digest[:16]}" in resp.get_data(as_text=True)
+
+
+if __name__ == "__main__":
+    test_fingerprinted_url_is_immutable_and_revalidates()
+    test_unfingerprinted_and_stale_urls_revalidate()
+    print("\n🎉 All image caching tests passed!")
@@ -0,0 +1,118 @@
+"""
+Test upload-time image variants and ?size= content negotiation
+"""
+
+import os
+import sys
+import threading
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from PIL import Image
+
+from image_pipeline import ImagePipeline, pick_variant_size, render_variants
+from app import app, db, User, ImageBlob, ImageVariant
+
+
+def _photo(width=1200, height=800, orientation=None):
+    """JPEG with EXIF (camera make + optional orientation)."""
+    img = Image.new("RGB", (width, height), (200, 30, 30))
+    exif = Image.Exif()
+    exif[0x010F] = "TestCam"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    out = BytesIO()
+    img.save(out, "JPEG", exif=exif.tobytes())
+    return out.getvalue()
+
+
+def test_render_variants():
+    """Variants are resized, EXIF-rotated and stripped of metadata."""
+    print("\n🧪 Testing image variants...")
+    variants = render_variants(_photo(orientation=6), sizes=(48, 512))
+    assert set(variants) == {(48, "webp"), (48, "jpeg"), (512, "webp"), (512, "jpeg")}
+    with Image.open(BytesIO(variants[(512, "jpeg")])) as img:
+        # Orientation 6 = rotated 90°, so the landscape original becomes portrait
+        assert img.size == (341, 512)
+        assert not img.getexif()
+    with Image.open(BytesIO(variants[(48, "webp")])) as img:
+        assert img.format == "WEBP" and max(img.size) == 48
+    assert render_variants(b"not an image") == {}
+    assert pick_variant_size(16) == 48 and pick_variant_size(200) == 512 and pick_variant_size(4000) == 512
+    print("✅ Variants rendered")
+
+
+def test_pipeline_runs_off_thread():
+    """submit() processes on a worker thread and reports back through on_done."""
+    seen = []
+
+    def on_done(key, variants):
+        seen.append((key, threading.current_thread().name, len(variants)))
+
+    pipeline = ImagePipeline(on_done, sizes=(48,), workers=1)
+    pipeline.submit("abc", _photo()).result(timeout=10)
+    pipeline.shutdown()
+    assert seen == [("abc", seen[0][1], 2)]
+    assert seen[0][1].startswith("image-pipeline")
+
+
+def test_profile_image_size_negotiation():
+    """?size= serves the nearest variant as WebP or JPEG based on Accept."""
+    print("\n🧪 Testing ?size= negotiation...")
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        User.query.filter_by(email="variants@images.test").delete()
+        ImageVariant.query.delete()
+        ImageBlob.query.delete()
+        user = User(display_name="Variant User", email="variants@images.test")
+        user.set_password("correct-horse-battery")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    original = _photo()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+    resp = client.post('/profile', data={
+        'display_name': 'Variant User',
+        'profile_image': (BytesIO(original), 'me.jpg'),
+    }, content_type='multipart/form-data')
+    assert resp.status_code == 302
+
+    resp = client.get(f'/profile/image/{user_id}?size=32', headers={'Accept': 'image/avif,image/webp,*/*'})
+    assert resp.mimetype == "image/webp"
+    assert 'Accept' in resp.headers['Vary']
+    with Image.open(BytesIO(resp.data)) as img:
+        assert max(img.size) == 48
+
+    resp = client.get(f'/profile/image/{user_id}?size=128', headers={'Accept': 'image/*'})
+    assert resp.mimetype == "image/jpeg"
+    with Image.open(BytesIO(resp.data)) as img:
+        assert max(img.size) == 128
+
+    # No size: the original upload, as before
+    resp = client.get(f'/profile/image/{user_id}')
+    assert resp.data == original
+
+    # Variants not rendered (yet): fall back to the original
+    with app.app_context():
+        ImageVariant.query.delete()
+        db.session.commit()
+    resp = client.get(f'/profile/image/{user_id}?size=48')
+    assert resp.data == original
+    print("✅ Size negotiation works")
+
+
+if __name__ == "__main__":
+    test_render_variants()
+    test_pipeline_runs_off_thread()
+    test_profile_image_size_negotiation()
+    print("\n🎉 All image pipeline tests passed!")
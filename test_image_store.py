@@ -0,0 +1,173 @@
+"""
+Test out-of-row profile/sponsor image storage and the legacy migration
+"""
+
+import base64
+import os
+import sys
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import (
+    app, db, User, Sponsor, ImageBlob,
+    migrate_legacy_profile_images, set_profile_image, clear_profile_image,
+)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+JPEG = b"\xff\xd8\xff\xe0" + b"\x01" * 64
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+
+def _reset():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        User.query.filter(User.email.like('%@images.test')).delete(synchronize_session=False)
+        Sponsor.query.filter(Sponsor.email.like('%@images.test')).delete(synchronize_session=False)
+        ImageBlob.query.delete()
+        # Other test modules sharing the database may leave legacy base64 images behind
+        User.query.filter(User.profile_image.isnot(None)).update({"profile_image": None}, synchronize_session=False)
+        Sponsor.query.filter(Sponsor.profile_image.isnot(None)).update({"profile_image": None}, synchronize_session=False)
+        db.session.commit()
+
+
+def test_upload_stores_blob_out_of_row():
+    """Profile uploads land in image_blobs and loading a User skips image data."""
+    print("\n🧪 Testing out-of-row image storage...")
+    _reset()
+    with app.app_context():
+        user = User(display_name="Photo User", email="photo@images.test")
+        user.set_password("correct-horse-battery")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+    resp = client.post('/profile', data={
+        'display_name': 'Photo User',
+        'profile_image': (BytesIO(PNG), 'me.png'),
+    }, content_type='multipart/form-data')
+    assert resp.status_code == 302
+
+    with app.app_context():
+        counter = StatementCounter()
+        event.listen(db.engine, "before_cursor_execute", counter)
+        try:
+            user = db.session.get(User, user_id)
+            assert user.has_profile_image
+        finally:
+            event.remove(db.engine, "before_cursor_execute", counter)
+        assert "users.profile_image AS" not in counter.statements[0]  # legacy column stays deferred
+        assert user.profile_image_hash
+        blob = db.session.get(ImageBlob, user.profile_image_hash)
+        assert blob.data == PNG and blob.mimetype == "image/png"
+
+    resp = client.get(f'/profile/image/{user_id}')
+    assert resp.status_code == 200
+    assert resp.data == PNG
+    assert resp.mimetype == "image/png"
+    print("✅ Image stored in image_blobs")
+
+
+def test_shared_content_and_cleanup():
+    """Identical photos share a blob; a blob is removed once nothing references it."""
+    _reset()
+    with app.app_context():
+        sponsor = Sponsor(display_name="Sponsor A", email="a@images.test")
+        user = User(display_name="Photo B", email="b@images.test", password_hash="x")
+        db.session.add_all([sponsor, user])
+        set_profile_image(sponsor, JPEG)
+        set_profile_image(user, JPEG)
+        db.session.commit()
+        assert ImageBlob.query.count() == 1
+
+        set_profile_image(user, PNG)
+        db.session.commit()
+        assert ImageBlob.query.count() == 2
+
+        clear_profile_image(sponsor)
+        db.session.commit()
+        assert ImageBlob.query.count() == 1
+        assert not db.session.get(Sponsor, sponsor.id).has_profile_image
+
+
+def test_migrate_legacy_rows():
+    """Legacy base64 rows still render and the migration moves them into image_blobs."""
+    print("\n🧪 Testing legacy image migration...")
+    _reset()
+    with app.app_context():
+        user = User(display_name="Legacy", email="legacy@images.test", password_hash="x",
+                    profile_image=base64.b64encode(JPEG).decode())
+        sponsor = Sponsor(display_name="Legacy Sponsor", email="legacy-s@images.test",
+                          profile_image=base64.b64encode(PNG).decode())
+        broken = User(display_name="Broken", email="broken@images.test", password_hash="x",
+                      profile_image="not base64!")
+        db.session.add_all([user, sponsor, broken])
+        db.session.commit()
+        user_id, sponsor_id, broken_id = user.id, sponsor.id, broken.id
+
+    client = app.test_client()
+    assert client.get(f'/profile/image/{user_id}').data == JPEG
+
+    with app.app_context():
+        moved = migrate_legacy_profile_images(batch_size=1)
+        assert moved == {"users": 1, "sponsors": 1, "failed": 1}
+        assert migrate_legacy_profile_images() == {"users": 0, "sponsors": 0, "failed": 1}
+        user = db.session.get(User, user_id)
+        assert user.profile_image is None and user.profile_image_hash
+        sponsor = db.session.get(Sponsor, sponsor_id)
+        assert sponsor.profile_image is None and sponsor.profile_image_hash
+        broken = db.session.get(User, broken_id)
+        assert broken.profile_image == "not base64!" and not broken.profile_image_hash
+
+    assert client.get(f'/profile/image/{user_id}').data == JPEG
+    resp = client.get(f'/sponsor/image/{sponsor_id}')
+    assert resp.data == PNG and resp.mimetype == "image/png"
+    print("✅ Legacy images migrated")
+
+
+
+def test_upgrade_schema_adds_hash_columns():
+    """A database created before out-of-row storage gains the hash columns from upgrade-schema."""
+    _reset()
+    with app.app_context():
+        with db.engine.begin() as conn:
+            for table in ('users', 'sponsors'):
+                conn.execute(db.text(f"DROP INDEX ix_{table}_profile_image_hash"))
+                conn.execute(db.text(f"ALTER TABLE {table} DROP COLUMN profile_image_hash"))
+
+    result = app.test_cli_runner().invoke(args=["upgrade-schema"])
+    assert "Added users.profile_image_hash" in result.output, result.output
+    assert "Added sponsors.profile_image_hash" in result.output, result.output
+
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        for table in ('users', 'sponsors'):
+            assert 'profile_image_hash' in [c['name'] for c in inspector.get_columns(table)]
+            assert f'ix_{table}_profile_image_hash' in [ix['name'] for ix in inspector.get_indexes(table)]
+        User.query.count()
+
+
+if __name__ == "__main__":
+    test_upload_stores_blob_out_of_row()
+    test_shared_content_and_cleanup()
+    test_migrate_legacy_rows()
+    test_upgrade_schema_adds_hash_columns()
+    print("\n🎉 All image store tests passed!")
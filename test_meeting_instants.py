@@ -0,0 +1,144 @@
+"""
+Test the UTC start/end instants on meetings: sync on write, day scans, backfill CLI and ICS output
+"""
+
+import os
+import sys
+from datetime import date, datetime, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import (app, db, ChairSignup, EmailOutbox, Meeting, User, eastern_days_to_utc, generate_meeting_ical,
+                 get_eastern_today, invalidate_meeting_caches, send_day_of_chair_reminders)
+from debug_smtp import DebugSMTPServer
+from test_email_outbox import mail_pointed_at
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        invalidate_meeting_caches()
+
+
+def test_instants_on_create_and_edit():
+    print("\n🧪 Testing meeting UTC instants...")
+    _setup()
+    with app.app_context():
+        plain = Meeting(title="Plain", event_date=date(2026, 11, 2), start_time=time(19, 0))
+        late = Meeting(title="Late", event_date=date(2026, 3, 7), start_time=time(23, 0), end_time=time(0, 30))
+        db.session.add_all([plain, late])
+        db.session.commit()
+        # No end time: one hour. EST is UTC-5.
+        assert (plain.starts_at_utc, plain.ends_at_utc) == (datetime(2026, 11, 3, 0, 0), datetime(2026, 11, 3, 1, 0))
+        # Ends after midnight: the next day
+        assert late.ends_at_utc == datetime(2026, 3, 8, 5, 30)
+
+        plain.end_time = time(20, 30)
+        plain.event_date = date(2026, 10, 26)  # still EDT, UTC-4
+        db.session.commit()
+        assert (plain.starts_at_utc, plain.ends_at_utc) == (datetime(2026, 10, 26, 23, 0), datetime(2026, 10, 27, 0, 30))
+
+        assert eastern_days_to_utc(date(2026, 3, 7), date(2026, 3, 8)) == (datetime(2026, 3, 7, 5, 0),
+                                                                           datetime(2026, 3, 9, 4, 0))
+    print("✅ Instants follow edits and DST")
+
+
+def test_day_scans_use_the_eastern_day():
+    """Late-evening Eastern meetings (already tomorrow in UTC) stay on their own day."""
+    _setup()
+    today = get_eastern_today()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config()):
+        with app.app_context():
+            chair = User(display_name="Eve", email="eve@instants.test", password_hash="x")
+            tonight = Meeting(title="Tonight Late", event_date=today, start_time=time(23, 30))
+            morning = Meeting(title="This Morning", event_date=today, start_time=time(7, 0))
+            tomorrow = Meeting(title="Tomorrow Early", event_date=today + timedelta(days=1), start_time=time(0, 30))
+            db.session.add_all([chair, tonight, morning, tomorrow])
+            db.session.add(ChairSignup(meeting=tonight, user=chair, display_name_snapshot="Eve"))
+            db.session.add(ChairSignup(meeting=tomorrow, user=chair, display_name_snapshot="Eve"))
+            db.session.commit()
+
+            assert send_day_of_chair_reminders(today) == 1
+            assert [row.subject for row in EmailOutbox.query] == ["Heads up! You're hosting today — Tonight Late"]
+
+        client = app.test_client()
+        page = client.get("/meetings/today").get_data(as_text=True)
+        assert "Tonight Late" in page and "This Morning" in page and "Tomorrow Early" not in page
+        assert page.index("This Morning") < page.index("Tonight Late")
+
+        data = client.get(f"/api/day-meetings?date={today.isoformat()}").get_json()
+        assert [m["title"] for m in data["meetings"]] == ["This Morning", "Tonight Late"]
+
+
+def test_backfill_command():
+    """backfill-meeting-times fills missing instants; --all also repairs stale ones."""
+    _setup()
+    with app.app_context():
+        db.session.add_all([
+            Meeting(title="A", event_date=date(2026, 6, 1), start_time=time(12, 0)),
+            Meeting(title="B", event_date=date(2026, 12, 1), start_time=time(12, 0)),
+        ])
+        db.session.commit()
+        with db.engine.begin() as conn:
+            conn.execute(Meeting.__table__.update().where(Meeting.title == "A").values(starts_at_utc=None, ends_at_utc=None))
+            conn.execute(Meeting.__table__.update().where(Meeting.title == "B").values(event_date=date(2026, 12, 2)))
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["backfill-meeting-times"])
+    assert "on 1 meetings" in result.output, result.output
+    result = runner.invoke(args=["backfill-meeting-times", "--all"])
+    assert "on 1 meetings" in result.output, result.output
+    with app.app_context():
+        assert {m.title: m.starts_at_utc for m in Meeting.query} == {
+            "A": datetime(2026, 6, 1, 16, 0), "B": datetime(2026, 12, 2, 17, 0)}
+    print("✅ Backfill fills and repairs instants")
+
+
+def test_rows_without_instants_still_listed():
+    """Meetings inserted by raw SQL (NULL instants) fall back to event_date until backfilled."""
+    _setup()
+    today = get_eastern_today()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config()):
+        with app.app_context():
+            chair = User(display_name="Raw", email="raw@instants.test", password_hash="x")
+            db.session.add(chair)
+            db.session.commit()
+            with db.engine.begin() as conn:
+                conn.execute(Meeting.__table__.insert().values(
+                    title="Imported", event_date=today, start_time=time(20, 0), is_open=True, meeting_type="Regular"))
+            meeting = Meeting.query.filter_by(title="Imported").one()
+            assert meeting.starts_at_utc is None
+            db.session.add(ChairSignup(meeting=meeting, user=chair, display_name_snapshot="Raw"))
+            db.session.commit()
+            assert send_day_of_chair_reminders(today) == 1
+
+        client = app.test_client()
+        assert "Imported" in client.get("/meetings/today").get_data(as_text=True)
+        data = client.get(f"/api/day-meetings?date={today.isoformat()}").get_json()
+        assert [m["title"] for m in data["meetings"]] == ["Imported"]
+
+
+def test_ics_publishes_utc_instants():
+    _setup()
+    with app.app_context():
+        meeting = Meeting(title="Invite", event_date=date(2026, 7, 4), start_time=time(12, 0), end_time=time(13, 0))
+        db.session.add(meeting)
+        db.session.commit()
+        with app.test_request_context():
+            payload = generate_meeting_ical(meeting, "Chair").decode()
+    assert "DTSTART:20260704T160000Z" in payload and "DTEND:20260704T170000Z" in payload
+
+
+if __name__ == "__main__":
+    test_instants_on_create_and_edit()
+    test_day_scans_use_the_eastern_day()
+    test_backfill_command()
+    test_rows_without_instants_still_listed()
+    test_ics_publishes_utc_instants()
+    print("\n🎉 All meeting instant tests passed!")
@@ -0,0 +1,148 @@
+"""
+Test the notification ledger: UTC start instants, once-only reminders and confirmations
+"""
+
+import os
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import (app, db, EASTERN_TZ, ChairSignup, EmailOutbox, Meeting, NotificationLedger, User,
+                 backfill_meeting_instants, check_and_send_reminders, send_chair_confirmation,
+                 send_meeting_confirmations, send_notification_once)
+from debug_smtp import DebugSMTPServer
+from test_email_outbox import mail_pointed_at
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+
+def _meeting_starting_in(delta, title):
+    """A meeting whose Eastern date/time is ``delta`` from now."""
+    local = (datetime.now(timezone.utc) + delta).astimezone(EASTERN_TZ)
+    return Meeting(title=title, event_date=local.date(), start_time=local.time().replace(microsecond=0))
+
+
+def _chair(meeting, user):
+    db.session.add(ChairSignup(meeting=meeting, user=user, display_name_snapshot=user.display_name))
+
+
+def test_start_instant_follows_eastern_wall_clock():
+    print("\n🧪 Testing meeting start instants...")
+    _setup()
+    with app.app_context():
+        winter = Meeting(title="Winter", event_date=date(2026, 1, 15), start_time=time(12, 0))
+        db.session.add(winter)
+        db.session.commit()
+        assert winter.starts_at_utc == datetime(2026, 1, 15, 17, 0)  # EST, UTC-5
+
+        winter.event_date = date(2026, 7, 15)
+        db.session.commit()
+        assert winter.starts_at_utc == datetime(2026, 7, 15, 16, 0)  # EDT, UTC-4
+
+        with db.engine.begin() as conn:
+            conn.execute(Meeting.__table__.update().values(starts_at_utc=None))
+        db.session.expire_all()
+        assert backfill_meeting_instants() == 1
+        assert Meeting.query.one().starts_at_utc == datetime(2026, 7, 15, 16, 0)
+    print("✅ starts_at_utc tracks DST")
+
+
+def test_reminders_are_sent_once():
+    """Repeat scans find nothing new, and each reminder goes out exactly once."""
+    print("\n🧪 Testing once-only reminders...")
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config()):
+        with app.app_context():
+            chair = User(display_name="Rae", email="rae@ledger.test", password_hash="x")
+            tomorrow = _meeting_starting_in(timedelta(hours=23), "Tomorrow")
+            soon = _meeting_starting_in(timedelta(minutes=50), "Soon")
+            later = _meeting_starting_in(timedelta(hours=30), "Later")
+            unchaired = _meeting_starting_in(timedelta(hours=23), "Unchaired")
+            db.session.add_all([chair, tomorrow, soon, later, unchaired])
+            for m in (tomorrow, soon, later):
+                _chair(m, chair)
+            db.session.commit()
+
+            assert check_and_send_reminders() == 2
+            kinds = {(row.meeting_id, row.kind) for row in NotificationLedger.query}
+            assert kinds == {(tomorrow.id, "reminder_24h"), (soon.id, "reminder_1h")}
+            subjects = sorted(row.subject for row in EmailOutbox.query)
+            assert subjects == ["Reminder: You're chairing tomorrow — Tomorrow", "Starting soon: Soon in 1 hour"]
+
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            event.listen(db.engine, "before_cursor_execute", listener)
+            try:
+                assert check_and_send_reminders() == 0
+            finally:
+                event.remove(db.engine, "before_cursor_execute", listener)
+            assert len(statements) == 3  # the NULL-instant check + one range query per reminder window
+            assert EmailOutbox.query.count() == 2
+    print("✅ Reruns send nothing twice")
+
+
+def test_confirmation_once_per_signup():
+    """The signup confirmation isn't repeated by the catch-up job; a new signup gets a new one."""
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config()):
+        with app.app_context():
+            chair = User(display_name="Sol", email="sol@ledger.test", password_hash="x")
+            meeting = _meeting_starting_in(timedelta(days=3), "Later This Week")
+            other = _meeting_starting_in(timedelta(days=4), "Missed Confirmation")
+            db.session.add_all([chair, meeting, other])
+            _chair(meeting, chair)
+            _chair(other, chair)
+            db.session.commit()
+
+            signup = ChairSignup.query.filter_by(meeting_id=meeting.id).one()
+            assert send_chair_confirmation(signup)
+            assert not send_chair_confirmation(signup)
+            assert send_meeting_confirmations() == 1  # only the one never confirmed
+            assert send_meeting_confirmations() == 0
+
+            # Cancel and sign up again: a fresh confirmation is due
+            db.session.delete(signup)
+            db.session.commit()
+            _chair(meeting, chair)
+            db.session.commit()
+            assert send_meeting_confirmations() == 1
+            assert EmailOutbox.query.filter(EmailOutbox.subject.like("Confirmed:%")).count() == 3
+
+
+def test_failed_inline_send_is_retried():
+    """Without the outbox, a send that fails leaves no ledger row so the next run retries."""
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), EMAIL_OUTBOX_ENABLED=False):
+        with app.app_context():
+            chair = User(display_name="Ty", email="ty@ledger.test", password_hash="x")
+            meeting = _meeting_starting_in(timedelta(hours=22), "Flaky")
+            db.session.add_all([chair, meeting])
+            _chair(meeting, chair)
+            db.session.commit()
+
+            server.fail_next = 1
+            assert check_and_send_reminders() == 0
+            assert NotificationLedger.query.count() == 0
+            assert check_and_send_reminders() == 1
+            assert len(server.messages) == 1
+            assert not send_notification_once("reminder_24h", meeting.id, chair, "Dup", "Body")
+
+
+if __name__ == "__main__":
+    test_start_instant_follows_eastern_wall_clock()
+    test_reminders_are_sent_once()
+    test_confirmation_once_per_signup()
+    test_failed_inline_send_is_retried()
+    print("\n🎉 All notification ledger tests passed!")
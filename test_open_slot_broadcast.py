@@ -0,0 +1,123 @@
+"""
+Test the weekly open-slot broadcast: per-recipient eligibility, chunked queueing and run metrics
+"""
+
+import os
+import sys
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import (app, db, BroadcastRun, ChairSignup, EmailOutbox, Meeting, User,
+                 drain_email_outbox, send_open_slot_reminder)
+from debug_smtp import DebugSMTPServer
+from test_email_outbox import mail_pointed_at
+
+
+def _setup():
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        tomorrow = date.today() + timedelta(days=1)
+        db.session.add_all([
+            Meeting(title="Coed Open", event_date=tomorrow, start_time=time(9, 0)),
+            Meeting(title="Men Open", event_date=tomorrow, start_time=time(12, 0), gender_restriction="men"),
+            Meeting(title="Women Open", event_date=tomorrow, start_time=time(18, 0), gender_restriction="female"),
+            Meeting(title="Next Month", event_date=tomorrow + timedelta(days=30), start_time=time(9, 0)),
+            Meeting(title="Closed", event_date=tomorrow, start_time=time(20, 0), is_open=False),
+        ])
+        chaired = Meeting(title="Chaired", event_date=tomorrow, start_time=time(21, 0))
+        db.session.add(chaired)
+        users = [
+            User(display_name="Al", email="al@slots.test", password_hash="x", gender="male"),
+            User(display_name="Bea", email="bea@slots.test", password_hash="x", gender="female"),
+            User(display_name="Cam", email="cam@slots.test", password_hash="x"),
+            User(display_name="Dee", email="dee@slots.test", password_hash="x", gender="female"),
+            User(display_name="Boss", email="boss@slots.test", password_hash="x", is_admin=True),
+        ]
+        db.session.add_all(users)
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=chaired.id, user_id=users[0].id, display_name_snapshot="Al"))
+        db.session.commit()
+
+
+def test_recipients_only_get_meetings_they_may_chair():
+    """Coed slots go to everyone; restricted slots only to the matching gender."""
+    print("\n🧪 Testing open-slot eligibility...")
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config()):
+        with app.app_context():
+            run = send_open_slot_reminder()
+            assert (run.meetings, run.recipients, run.sent, run.failed, run.skipped) == (3, 4, 4, 0, 0)
+            assert BroadcastRun.query.count() == 1
+
+            bodies = {row.recipient: row.body for row in EmailOutbox.query}
+            assert set(bodies) == {"al@slots.test", "bea@slots.test", "cam@slots.test", "dee@slots.test"}
+            assert bodies["al@slots.test"].startswith("Dear Al,")
+            assert "Men Open" in bodies["al@slots.test"] and "Women Open" not in bodies["al@slots.test"]
+            assert "Women Open" in bodies["bea@slots.test"] and "Men Open" not in bodies["bea@slots.test"]
+            assert "Coed Open" in bodies["cam@slots.test"]
+            assert "Men Open" not in bodies["cam@slots.test"] and "Women Open" not in bodies["cam@slots.test"]
+            for body in bodies.values():
+                assert "Next Month" not in body and "Closed" not in body and "Chaired" not in body
+
+            assert drain_email_outbox()["sent"] == 4
+            assert server.connections == 1
+    print("✅ Each chair sees only their eligible slots")
+
+
+def test_chunks_are_queued_in_one_transaction_each():
+    """Recipients are read and queued a chunk at a time; users with nothing eligible are skipped."""
+    _setup()
+    with app.app_context():
+        db.session.query(Meeting).filter(Meeting.title == "Coed Open").delete()
+        db.session.commit()
+
+    commits = []
+    listener = lambda session: commits.append(1)
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), BROADCAST_CHUNK_SIZE=2):
+        with app.app_context():
+            event.listen(db.session, "after_commit", listener)
+            try:
+                run = send_open_slot_reminder()
+            finally:
+                event.remove(db.session, "after_commit", listener)
+            # Cam has no gender, so neither restricted meeting applies
+            assert (run.recipients, run.sent, run.skipped) == (4, 3, 1)
+            assert len(commits) == 3  # two chunks + the run record
+            assert sorted(r.recipient for r in EmailOutbox.query) == ["al@slots.test", "bea@slots.test", "dee@slots.test"]
+
+
+def test_inline_broadcast_shares_one_session():
+    """With the outbox off the whole run goes over one SMTP connection."""
+    _setup()
+    with DebugSMTPServer() as server, mail_pointed_at(server.mail_config(), EMAIL_OUTBOX_ENABLED=False,
+                                                       BROADCAST_CHUNK_SIZE=2):
+        with app.app_context():
+            server.refuse.add("bea@slots.test")
+            run = send_open_slot_reminder()
+            assert (run.sent, run.failed) == (3, 1)
+            assert server.connections == 1 and len(server.messages) == 3
+            assert EmailOutbox.query.count() == 0
+
+
+def test_nothing_sent_without_mail_or_open_slots():
+    _setup()
+    with app.app_context():
+        assert send_open_slot_reminder() is None  # TESTING: mail not configured
+        assert EmailOutbox.query.count() == 0 and BroadcastRun.query.count() == 0
+
+
+if __name__ == "__main__":
+    test_recipients_only_get_meetings_they_may_chair()
+    test_chunks_are_queued_in_one_transaction_each()
+    test_inline_broadcast_shares_one_session()
+    test_nothing_sent_without_mail_or_open_slots()
+    print("\n🎉 All open-slot broadcast tests passed!")
@@ -0,0 +1,212 @@
+"""
+Test the rate limiter service and the throttled endpoints
+"""
+
+import os
+import sys
+from datetime import date, time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from rate_limiter import MemoryBackend, RateLimiter, parse_limit
+from app import app, db, Meeting, User, rate_limiter, check_rate_limit
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class BrokenBackend:
+    def sliding_window(self, key, limit):
+        raise ConnectionError("redis down")
+
+
+def _limits_on(**limits):
+    """Enable limits for a test (they are off while TESTING)."""
+    limits['AUDIT_LOG_ASYNC'] = False  # keep audit rows on this thread's SQLite connection
+    saved = {k: app.config.get(k) for k in limits}
+    app.config.update(limits)
+    app.config['TESTING'] = False
+    rate_limiter.reset()
+    return saved
+
+
+def _limits_off(saved):
+    app.config.update(saved)
+    app.config['TESTING'] = True
+    rate_limiter.reset()
+
+
+def test_algorithms():
+    """Sliding window and token bucket allow N hits, then report a Retry-After."""
+    print("\n🧪 Testing rate limit algorithms...")
+    clock = FakeClock()
+    limiter = RateLimiter(MemoryBackend(clock=clock))
+    limit = parse_limit("3/minute")
+
+    results = [limiter.hit("t", "k", limit) for _ in range(4)]
+    assert [ok for ok, _ in results] == [True, True, True, False]
+    assert 1 <= results[-1][1] <= 60
+    assert limiter.hit("t", "other", limit)[0]  # keys are independent
+    clock.now += 120
+    assert limiter.hit("t", "k", limit)[0]
+
+    results = [limiter.hit("b", "k", "2/10", algorithm="token_bucket") for _ in range(3)]
+    assert [ok for ok, _ in results] == [True, True, False]
+    assert results[-1][1] == 5
+    clock.now += 5
+    assert limiter.hit("b", "k", "2/10", algorithm="token_bucket")[0]
+
+    assert parse_limit("10/15 minutes").period == 900
+    assert parse_limit("off") is None
+
+    try:
+        RateLimiter(MemoryBackend(), algorithm="sliding-window")
+    except ValueError as e:
+        assert "sliding-window" in str(e)
+    else:
+        raise AssertionError("unknown algorithm accepted")
+    print("✅ Algorithms enforce limits")
+
+
+def test_backend_failure_falls_back_to_memory():
+    """A failing shared backend degrades to in-process limits instead of erroring."""
+    limiter = RateLimiter(BrokenBackend())
+    assert [limiter.hit("t", "k", "1/minute")[0] for _ in range(2)] == [True, False]
+    assert limiter.backend_errors == 2
+
+
+def test_login_throttled_before_password_check():
+    """Login by email is throttled with a 429 and Retry-After, without querying users."""
+    print("\n🧪 Testing login throttling...")
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        if not User.query.filter_by(email="limit.user@example.com").first():
+            user = User(display_name="Limit User", email="limit.user@example.com")
+            user.set_password("correct-horse-battery")
+            db.session.add(user)
+            db.session.commit()
+    client = app.test_client()
+    saved = _limits_on(RATELIMIT_LOGIN_PER_EMAIL="2/minute", RATELIMIT_LOGIN_PER_IP="100/minute")
+    try:
+        for _ in range(2):
+            resp = client.post('/login', data={'email': 'limit.user@example.com', 'password': 'wrong'})
+            assert resp.status_code == 200
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", count)
+            try:
+                resp = client.post('/login', data={'email': 'Limit.User@example.com', 'password': 'wrong'})
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count)
+        assert resp.status_code == 429
+        assert int(resp.headers['Retry-After']) > 0
+        assert not any('users' in s for s in statements), statements
+    finally:
+        _limits_off(saved)
+    print("✅ Login throttled")
+
+
+def test_public_api_and_key_checks():
+    """Public JSON APIs return 429; registration key check keeps its 200 contract."""
+    print("\n🧪 Testing API throttling...")
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    saved = _limits_on(RATELIMIT_PUBLIC_API="2/minute", RATELIMIT_KEY_CHECKS="1/minute")
+    try:
+        codes = [client.get('/api/week-meetings?start=2030-01-01&end=2030-01-07').status_code for _ in range(3)]
+        assert codes == [200, 200, 429]
+        # A different client IP has its own budget
+        resp = client.get('/api/week-meetings?start=2030-01-01&end=2030-01-07',
+                          headers={'X-Forwarded-For': '203.0.113.9'})
+        assert resp.status_code == 200
+
+        client.post('/api/registration/validate-key', json={'key': 'x'})
+        resp = client.post('/api/registration/validate-key', json={'key': 'x'})
+        assert resp.status_code == 200
+        assert resp.get_json() == {"ok": False, "reason": "rate_limited"}
+        assert 'Retry-After' in resp.headers
+
+        client.post('/api/sponsor/validate-key', json={'key': 'x'})
+        resp = client.post('/api/sponsor/validate-key', json={'key': 'x'})
+        assert resp.status_code == 429
+    finally:
+        _limits_off(saved)
+    print("✅ APIs throttled")
+
+
+def test_check_rate_limit_skips_database():
+    """check_rate_limit no longer counts audit_logs rows."""
+    saved = _limits_on()
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    try:
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", count)
+            try:
+                results = [check_rate_limit('bulk_delete', 42, 3) for _ in range(4)]
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count)
+    finally:
+        _limits_off(saved)
+    assert results[:3] == [0, 0, 0] and results[3] > 0
+    assert statements == []
+
+
+def test_admin_actions_send_retry_after():
+    """Throttled bulk deletes and backups answer 429 with a Retry-After header."""
+    saved = _limits_on()
+    try:
+        with app.app_context():
+            db.create_all()
+            User.query.filter_by(email="limit.admin@example.com").delete()
+            admin = User(display_name="Limit Admin", email="limit.admin@example.com", password_hash="x", is_admin=True)
+            meeting = Meeting(title="Keep Me", event_date=date(2026, 5, 1), start_time=time(9, 0))
+            db.session.add_all([admin, meeting])
+            db.session.commit()
+            admin_id, meeting_id = admin.id, meeting.id
+            for _ in range(3):
+                check_rate_limit('bulk_delete', admin_id, 3)
+            for _ in range(5):
+                check_rate_limit('manual_backup', admin_id, 5)
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = admin_id
+        for url, body in (('/admin/meetings/bulk-delete', {'meeting_ids': [meeting_id]}), ('/admin/security/backup', None)):
+            resp = client.post(url, json=body)
+            assert resp.status_code == 429, (url, resp.status_code)
+            assert int(resp.headers['Retry-After']) > 0
+            assert resp.get_json()['message'].startswith("Too many")
+        with app.app_context():
+            assert db.session.get(Meeting, meeting_id) is not None
+    finally:
+        _limits_off(saved)
+
+
+if __name__ == "__main__":
+    test_algorithms()
+    test_backend_failure_falls_back_to_memory()
+    test_login_throttled_before_password_check()
+    test_public_api_and_key_checks()
+    test_check_rate_limit_skips_database()
+    test_admin_actions_send_retry_after()
+    print("\n🎉 All rate limiter tests passed!")
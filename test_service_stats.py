@@ -0,0 +1,153 @@
+"""
+Test the materialized user_service_stats table and the reports that read it
+"""
+
+import os
+import sys
+from datetime import time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from sqlalchemy import event
+
+from app import (
+    app, db, cache, User, Meeting, ChairSignup, UserServiceStat,
+    get_eastern_today, rebuild_user_service_stats, ensure_user_service_stats_current,
+)
+
+
+def _stats():
+    return {
+        r.user_id: (r.past_chaired, r.future_chaired, r.first_chaired_on, r.last_chaired_on, r.last_30d)
+        for r in UserServiceStat.query.all()
+    }
+
+
+def _setup(extra_chairs=0):
+    app.config['TESTING'] = True
+    today = get_eastern_today()
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        UserServiceStat.query.delete()
+        User.query.filter(User.email.like('%@service.test')).delete(synchronize_session=False)
+        db.session.commit()
+        ann = User(display_name="Ann", email="ann@service.test", password_hash="x", chair_points=3)
+        ben = User(display_name="Ben", email="ben@service.test", password_hash="x")
+        admin = User(display_name="Boss", email="boss@service.test", password_hash="x", is_admin=True)
+        db.session.add_all([ann, ben, admin])
+        db.session.flush()
+        for days in (-40, -10, -3, 0, 5):
+            m = Meeting(title=f"M{days}", event_date=today + timedelta(days=days), start_time=time(12, 0))
+            db.session.add(m)
+            db.session.flush()
+            db.session.add(ChairSignup(meeting_id=m.id, user_id=ann.id, display_name_snapshot="Ann"))
+        for i in range(extra_chairs):
+            u = User(display_name=f"Extra {i}", email=f"extra{i}@service.test", password_hash="x")
+            m = Meeting(title=f"X{i}", event_date=today + timedelta(days=i % 7 - 3), start_time=time(9, 0))
+            db.session.add_all([u, m])
+            db.session.flush()
+            db.session.add(ChairSignup(meeting_id=m.id, user_id=u.id, display_name_snapshot=u.display_name))
+        db.session.commit()
+        return today, ann.id, ben.id, admin.id
+
+
+def test_stats_follow_signup_changes():
+    """Rows are rewritten in the same transaction as signup changes."""
+    print("\n🧪 Testing user_service_stats maintenance...")
+    today, ann, ben, _ = _setup()
+    with app.app_context():
+        assert _stats() == {ann: (3, 2, today - timedelta(days=40), today - timedelta(days=3), 2)}
+
+        # Reassign today's meeting to Ben: both users are recounted
+        signup = ChairSignup.query.join(Meeting).filter(Meeting.event_date == today).one()
+        signup.user_id = ben
+        signup.display_name_snapshot = "Ben"
+        db.session.commit()
+        assert _stats()[ann][:2] == (3, 1)
+        assert _stats()[ben] == (0, 1, None, None, 0)
+
+        # Move Ann's future meeting into the past
+        meeting = Meeting.query.filter_by(title="M5").one()
+        meeting.event_date = today - timedelta(days=1)
+        db.session.commit()
+        assert _stats()[ann] == (4, 0, today - timedelta(days=40), today - timedelta(days=1), 3)
+
+        # Cancel, and bulk delete
+        db.session.delete(ChairSignup.query.filter_by(user_id=ben).one())
+        db.session.commit()
+        assert ben not in _stats()
+        ChairSignup.query.filter(ChairSignup.user_id == ann).delete()
+        db.session.commit()
+        assert _stats() == {}
+
+        # Rolled back changes are not applied
+        m = Meeting.query.first()
+        db.session.add(ChairSignup(meeting_id=m.id, user_id=ben, display_name_snapshot="Ben"))
+        db.session.flush()
+        db.session.rollback()
+        assert _stats() == {}
+    print("✅ Stats follow signup changes")
+
+
+def test_rebuild_and_day_rollover():
+    """The bulk rebuild matches the incremental rows; stale rows roll forward."""
+    today, ann, _, _ = _setup()
+    with app.app_context():
+        incremental = _stats()
+        assert rebuild_user_service_stats() == 1
+        assert _stats() == incremental
+
+        # Computed four days ago: the meeting three days ago was still "future" then
+        rebuild_user_service_stats(today - timedelta(days=4))
+        assert _stats()[ann][:2] == (2, 3)
+        cache.delete("user_service_stats_as_of")
+        assert ensure_user_service_stats_current() == today
+        assert _stats() == incremental
+
+
+def test_reports_read_one_row_per_user():
+    """Monthly, all-users and leaderboard reports render without per-user queries."""
+    print("\n🧪 Testing reports...")
+    _, ann, _, admin = _setup(extra_chairs=12)
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            monthly = client.get('/admin/reports/monthly')
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+    assert monthly.status_code == 200
+    html = monthly.get_data(as_text=True)
+    assert "Ann" in html and "M5" in html and "Extra 11" in html
+    assert len([s for s in statements if "chair_signups" in s]) <= 2, statements
+
+    resp = client.get('/admin/reports/all-users')
+    assert resp.status_code == 200
+    assert '"display_name": "Ann"' in resp.get_data(as_text=True)
+    csv_body = client.get('/admin/reports/all-users?format=csv').get_data(as_text=True)
+    assert f"BP-{1000 + ann},Ann,ann@service.test,3,5," in csv_body
+
+    resp = client.get('/admin/reports/chairpoints-leaderboard?format=csv')
+    assert f"1,BP-{1000 + ann},Ann,ann@service.test,3,5" in resp.get_data(as_text=True)
+    print("✅ Reports render from user_service_stats")
+
+
+if __name__ == "__main__":
+    test_stats_follow_signup_changes()
+    test_rebuild_and_day_rollover()
+    test_reports_read_one_row_per_user()
+    print("\n🎉 All service stats tests passed!")
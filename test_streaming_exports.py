@@ -0,0 +1,83 @@
+"""
+Test streaming ICS / CSV exports
+"""
+
+import csv
+import os
+import sys
+from datetime import date, time, timedelta
+from io import StringIO
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from icalendar import Calendar
+
+from app import app, db, User, Meeting, ChairSignup, invalidate_meeting_caches
+
+MEETING_COUNT = 1203  # spans several stream batches
+
+
+def _setup():
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        ChairSignup.query.delete()
+        Meeting.query.delete()
+        User.query.filter_by(email="stream.admin@example.com").delete()
+        admin = User(display_name="Stream Admin", email="stream.admin@example.com", password_hash="x", is_admin=True)
+        db.session.add(admin)
+        start = date.today() + timedelta(days=1)
+        meetings = [
+            Meeting(title=f"Stream Meeting {i}", event_date=start + timedelta(days=i // 3), start_time=time(8 + i % 3, 0), is_open=True)
+            for i in range(MEETING_COUNT)
+        ]
+        db.session.add_all(meetings)
+        db.session.flush()
+        db.session.add(ChairSignup(meeting_id=meetings[0].id, user_id=admin.id, display_name_snapshot="Stream Admin"))
+        db.session.commit()
+        invalidate_meeting_caches()
+        return admin.id
+
+
+def test_calendar_ics_is_streamed():
+    """/calendar.ics streams every upcoming meeting in chunks."""
+    print("\n🧪 Testing streamed calendar.ics...")
+    _setup()
+    client = app.test_client()
+    resp = client.get('/calendar.ics')
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    assert resp.headers.get('ETag')
+    cal = Calendar.from_ical(resp.data)
+    assert len(cal.walk("VEVENT")) == MEETING_COUNT
+    print(f"✅ Streamed {MEETING_COUNT} events")
+
+
+def test_chair_schedule_csv_is_streamed():
+    """Chair schedule CSV streams from a projection query."""
+    print("\n🧪 Testing streamed chair schedule CSV...")
+    admin_id = _setup()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    resp = client.get('/admin/reports/chair-schedule?format=csv')
+    assert resp.status_code == 200
+    assert resp.is_streamed
+    rows = list(csv.DictReader(StringIO(resp.get_data(as_text=True))))
+    assert len(rows) == MEETING_COUNT
+    chaired = [r for r in rows if r["chair_name"]]
+    assert len(chaired) == 1
+    assert chaired[0]["bp_id"] == f"BP-{1000 + admin_id}"
+    assert chaired[0]["is_open"] == "False"
+    print(f"✅ Streamed {len(rows)} CSV rows")
+
+
+if __name__ == "__main__":
+    test_calendar_ics_is_streamed()
+    test_chair_schedule_csv_is_streamed()
+    print("\n🎉 All streaming export tests passed!")
@@ -0,0 +1,218 @@
+"""
+Test the two-tier cache: local LRU over a shared tier, single-flight builds and early refresh
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ['TESTING'] = 'True'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from flask_caching.backends.simplecache import SimpleCache
+
+from tiered_cache import LOCK_PREFIX, CacheEntry, TieredCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BrokenRemote:
+    def __getattr__(self, name):
+        def fail(*args):
+            raise ConnectionError("redis is down")
+        return fail
+
+
+def test_local_tier_over_shared_tier():
+    """Workers share values through the remote tier and reuse them locally for local_ttl."""
+    print("\n🧪 Testing tiered cache reads...")
+    shared, clock = SimpleCache(), Clock()
+    worker_a = TieredCache(remote=shared, local_ttl=5, clock=clock)
+    worker_b = TieredCache(remote=shared, local_ttl=5, clock=clock)
+
+    worker_a.set("k", "v1", timeout=60)
+    assert worker_b.get("k") == "v1" and worker_b.get("k") == "v1"
+    assert worker_b.stats()["remote_hits"] == 1 and worker_b.stats()["local_hits"] == 1
+
+    # B keeps its local copy until local_ttl, then sees A's replacement
+    worker_a.set("k", "v2", timeout=60)
+    assert worker_b.get("k") == "v1"
+    clock.now += 6
+    assert worker_b.get("k") == "v2"
+
+    worker_a.delete("k")
+    assert worker_a.get("k") is None and worker_a.stats()["misses"] == 1
+    # Bare values written by the old RedisCache backend are still readable
+    shared.set("legacy", [1, 2])
+    assert worker_a.get("legacy") == [1, 2]
+    print("✅ Local LRU in front of the shared tier")
+
+
+def test_lru_is_bounded():
+    cache = TieredCache(max_entries=3)
+    for i in range(5):
+        cache.set(f"k{i}", i, timeout=60)
+    assert len(cache.local) == 3 and cache.get("k0") is None and cache.get("k4") == 4
+
+
+def test_single_flight_in_process():
+    """Concurrent misses on one key build the value once."""
+    print("\n🧪 Testing single-flight builds...")
+    cache = TieredCache(remote=SimpleCache())
+    builds = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.2)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("hot", build, 60)))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["value"] * 8 and len(builds) == 1
+    assert cache.stats()["builds"] == 1
+    print("✅ One build for eight concurrent misses")
+
+
+def test_single_flight_across_workers():
+    """A worker that finds another worker's build lock waits for its result."""
+    shared = SimpleCache()
+    worker_a = TieredCache(remote=shared)
+    worker_b = TieredCache(remote=shared, lock_wait=5)
+    shared.add(LOCK_PREFIX + "report", "a-token", 30)
+
+    def finish_build():
+        time.sleep(0.2)
+        worker_a.set("report", "built by a", timeout=60)
+
+    threading.Thread(target=finish_build).start()
+    assert worker_b.get_or_compute("report", lambda: "built by b", 60) == "built by a"
+    assert worker_b.stats()["lock_waits"] == 1 and worker_b.stats()["builds"] == 0
+
+    # A builder that never finishes only delays the others by lock_wait
+    worker_c = TieredCache(remote=shared, lock_wait=0.1)
+    shared.add(LOCK_PREFIX + "stuck", "gone", 30)
+    assert worker_c.get_or_compute("stuck", lambda: "built by c", 60) == "built by c"
+
+
+class ScriptedRedis:
+    """Just enough of a redis client for RedisCache and the lock-release script."""
+
+    def __init__(self):
+        self.data = {}
+
+    def setnx(self, name, value):
+        return self.data.setdefault(name, value) is value
+
+    def expire(self, name, time):
+        return True
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def delete(self, *names):
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    def register_script(self, source):
+        assert "redis.call('get', KEYS[1]) == ARGV[1]" in source
+
+        def compare_and_delete(keys, args):
+            return self.delete(keys[0]) if self.data.get(keys[0]) == args[0] else 0
+        return compare_and_delete
+
+
+def test_release_only_drops_own_lock():
+    """A build that outlived its lock must not release the lock another worker took over."""
+    from flask_caching.backends.rediscache import RedisCache
+
+    for shared in (SimpleCache(), RedisCache(host=ScriptedRedis(), key_prefix="bp:")):
+        worker_a = TieredCache(remote=shared)
+        worker_b = TieredCache(remote=shared)
+        token_a = worker_a._acquire("slow")
+        assert token_a and not worker_b._acquire("slow")
+
+        shared.delete(LOCK_PREFIX + "slow")  # lock_timeout passed while a was still building
+        token_b = worker_b._acquire("slow")
+        assert token_b
+        assert worker_a._release("slow", token_a) is False
+        assert shared.get(LOCK_PREFIX + "slow") == token_b
+        assert worker_b._release("slow", token_b) is True
+        assert shared.get(LOCK_PREFIX + "slow") is None
+
+
+def test_probabilistic_early_refresh():
+    """Entries close to expiry are rebuilt early by one reader; far from it, never."""
+    clock = Clock()
+    cache = TieredCache(early_refresh_beta=1.0, clock=clock)
+    cache.local.set("slow", CacheEntry("old", delta=10.0, expires_at=clock.now + 3600), clock.now + 3600)
+    assert all(cache.get_or_compute("slow", lambda: "new", 60) == "old" for _ in range(50))
+
+    cache.local.set("slow", CacheEntry("old", delta=10.0, expires_at=clock.now), clock.now + 3600)
+    assert cache.get_or_compute("slow", lambda: "new", 60) == "new"
+    assert cache.stats()["early_refreshes"] == 1
+
+    disabled = TieredCache(early_refresh_beta=0, clock=clock)
+    disabled.local.set("slow", CacheEntry("old", delta=10.0, expires_at=clock.now), clock.now + 3600)
+    assert disabled.get_or_compute("slow", lambda: "new", 60) == "old"
+
+
+def test_remote_errors_degrade_to_local():
+    cache = TieredCache(remote=BrokenRemote())
+    assert cache.get("k") is None
+    cache.set("k", "v", timeout=60)
+    assert cache.get("k") == "v"
+    assert cache.get_or_compute("x", lambda: 42, 60) == 42
+    assert cache.stats()["remote_errors"] >= 3
+
+
+def test_app_uses_tiered_cache():
+    """The app's cache, memoize and cached_value all go through the tiered backend."""
+    print("\n🧪 Testing app cache wiring...")
+    from app import app, cache, cached_value, db, User
+
+    backend = cache.cache
+    assert isinstance(backend, TieredCache)
+    builds = []
+    with app.app_context():
+        db.create_all()
+        for _ in range(3):
+            cached_value(("meetings",), "tiered_wiring", lambda: builds.append(1) or "ok", timeout=60)
+        assert builds == [1]
+
+        User.query.filter_by(email="admin@tiered.test").delete()
+        admin = User(display_name="Diag", email="admin@tiered.test", password_hash="x", is_admin=True)
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = admin_id
+    html = client.get('/admin/diagnostics').get_data(as_text=True)
+    assert "Hit ratio" in html
+    print("✅ App cache is tiered")
+
+
+if __name__ == "__main__":
+    test_local_tier_over_shared_tier()
+    test_lru_is_bounded()
+    test_single_flight_in_process()
+    test_single_flight_across_workers()
+    test_release_only_drops_own_lock()
+    test_probabilistic_early_refresh()
+    test_remote_errors_degrade_to_local()
+    test_app_uses_tiered_cache()
+    print("\n🎉 All tiered cache tests passed!")
@@ -0,0 +1,340 @@
+"""
+Two-tier Flask-Caching backend: a bounded in-process LRU in front of Redis.
+
+SimpleCache gave every gunicorn worker its own cold cache, and RedisCache
+paid a network round trip for every small lookup (the meeting type list,
+user-scoped entries). TieredCache serves repeated reads from a per-process
+LRU and falls through to Redis on a miss. It writes through to both tiers.
+Without a Redis URL it runs on the LRU alone.
+
+Local entries live at most ``local_ttl`` seconds. That bounds how long one
+worker can keep serving a value another worker has replaced or deleted.
+cached_value() keys are versioned by generations read from the database,
+so a bumped namespace is never served stale from this tier.
+
+get_or_compute() adds what get()/set() can't express:
+
+* Single flight. One thread per process builds a missing value, and across
+  workers the first one to add() a short-lived lock key in Redis builds it.
+  The others wait up to ``lock_wait`` seconds for the result, then build it
+  themselves.
+* Probabilistic early refresh ("XFetch"). Each entry remembers how long it
+  took to build. As expiry approaches, a reader is increasingly likely to
+  rebuild it early while everyone else keeps reading the current value. Hot
+  keys are then refreshed by one caller before they expire instead of by
+  every caller after. ``early_refresh_beta`` scales how early; 0 disables it.
+
+stats() returns hit/miss counters for both tiers.
+"""
+
+from collections import OrderedDict
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+
+from flask_caching.backends.base import BaseCache
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "lock:"
+_LOCK_STRIPES = 64
+
+# Delete a build lock only while it still holds our token: a build that outlived
+# lock_timeout must not remove the lock another worker has taken since.
+_RELEASE_LOCK_LUA = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class CacheEntry:
+    """A cached value with its build time (``delta``) and absolute expiry (None = never)."""
+
+    __slots__ = ("value", "delta", "expires_at")
+
+    def __init__(self, value, delta=0.0, expires_at=None):
+        self.value = value
+        self.delta = delta
+        self.expires_at = expires_at
+
+    def __getstate__(self):
+        return (self.value, self.delta, self.expires_at)
+
+    def __setstate__(self, state):
+        self.value, self.delta, self.expires_at = state
+
+
+class LocalLRU:
+    """Thread-safe bounded LRU of CacheEntry objects with per-entry deadlines."""
+
+    def __init__(self, max_entries=2000, clock=time.time):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            entry, deadline = item
+            if deadline is not None and deadline <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, deadline):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (entry, deadline)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TieredCache(BaseCache):
+    """In-process LRU in front of an optional shared ``remote`` cache (Redis in production)."""
+
+    def __init__(self, remote=None, max_entries=2000, local_ttl=5, default_timeout=300,
+                 lock_timeout=30, lock_wait=5, early_refresh_beta=1.0, clock=time.time):
+        super().__init__(default_timeout=default_timeout)
+        self.remote = remote
+        self.local = LocalLRU(max_entries, clock=clock)
+        self.local_ttl = local_ttl
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
+        self.early_refresh_beta = early_refresh_beta
+        self.clock = clock
+        self._stripes = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._stats_lock = threading.Lock()
+        self._release_script = None
+        self._stats = dict.fromkeys(
+            ("local_hits", "remote_hits", "misses", "builds", "early_refreshes", "lock_waits", "remote_errors"), 0
+        )
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        remote = None
+        if config.get("CACHE_REDIS_URL"):
+            from flask_caching.backends.rediscache import RedisCache
+            remote = RedisCache.factory(app, config, [], {"default_timeout": kwargs.get("default_timeout", 300)})
+        kwargs.update(
+            remote=remote,
+            max_entries=config.get("CACHE_LOCAL_MAX_ENTRIES", 2000),
+            local_ttl=config.get("CACHE_LOCAL_TTL", 5),
+            lock_timeout=config.get("CACHE_LOCK_TIMEOUT", 30),
+            lock_wait=config.get("CACHE_LOCK_WAIT", 5),
+            early_refresh_beta=config.get("CACHE_EARLY_REFRESH_BETA", 1.0),
+        )
+        return cls(*args, **kwargs)
+
+    # ----- internals -----
+
+    def _count(self, name, n=1):
+        with self._stats_lock:
+            self._stats[name] += n
+
+    def _remote_call(self, method, *args, default=None):
+        """Call the remote tier; errors degrade to local-only behaviour instead of raising."""
+        if self.remote is None:
+            return default
+        try:
+            return getattr(self.remote, method)(*args)
+        except Exception as e:
+            self._count("remote_errors")
+            logger.warning(f"Remote cache {method} failed: {e}")
+            return default
+
+    def _local_deadline(self, entry):
+        if self.remote is None:
+            return entry.expires_at
+        deadline = self.clock() + self.local_ttl
+        return deadline if entry.expires_at is None else min(deadline, entry.expires_at)
+
+    def _lookup(self, key, count=True):
+        """Return the CacheEntry for ``key`` from the nearest tier, or None."""
+        entry = self.local.get(key)
+        if entry is not None:
+            if count:
+                self._count("local_hits")
+            return entry
+        raw = self._remote_call("get", key)
+        if raw is None:
+            if count:
+                self._count("misses")
+            return None
+        # Values written before the tiered cache existed are stored bare
+        entry = raw if isinstance(raw, CacheEntry) else CacheEntry(raw)
+        self.local.set(key, entry, self._local_deadline(entry))
+        if count:
+            self._count("remote_hits")
+        return entry
+
+    def _store(self, key, value, timeout, delta=0.0):
+        timeout = self._normalize_timeout(timeout)
+        entry = CacheEntry(value, delta, self.clock() + timeout if timeout else None)
+        stored = self._remote_call("set", key, entry, timeout, default=True)
+        self.local.set(key, entry, self._local_deadline(entry))
+        return stored
+
+    def _should_refresh_early(self, entry):
+        if entry.expires_at is None or entry.delta <= 0 or self.early_refresh_beta <= 0:
+            return False
+        gap = -entry.delta * self.early_refresh_beta * math.log(1.0 - random.random())
+        return self.clock() + gap >= entry.expires_at
+
+    def _build(self, key, build, timeout):
+        started = time.perf_counter()
+        value = build()
+        self._count("builds")
+        if value is not None:
+            self._store(key, value, timeout, delta=time.perf_counter() - started)
+        return value
+
+    def _acquire(self, key):
+        """Take the cross-worker build lock for ``key``; returns a token or None."""
+        if self.remote is None:
+            return True
+        token = uuid.uuid4().hex
+        if self._remote_call("add", LOCK_PREFIX + key, token, self.lock_timeout, default=True):
+            return token
+        return None
+
+    def _release(self, key, token):
+        """Drop the build lock for ``key`` if it is still ours; returns True when deleted."""
+        if self.remote is None or not token:
+            return False
+        lock_key = LOCK_PREFIX + key
+        client = getattr(self.remote, "_write_client", None)
+        if client is not None and hasattr(client, "register_script"):
+            try:
+                if self._release_script is None:
+                    self._release_script = client.register_script(_RELEASE_LOCK_LUA)
+                return bool(self._release_script(
+                    keys=[self.remote.key_prefix + lock_key], args=[self.remote.serializer.dumps(token)]
+                ))
+            except Exception as e:
+                self._count("remote_errors")
+                logger.warning(f"Remote cache lock release failed: {e}")
+                return False
+        # Backends without scripting: compare, then delete (not atomic, but only
+        # a lock that expires in between can still be lost)
+        if self._remote_call("get", lock_key) != token:
+            return False
+        return bool(self._remote_call("delete", lock_key))
+
+    # ----- BaseCache API -----
+
+    def get(self, key):
+        entry = self._lookup(key)
+        return None if entry is None else entry.value
+
+    def set(self, key, value, timeout=None):
+        return self._store(key, value, timeout)
+
+    def add(self, key, value, timeout=None):
+        if self.remote is None:
+            if self.local.get(key) is not None:
+                return False
+            return self._store(key, value, timeout)
+        timeout = self._normalize_timeout(timeout)
+        entry = CacheEntry(value, 0.0, self.clock() + timeout if timeout else None)
+        added = self._remote_call("add", key, entry, timeout, default=False)
+        if added:
+            self.local.set(key, entry, self._local_deadline(entry))
+        return added
+
+    def delete(self, key):
+        self.local.delete(key)
+        self._remote_call("delete", key)
+        return True
+
+    def delete_many(self, *keys):
+        for key in keys:
+            self.delete(key)
+        return list(keys)
+
+    def has(self, key):
+        return self._lookup(key, count=False) is not None
+
+    def clear(self):
+        self.local.clear()
+        self._remote_call("clear")
+        return True
+
+    # ----- single flight -----
+
+    def get_or_compute(self, key, build, timeout=None):
+        """Return the cached value for ``key``, building it with ``build()`` at most once at a time.
+
+        ``None`` results are returned but not cached.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            if not self._should_refresh_early(entry):
+                return entry.value
+            # Refresh ahead of expiry, unless another caller already is
+            stripe = self._stripes[hash(key) % _LOCK_STRIPES]
+            if not stripe.acquire(blocking=False):
+                return entry.value
+            try:
+                token = self._acquire(key)
+                if not token:
+                    return entry.value
+                self._count("early_refreshes")
+                try:
+                    value = self._build(key, build, timeout)
+                finally:
+                    self._release(key, token)
+            finally:
+                stripe.release()
+            return entry.value if value is None else value
+
+        with self._stripes[hash(key) % _LOCK_STRIPES]:
+            # Another thread of this process may have built it meanwhile
+            entry = self._lookup(key, count=False)
+            if entry is not None:
+                return entry.value
+            token = self._acquire(key)
+            if not token:
+                self._count("lock_waits")
+                deadline = time.monotonic() + self.lock_wait
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = self._lookup(key, count=False)
+                    if entry is not None:
+                        return entry.value
+                # The builder is slow or gone; build it here rather than fail
+            try:
+                return self._build(key, build, timeout)
+            finally:
+                self._release(key, token)
+
+    def stats(self):
+        """Hit/miss counters plus the current local tier size."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["local_hits"] + stats["remote_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["local_hits"] + stats["remote_hits"]) / lookups, 3) if lookups else None
+        stats["local_entries"] = len(self.local)
+        stats["remote"] = type(self.remote).__name__ if self.remote is not None else None
+        return stats
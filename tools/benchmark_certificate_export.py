@@ -0,0 +1,74 @@
+"""
+Benchmark certificate rendering for bulk exports: serial vs. the process pool.
+
+Renders a synthetic full-resolution template (letter landscape at 300dpi,
+with line art so ReportLab has real compression work to do) unless a
+template path is given.
+
+Usage:
+    python tools/benchmark_certificate_export.py                  # 24 certificates, 1/2/4 workers
+    python tools/benchmark_certificate_export.py 48 1,4,8         # custom count / worker counts
+    python tools/benchmark_certificate_export.py 24 1,4 path.png  # a real template
+"""
+import os
+import random
+import sys
+import tempfile
+import time as _time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from certificate_renderer import CertificateExportPool, CertificateRenderer  # noqa: E402
+
+
+def synthetic_template(path, size=(3300, 2550)):
+    rng = random.Random(7)
+    img = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(400):
+        xs = sorted(rng.sample(range(size[0]), 2))
+        ys = sorted(rng.sample(range(size[1]), 2))
+        draw.rectangle([xs[0], ys[0], xs[1], ys[1]], outline=(rng.randrange(256),) * 3, width=5)
+    img.save(path, "PNG")
+
+
+def run(template_path, count, workers):
+    pool = CertificateExportPool(CertificateRenderer(template_path), workers=workers)
+    jobs = [(i, f"Chairperson {i}", datetime(2030, 1, 1 + i % 28)) for i in range(count)]
+    try:
+        # Warm up: start the workers and decode the template in each of them
+        list(pool.render_many(jobs[:workers]))
+        started = _time.perf_counter()
+        rendered = sum(1 for _, pdf in pool.render_many(jobs) if pdf)
+        elapsed = _time.perf_counter() - started
+    finally:
+        pool.shutdown()
+    assert rendered == count
+    return elapsed
+
+
+def main(count, worker_counts, template_path=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        if template_path is None:
+            template_path = os.path.join(tmp, "template.png")
+            synthetic_template(template_path)
+        print(f"{count} certificates, {os.cpu_count()} CPUs")
+        print(f"{'workers':>7} | {'time':>8} | {'certs/s':>7} | {'speedup':>7}")
+        print("-" * 40)
+        baseline = None
+        for workers in worker_counts:
+            elapsed = run(template_path, count, workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>7} | {elapsed:>7.2f}s | {count / elapsed:>7.1f} | {baseline / elapsed:>6.1f}x")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if args else 24,
+        [int(w) for w in args[1].split(",")] if len(args) > 1 else [1, 2, 4],
+        args[2] if len(args) > 2 else None,
+    )
@@ -0,0 +1,136 @@
+"""
+Benchmark the admin dashboard statistics: the old per-figure/per-user COUNT
+queries vs. the dashboard_stats aggregate queries (over meetings and over the
+meeting_daily_stats rollup), plus a memoized hit.
+
+Seeds a throwaway SQLite database (in memory unless DATABASE_URL is set).
+
+Usage:
+    python tools/benchmark_dashboard_stats.py              # 5,000 users / 20,000 meetings
+    python tools/benchmark_dashboard_stats.py 1000 5000    # custom users / meetings
+"""
+import os
+import sys
+import time as _time
+from datetime import date, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('TESTING', 'True')
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from app import (  # noqa: E402
+    app, db, User, Meeting, ChairSignup, MeetingDailyStat, get_admin_dashboard_stats, rebuild_meeting_daily_stats,
+)
+from dashboard_stats import compute_admin_dashboard  # noqa: E402
+
+GENDERS = (None, None, 'male', 'female')
+
+
+def seed(user_count, meeting_count, today):
+    db.drop_all()
+    db.create_all()
+    db.session.execute(insert(User), [
+        {"id": i + 1, "display_name": f"Chair {i}", "email": f"chair{i}@bench.test",
+         "password_hash": "x", "is_admin": i < 5}
+        for i in range(user_count)
+    ])
+    # Spread meetings over the two years around today, ~2/3 of them chaired
+    first_day = today - timedelta(days=365)
+    db.session.execute(insert(Meeting), [
+        {"id": i + 1, "title": "Meeting", "event_date": first_day + timedelta(days=i * 730 // meeting_count),
+         "start_time": time(12 + i % 8, 0), "is_open": True, "gender_restriction": GENDERS[i % 4]}
+        for i in range(meeting_count)
+    ])
+    db.session.execute(insert(ChairSignup), [
+        {"meeting_id": i + 1, "user_id": (i * 7919) % user_count + 1, "display_name_snapshot": "Chair"}
+        for i in range(meeting_count) if i % 3
+    ])
+    db.session.commit()
+    # Core inserts bypass the ORM hooks that maintain the rollup
+    rebuild_meeting_daily_stats()
+
+
+def old_path(today):
+    """The previous dashboard() logic (gender values corrected so results compare)."""
+    def count(*criteria, chaired=False):
+        query = Meeting.query.filter(*criteria)
+        if chaired:
+            query = query.filter(Meeting.chair_signup.has())
+        return query.count()
+
+    def pct(part, whole):
+        return round((part / whole * 100) if whole > 0 else 0, 1)
+
+    total_hosts = User.query.filter_by(is_admin=False).count()
+    future = count(Meeting.event_date >= today)
+    current = count(Meeting.event_date >= today, chaired=True)
+    window = (Meeting.event_date >= today - timedelta(days=30), Meeting.event_date <= today)
+    coverage = {}
+    for key, gender in (("mens_coverage", 'male'), ("womens_coverage", 'female'), ("overall_coverage", None)):
+        criteria = window + ((Meeting.gender_restriction == gender,) if gender else ())
+        total, filled = count(*criteria), count(*criteria, chaired=True)
+        coverage[key] = {"filled": filled, "unfilled": total - filled, "percent": pct(filled, total)}
+    all_total = coverage["overall_coverage"]["filled"] + coverage["overall_coverage"]["unfilled"]
+    weekly = []
+    for week in range(4):
+        span = (Meeting.event_date >= today - timedelta(days=(week + 1) * 7),
+                Meeting.event_date < today - timedelta(days=week * 7))
+        total, filled = count(*span), count(*span, chaired=True)
+        weekly.insert(0, {"week": f"Week {4 - week}", "total": total, "filled": filled, "percent": pct(filled, total)})
+    participation = []
+    for u in User.query.filter_by(is_admin=False).all():
+        n = db.session.query(Meeting).join(ChairSignup).filter(ChairSignup.user_id == u.id).count()
+        if n:
+            participation.append({"name": u.display_name, "count": n, "percent": pct(n, all_total)})
+    participation.sort(key=lambda x: x["count"], reverse=True)
+    stats = {"total_hosts": total_hosts, "current_chairs": current, "future_chairs_needed": future,
+             "chair_completion_percent": pct(current, future), "unfilled_chairs": future - current}
+    return stats, dict(coverage, weekly_trend=weekly, user_participation=participation[:10])
+
+
+def timed(fn, *args):
+    statements = []
+
+    def record(*_):
+        statements.append(1)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    started = _time.perf_counter()
+    try:
+        result = fn(*args)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return _time.perf_counter() - started, len(statements), result
+
+
+def main(user_count, meeting_count):
+    today = date.today()
+    with app.app_context():
+        seed(user_count, meeting_count, today)
+        old_s, old_q, old = timed(old_path, today)
+        new_s, new_q, new = timed(compute_admin_dashboard, db.session, Meeting, ChairSignup, User, today)
+        roll_s, roll_q, rolled = timed(compute_admin_dashboard, db.session, Meeting, ChairSignup, User, today,
+                                       MeetingDailyStat)
+        get_admin_dashboard_stats(today)
+        hit_s, hit_q, _ = timed(get_admin_dashboard_stats, today)
+
+    print(f"{user_count} users / {meeting_count} meetings")
+    print(f"{'path':>12} | {'time':>9} | {'queries':>7}")
+    print("-" * 35)
+    print(f"{'per-count':>12} | {old_s:>8.3f}s | {old_q:>7}")
+    print(f"{'aggregate':>12} | {new_s:>8.3f}s | {new_q:>7}")
+    print(f"{'rollup':>12} | {roll_s:>8.3f}s | {roll_q:>7}")
+    print(f"{'memoized':>12} | {hit_s:>8.4f}s | {hit_q:>7}")
+    print(f"speedup (aggregate): {old_s / max(new_s, 1e-9):.0f}x")
+    # Ties in participation may order differently; compare everything else exactly
+    same = old[0] == new[0] and all(old[1][k] == new[1][k] for k in old[1] if k != "user_participation")
+    print(f"payload matches: {same and rolled == new}")
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args or [5000, 20000]))
@@ -0,0 +1,104 @@
+"""
+Benchmark ICS feed generation: icalendar object model vs. the ics_engine
+fragment renderer (cold, i.e. every fragment rendered, and warm, i.e. every
+fragment served from the per-process cache).
+
+Usage:
+    python tools/benchmark_ics.py            # 500, 5,000 and 50,000 events
+    python tools/benchmark_ics.py 1000 20000 # custom sizes
+"""
+import os
+import sys
+import time as _time
+from datetime import date, datetime, time, timedelta
+
+from icalendar import Calendar, Event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ics_engine  # noqa: E402
+
+PRODID = '-//Back Porch Meetings//backporchmeetings.org//'
+
+
+def make_meetings(count):
+    """Synthetic meeting rows shaped like what the feeds read."""
+    start = date(2030, 1, 1)
+    rows = []
+    for i in range(count):
+        d = start + timedelta(days=i // 2)
+        chaired = i % 3 != 0
+        rows.append({
+            "id": i + 1,
+            "title": "Back Porch Noon Meeting" if i % 2 else "Men's Meeting",
+            "description": "Literature-based meeting; all welcome, cameras optional.",
+            "zoom_link": "https://zoom.us/j/1234567890?pwd=abcdefghijklmnop",
+            "start": datetime.combine(d, time(12, 0) if i % 2 else time(19, 30)),
+            "chair": f"Chair {i % 97} (BP-{1000 + i % 97})" if chaired else "No chair yet",
+        })
+    return rows
+
+
+def old_path(rows):
+    cal = Calendar()
+    cal.add('prodid', PRODID)
+    cal.add('version', '2.0')
+    cal.add('x-wr-calname', 'Back Porch Chairperson Calendar')
+    for r in rows:
+        event = Event()
+        event.add('summary', r["title"])
+        event.add('dtstart', r["start"])
+        event.add('dtend', r["start"] + timedelta(hours=1))
+        event.add('location', r["zoom_link"])
+        event.add('description', f"{r['description']}\n\nChair: {r['chair']}")
+        event.add('url', f"https://backporchmeetings.org/meeting/{r['id']}")
+        event.add('uid', f"meeting-{r['id']}@backporchmeetings.org")
+        cal.add_component(event)
+    return cal.to_ical()
+
+
+def new_path(rows, cache, version):
+    header = ics_engine.calendar_header(PRODID, calname='Back Porch Chairperson Calendar')
+
+    def fragments():
+        for r in rows:
+            yield cache.get_or_render(
+                (r["id"], version, "public"),
+                lambda r=r: ics_engine.render_event(
+                    uid=f"meeting-{r['id']}@backporchmeetings.org",
+                    summary=r["title"],
+                    dtstart=r["start"],
+                    dtend=r["start"] + timedelta(hours=1),
+                    location=r["zoom_link"],
+                    description=f"{r['description']}\n\nChair: {r['chair']}",
+                    url=f"https://backporchmeetings.org/meeting/{r['id']}",
+                ),
+            )
+
+    return ics_engine.render_calendar(header, fragments())
+
+
+def timed(fn, *args):
+    started = _time.perf_counter()
+    result = fn(*args)
+    return _time.perf_counter() - started, result
+
+
+def main(sizes):
+    print(f"{'events':>8} | {'icalendar':>10} | {'engine cold':>11} | {'engine warm':>11} | {'speedup (warm)':>14} | {'bytes':>10}")
+    print("-" * 80)
+    for size in sizes:
+        rows = make_meetings(size)
+        cache = ics_engine.FragmentCache(max_entries=size)
+        old_s, old_bytes = timed(old_path, rows)
+        cold_s, _ = timed(new_path, rows, cache, 1)
+        warm_s, new_bytes = timed(new_path, rows, cache, 1)
+        print(
+            f"{size:>8} | {old_s:>9.3f}s | {cold_s:>10.3f}s | {warm_s:>10.4f}s | "
+            f"{old_s / max(warm_s, 1e-9):>13.0f}x | {len(new_bytes):>10}"
+        )
+
+
+if __name__ == '__main__':
+    sizes = [int(a) for a in sys.argv[1:]] or [500, 5000, 50000]
+    main(sizes)
@@ -5,6 +5,7 @@ This keeps the scheduler running separately from the web process.
 """
 
 import os
+import threading
 from dotenv import load_dotenv
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -13,7 +14,50 @@ from apscheduler.triggers.cron import CronTrigger
 load_dotenv()
 
 # Import after loading env vars
-from app import send_open_slot_reminder, send_day_of_chair_reminders, check_and_send_reminders
+from app import (
+    app, db, drain_email_outbox,
+    send_open_slot_reminder, send_day_of_chair_reminders, check_and_send_reminders, send_meeting_confirmations,
+    reconcile_meeting_daily_stats, refresh_user_service_stats,
+)
+
+
+def run_email_sender(stop=None):
+    """Send queued emails continuously; pauses when the outbox is empty or throttled."""
+    stop = stop or threading.Event()
+    poll = app.config.get("EMAIL_OUTBOX_POLL_SECONDS", 5)
+    while not stop.is_set():
+        with app.app_context():
+            try:
+                result = drain_email_outbox()
+            except Exception as e:
+                print(f"❌ Email outbox drain failed: {e}")
+                result = {"sent": 0, "failed": 0, "dead": 0, "wait": poll}
+            finally:
+                db.session.remove()
+        if result["sent"] or result["failed"] or result["dead"]:
+            print(f"📧 Outbox: {result['sent']} sent, {result['failed']} to retry, {result['dead']} dead-lettered")
+        stop.wait(result["wait"] or poll)
+
+
+def run_open_slot_broadcast():
+    """Weekly open-slot email, with the run's numbers in the worker log."""
+    with app.app_context():
+        run = send_open_slot_reminder()
+        if run is not None:
+            print(f"📣 Open slots: {run.sent} queued for {run.recipients} chairs "
+                  f"({run.failed} failed, {run.skipped} with nothing eligible) in {run.duration_ms} ms")
+
+
+def run_notification_scan():
+    """Send due chair reminders and missed confirmations; the ledger makes reruns free."""
+    with app.app_context():
+        try:
+            sent = check_and_send_reminders() + send_meeting_confirmations()
+            if sent:
+                print(f"⏰ Sent {sent} chair reminders/confirmations")
+        finally:
+            db.session.remove()
+
 
 def run_scheduler():
     """Run the background scheduler for email reminders."""
@@ -21,7 +65,7 @@ def run_scheduler():
 
     # Schedule weekly open slots reminder (every Sunday at 10 AM)
     scheduler.add_job(
-        send_open_slot_reminder,
+        run_open_slot_broadcast,
         CronTrigger(day_of_week='sun', hour=10),
         id='weekly-open-slots',
         replace_existing=True
@@ -35,18 +79,36 @@ def run_scheduler():
         replace_existing=True
     )
     
-    # Schedule 24-hour and 1-hour reminders (check every hour)
+    # 24-hour and 1-hour reminders plus missed confirmations (every 5 minutes)
+    scheduler.add_job(
+        run_notification_scan,
+        CronTrigger(minute='*/5'),
+        id='meeting-reminders',
+        replace_existing=True
+    )
+
+    # Rebuild the meeting_daily_stats rollup nightly to repair any drift
+    scheduler.add_job(
+        reconcile_meeting_daily_stats,
+        CronTrigger(hour=2, minute=30),
+        id='nightly-daily-stats-reconcile',
+        replace_existing=True
+    )
+
+    # Roll per-user past/future service totals over at Eastern midnight
     scheduler.add_job(
-        check_and_send_reminders,
-        CronTrigger(minute=0),  # Run at the top of every hour
-        id='hourly-meeting-reminders',
+        refresh_user_service_stats,
+        CronTrigger(hour=0, minute=5, timezone='America/New_York'),
+        id='nightly-service-stats',
         replace_existing=True
     )
 
     print("🚀 Starting Back Porch Chair Portal scheduler...")
     print("📅 Weekly reminders scheduled for Sundays at 10 AM")
     print("📧 Day-of chair reminders scheduled daily at 6 AM")
-    print("⏰ Meeting reminders scheduled hourly (24h and 1h before)")
+    print("⏰ Meeting reminders checked every 5 minutes (24h and 1h before)")
+    print("📊 Meeting stats rollup reconciled nightly at 2:30 AM")
+    print("🪑 Chair service totals rolled over nightly at 12:05 AM Eastern")
     print("💡 Individual chair reminders scheduled dynamically when signups occur")
 
     try:
@@ -55,4 +117,9 @@ def run_scheduler():
         scheduler.shutdown()
 
 if __name__ == '__main__':
+    if app.config.get("EMAIL_OUTBOX_ENABLED", True):
+        senders = max(1, app.config.get("EMAIL_OUTBOX_SENDERS", 2))
+        for n in range(senders):
+            threading.Thread(target=run_email_sender, name=f"email-sender-{n + 1}", daemon=True).start()
+        print(f"📬 Email outbox senders running: {senders}")
     run_scheduler()
\ No newline at end of file